@@ -29,6 +29,7 @@ try:
     from .operators import playback
     from .utils import handlers
     from .utils import graphics
+    from .utils import precompute
 except ImportError as e:
     print(f"\n[ShapingRecorder] IMPORT ERROR: {e}")
     print(traceback.format_exc())
@@ -46,12 +47,15 @@ classes = (
     operators.StopPlayingOperator,
     operators.DeleteStepOperator,
     operators.RestoreStepOperator,
+    operators.CompactStepsOperator,
     operators.ResetStepViewOperator,
     operators.ConfirmStepViewOperator,
     operators.PlayUnifiedOperator,
     operators.RecordUnifiedOperator,
+    operators.BatchExportOperator,
     operators.SetStartStepOperator,
     operators.SetEndStepOperator,
+    operators.ScrubRecorderOperator,
     operators.ToggleChangedEdgesOperator,
     operators.MarkEdgeOperator,
     operators.ConfirmEdgeOperator,
@@ -78,6 +82,11 @@ def register():
 
     if handlers.load_post_handler not in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.append(handlers.load_post_handler)
+    if handlers.save_pre_handler not in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.append(handlers.save_pre_handler)
+    for handler_list in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if handlers.undo_post_handler not in handler_list:
+            handler_list.append(handlers.undo_post_handler)
     if handlers.depsgraph_update_handler not in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.append(handlers.depsgraph_update_handler)
 
@@ -88,6 +97,7 @@ def register():
 def unregister():
     operators.stop_playing()
     recording.unlock_other_objects()
+    precompute.shutdown()
 
     if state._edge_draw_handler:
         bpy.types.SpaceView3D.draw_handler_remove(state._edge_draw_handler, 'WINDOW')
@@ -97,6 +107,11 @@ def unregister():
         bpy.app.handlers.depsgraph_update_post.remove(handlers.depsgraph_update_handler)
     if handlers.load_post_handler in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(handlers.load_post_handler)
+    if handlers.save_pre_handler in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.remove(handlers.save_pre_handler)
+    for handler_list in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if handlers.undo_post_handler in handler_list:
+            handler_list.remove(handlers.undo_post_handler)
 
     if hasattr(bpy.types.Scene, "mesh_recorder_settings"):
         del bpy.types.Scene.mesh_recorder_settings
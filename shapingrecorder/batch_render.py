@@ -0,0 +1,33 @@
+# Headless frame export for ShapingRecorder
+#
+# Renders a saved recording without the UI, e.g. on a render node:
+#   blender -b scene.blend --python <add-on dir>/batch_render.py -- \
+#       [--object Cube] [--mode start|active|range] [--frames 0-299] [--output //frames/] [--prefix frame]
+#
+# The add-on must be enabled in the preferences Blender starts with.
+
+import importlib
+import sys
+
+import bpy
+
+
+def _addon_module():
+    for name in bpy.context.preferences.addons.keys():
+        if name.rsplit(".", 1)[-1] == "shapingrecorder":
+            return importlib.import_module(name)
+    return None
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    addon = _addon_module()
+    if addon is None:
+        print("ShapingRecorder add-on is not enabled")
+        return 1
+    batch = importlib.import_module(f"{addon.__name__}.operators.batch")
+    return batch.run_cli(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+# Playback clock for ShapingRecorder
+
+import time
+
+REALTIME = "REALTIME"
+FIXED = "FIXED"
+
+
+class PlaybackClock:
+    """
+    Source of playback time for timer-driven playback.
+
+    REALTIME follows time.perf_counter(): each tick returns the wall-clock
+    time since the previous tick, so a slow frame makes the next sample
+    jump ahead (the frames in between are dropped) instead of stretching
+    the whole playback.
+
+    FIXED advances exactly frame_time per tick regardless of how long the
+    tick took, so a step of duration d always yields the same number of
+    frames. Frame export uses this mode.
+    """
+
+    def __init__(self, mode, frame_time):
+        self.mode = mode
+        self.frame_time = max(frame_time, 1e-4)
+        self.frames = 0
+        self.dropped = 0
+        self._start = None
+        self._last = None
+
+    @property
+    def realtime(self):
+        return self.mode == REALTIME
+
+    def start(self):
+        self.frames = 0
+        self.dropped = 0
+        self._start = time.perf_counter()
+        self._last = self._start
+
+    def tick(self):
+        """Register one produced frame and return the playback time it advances by"""
+        if self._start is None:
+            self.start()
+        self.frames += 1
+        if not self.realtime:
+            return self.frame_time
+
+        now = time.perf_counter()
+        dt = now - self._last
+        self._last = now
+        # 落后超过一帧时，中间的帧记为丢弃
+        missed = int(dt / self.frame_time) - 1
+        if missed > 0:
+            self.dropped += missed
+        return dt
+
+    def next_interval(self):
+        """Delay until the next frame is due, for bpy.app.timers"""
+        if not self.realtime or self._start is None:
+            return self.frame_time
+        due = self._start + (self.frames + self.dropped + 1) * self.frame_time
+        return max(0.0, due - time.perf_counter())
+
+    def stats(self):
+        """Frames produced, frames dropped and achieved FPS since start()"""
+        elapsed = (time.perf_counter() - self._start) if self._start is not None else 0.0
+        return {
+            "mode": self.mode,
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "elapsed": elapsed,
+            "fps": self.frames / elapsed if elapsed > 0.0 else 0.0,
+        }
@@ -0,0 +1,102 @@
+# Step coalescing for noisy recordings
+#
+# Runs of consecutive steps with unchanged topology whose combined vertex
+# movement stays below a threshold are merged into their last step. The
+# scan works on the stored deltas, so its cost follows the number of
+# changed vertices rather than steps times mesh size.
+
+import numpy as np
+
+
+def _same_topology(a, b):
+    return all(np.array_equal(x, y) for x, y in zip(a, b))
+
+
+def plan_compaction(initial_mesh, history, threshold, keep=()):
+    """
+    Return the indices of the steps that remain after merging.
+
+    A group starts after a kept step and grows while the topology is
+    unchanged and no vertex has moved further than threshold from where
+    it was at the group start; it is then closed at its last step. Steps
+    in keep (view changes, custom timing, marks) always close a group.
+    """
+    keep = set(keep)
+    coords = initial_mesh.coords.astype(np.float32, copy=True)
+    anchor = coords.copy()
+    topology = (initial_mesh.edges, initial_mesh.face_offsets, initial_mesh.face_indices)
+    kept = []
+    pending = None
+    touched = []
+    group_max = 0.0
+
+    def close():
+        nonlocal pending, group_max
+        if pending is not None:
+            kept.append(pending)
+        if touched:
+            moved = np.concatenate(touched)
+            anchor[moved] = coords[moved]
+            touched.clear()
+        pending = None
+        group_max = 0.0
+
+    for i, (changed, values, step_topology, _) in enumerate(history.iter_changes()):
+        if changed is None and (len(values) != len(coords) or not _same_topology(step_topology, topology)):
+            # 顶点数或拓扑变化：整步重建，必须保留
+            close()
+            coords = values.astype(np.float32, copy=True)
+            anchor = coords.copy()
+            topology = step_topology
+            kept.append(i)
+            continue
+        if changed is None:
+            changed = np.flatnonzero((values != coords).any(axis=1))
+            values = values[changed]
+        if step_topology is not None and not _same_topology(step_topology, topology):
+            close()
+            coords[changed] = values
+            anchor = coords.copy()
+            topology = step_topology
+            kept.append(i)
+            continue
+
+        moved = float(np.linalg.norm(values - anchor[changed], axis=1).max()) if len(changed) else 0.0
+        if max(group_max, moved) > threshold and pending is not None:
+            close()
+            moved = float(np.linalg.norm(values - anchor[changed], axis=1).max()) if len(changed) else 0.0
+        coords[changed] = values
+        touched.append(changed)
+        group_max = max(group_max, moved)
+        pending = i
+        if i in keep or group_max > threshold:
+            close()
+
+    close()
+    return kept
+
+
+def plan_compaction_limited(initial_mesh, history, relative_threshold, keep=(), max_steps=0):
+    """
+    plan_compaction with the threshold given as a fraction of the model
+    size (bounding box diagonal) and an optional step ceiling: while more
+    than max_steps steps would remain, the threshold is doubled, up to the
+    model size. Returns (kept indices, absolute threshold used).
+    """
+    coords = initial_mesh.coords
+    size = float(np.linalg.norm(np.ptp(coords, axis=0))) if len(coords) else 1.0
+    threshold = relative_threshold * size
+    kept = plan_compaction(initial_mesh, history, threshold, keep)
+    while max_steps and len(kept) > max_steps and threshold < size:
+        threshold = min(max(threshold * 2.0, 1e-6), size)
+        kept = plan_compaction(initial_mesh, history, threshold, keep)
+    return kept, threshold
+
+
+def remap_step_timing(timing, kept):
+    """
+    Carry per-step settings over to the compacted history: timing holds
+    the initial state's entry followed by one per step, kept the surviving
+    step indices. Steps without an entry get an empty dict (defaults).
+    """
+    return timing[:1] + [timing[i + 1] if i + 1 < len(timing) else {} for i in kept]
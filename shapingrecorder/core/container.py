@@ -0,0 +1,108 @@
+# Versioned binary container for ShapingRecorder data
+#
+# Layout (all little-endian):
+#   header      magic "SHRC", u16 version, u16 flags, u32 meta size, u32 chunk count
+#   meta        UTF-8 JSON with everything that is not a bulk array
+#   chunk table per chunk: u64 offset, u32 stored size, u32 raw size
+#   chunks      packed arrays, each optionally zlib-compressed
+
+import json
+import struct
+import zlib
+
+import numpy as np
+
+MAGIC = b"SHRC"
+VERSION = 1
+FLAG_ZLIB = 1
+
+_HEADER = struct.Struct("<4sHHII")
+_CHUNK = struct.Struct("<QII")
+_ARRAY = struct.Struct("<cxxxI")
+
+_DTYPES = {b"f": np.dtype("<f4"), b"i": np.dtype("<i4")}
+
+
+class ContainerError(Exception):
+    pass
+
+
+def pack_arrays(arrays):
+    """Pack a sequence of float32/int32 arrays (or None) into one chunk"""
+    parts = [struct.pack("<I", len(arrays))]
+    for arr in arrays:
+        if arr is None:
+            parts.append(_ARRAY.pack(b"n", 0))
+            continue
+        code = b"f" if arr.dtype.kind == "f" else b"i"
+        data = np.ascontiguousarray(arr, dtype=_DTYPES[code])
+        parts.append(_ARRAY.pack(code, data.size))
+        parts.append(data.tobytes())
+    return b"".join(parts)
+
+
+def unpack_arrays(buf):
+    """Inverse of pack_arrays; returns flat read-only arrays (or None)"""
+    view = memoryview(buf)
+    (count,) = struct.unpack_from("<I", view, 0)
+    pos = 4
+    arrays = []
+    for _ in range(count):
+        code, size = _ARRAY.unpack_from(view, pos)
+        pos += _ARRAY.size
+        if code == b"n":
+            arrays.append(None)
+            continue
+        dtype = _DTYPES[code]
+        arrays.append(np.frombuffer(view, dtype=dtype, count=size, offset=pos))
+        pos += size * dtype.itemsize
+    return arrays
+
+
+def pack(meta, chunks, compress=True):
+    """Build a container from a JSON-able meta dict and raw chunk bytes"""
+    meta_bytes = json.dumps(meta).encode("utf-8")
+    stored = [zlib.compress(c, 1) if compress else c for c in chunks]
+
+    offset = _HEADER.size + len(meta_bytes) + _CHUNK.size * len(stored)
+    table = []
+    for raw, data in zip(chunks, stored):
+        table.append(_CHUNK.pack(offset, len(data), len(raw)))
+        offset += len(data)
+
+    flags = FLAG_ZLIB if compress else 0
+    header = _HEADER.pack(MAGIC, VERSION, flags, len(meta_bytes), len(stored))
+    return b"".join([header, meta_bytes] + table + stored)
+
+
+class Container:
+    """Read side of a container; chunks are only decompressed when read"""
+
+    def __init__(self, blob):
+        if len(blob) < _HEADER.size:
+            raise ContainerError("truncated header")
+        magic, version, flags, meta_size, count = _HEADER.unpack_from(blob, 0)
+        if magic != MAGIC:
+            raise ContainerError("not a ShapingRecorder container")
+        if version > VERSION:
+            raise ContainerError(f"unsupported container version {version}")
+        self.version = version
+        self.compressed = bool(flags & FLAG_ZLIB)
+        self._blob = memoryview(blob)
+        pos = _HEADER.size
+        self.meta = json.loads(bytes(self._blob[pos:pos + meta_size]).decode("utf-8"))
+        pos += meta_size
+        self._table = [_CHUNK.unpack_from(blob, pos + i * _CHUNK.size) for i in range(count)]
+
+    def __len__(self):
+        return len(self._table)
+
+    def chunk(self, index):
+        offset, size, raw_size = self._table[index]
+        data = self._blob[offset:offset + size]
+        if self.compressed:
+            return zlib.decompress(data, bufsize=max(raw_size, 1))
+        return data
+
+    def arrays(self, index):
+        return unpack_arrays(self.chunk(index))
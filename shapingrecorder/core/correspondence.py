@@ -0,0 +1,250 @@
+# Batched vertex correspondence for topology-changing steps
+
+import numpy as np
+from mathutils import kdtree
+
+_KEY_BITS = 21
+_KEY_OFFSET = 1 << (_KEY_BITS - 1)
+_KEY_MAX = (1 << _KEY_BITS) - 1
+_NEIGHBOR_OFFSETS = np.array(
+    [(x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)], dtype=np.int64
+)
+_QUERY_CHUNK = 32768
+_MAX_TRIANGLE_CELLS = 27
+
+
+def _cell_keys(cells):
+    c = np.clip(cells + _KEY_OFFSET, 0, _KEY_MAX)
+    return (c[:, 0] << (2 * _KEY_BITS)) | (c[:, 1] << _KEY_BITS) | c[:, 2]
+
+
+def _expand_ranges(start, end):
+    """Turn per-row [start, end) ranges into flat (row, position) pairs"""
+    counts = end - start
+    rows = np.repeat(np.arange(len(start)), counts)
+    first = np.repeat(np.cumsum(counts) - counts, counts)
+    positions = np.repeat(start, counts) + (np.arange(len(rows)) - first)
+    return rows, positions
+
+
+def _first_per_row(rows, values):
+    """Return (row, index into pairs) of the smallest value for each row"""
+    order = np.lexsort((values, rows))
+    sorted_rows = rows[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = sorted_rows[1:] != sorted_rows[:-1]
+    return sorted_rows[first], order[first]
+
+
+def triangulate(face_offsets, face_indices):
+    """Fan-triangulate a CSR face layout into an (t, 3) index array"""
+    sizes = np.diff(face_offsets)
+    n_tris = np.maximum(sizes - 2, 0)
+    face_of_tri = np.repeat(np.arange(len(sizes)), n_tris)
+    first_tri = np.repeat(np.cumsum(n_tris) - n_tris, n_tris)
+    j = np.arange(len(face_of_tri)) - first_tri + 1
+    base = face_offsets[:-1][face_of_tri]
+    return np.stack(
+        (face_indices[base], face_indices[base + j], face_indices[base + j + 1]), axis=1
+    )
+
+
+def closest_points_on_triangles(p, a, b, c):
+    """Closest point on each triangle (a, b, c) to p, all (k, 3) arrays"""
+    ab = b - a
+    ac = c - a
+    ap = p - a
+    bp = p - b
+    cp = p - c
+    d1 = np.einsum("ij,ij->i", ab, ap)
+    d2 = np.einsum("ij,ij->i", ac, ap)
+    d3 = np.einsum("ij,ij->i", ab, bp)
+    d4 = np.einsum("ij,ij->i", ac, bp)
+    d5 = np.einsum("ij,ij->i", ab, cp)
+    d6 = np.einsum("ij,ij->i", ac, cp)
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denom = va + vb + vc
+        result = a + ab * (vb / denom)[:, None] + ac * (vc / denom)[:, None]
+        # Voronoi regions, applied from lowest to highest priority
+        e43 = d4 - d3
+        e56 = d5 - d6
+        mask = (va <= 0) & (e43 >= 0) & (e56 >= 0)
+        result[mask] = (b + (c - b) * (e43 / (e43 + e56))[:, None])[mask]
+        mask = (vb <= 0) & (d2 >= 0) & (d6 <= 0)
+        result[mask] = (a + ac * (d2 / (d2 - d6))[:, None])[mask]
+        mask = (d6 >= 0) & (d5 <= d6)
+        result[mask] = c[mask]
+        mask = (vc <= 0) & (d1 >= 0) & (d3 <= 0)
+        result[mask] = (a + ab * (d1 / (d1 - d3))[:, None])[mask]
+        mask = (d3 >= 0) & (d4 <= d3)
+        result[mask] = b[mask]
+        mask = (d1 <= 0) & (d2 <= 0)
+        result[mask] = a[mask]
+    return result
+
+
+class _PointGrid:
+    """Uniform grid over points, sorted by cell key for searchsorted lookups"""
+
+    def __init__(self, points, origin, cell):
+        self.points = points
+        self.origin = origin
+        self.cell = cell
+        keys = _cell_keys(self.cells(points))
+        self.order = np.argsort(keys, kind="stable")
+        self.keys = keys[self.order]
+
+    def cells(self, points):
+        return np.floor((points - self.origin) / self.cell).astype(np.int64)
+
+    def nearest(self, queries):
+        """
+        Exact nearest point for queries that have one within one cell size.
+        Returns (index, squared distance); index is -1 where none was found.
+        """
+        n = len(queries)
+        best_idx = np.full(n, -1, dtype=np.int64)
+        best_d2 = np.full(n, np.inf)
+        for lo in range(0, n, _QUERY_CHUNK):
+            q = queries[lo:lo + _QUERY_CHUNK]
+            qcells = self.cells(q)
+            cells = (qcells[:, None, :] + _NEIGHBOR_OFFSETS[None, :, :]).reshape(-1, 3)
+            keys = _cell_keys(cells)
+            start = np.searchsorted(self.keys, keys, "left")
+            end = np.searchsorted(self.keys, keys, "right")
+            rows, pos = _expand_ranges(start, end)
+            if not len(rows):
+                continue
+            rows //= len(_NEIGHBOR_OFFSETS)
+            cand = self.order[pos]
+            diff = self.points[cand] - q[rows]
+            d2 = np.einsum("ij,ij->i", diff, diff)
+            hit_rows, hit = _first_per_row(rows, d2)
+            best_idx[lo + hit_rows] = cand[hit]
+            best_d2[lo + hit_rows] = d2[hit]
+        # 只有一个网格尺寸以内的结果保证是最近点
+        best_idx[best_d2 > self.cell * self.cell] = -1
+        return best_idx, best_d2
+
+
+def _nearest_vertices(points, queries, cell):
+    origin = points.min(axis=0)
+    grid = _PointGrid(points, origin, cell)
+    idx, d2 = grid.nearest(queries)
+
+    missing = np.flatnonzero(idx < 0)
+    if len(missing):
+        # 离源网格较远的点（如长距离挤出）回退到 KDTree
+        kd = kdtree.KDTree(len(points))
+        for i, co in enumerate(points.tolist()):
+            kd.insert(co, i)
+        kd.balance()
+        for q in missing.tolist():
+            _, i, dist = kd.find(queries[q].tolist())
+            idx[q] = i
+            d2[q] = dist * dist
+    return idx, np.sqrt(d2)
+
+
+def _nearest_surface(points, tris, queries, epsilon):
+    """
+    Closest surface point for queries lying within epsilon of a triangle.
+    Returns (locations, distances); distances are inf elsewhere.
+    """
+    n = len(queries)
+    loc = np.zeros((n, 3), dtype=np.float64)
+    dist = np.full(n, np.inf)
+    if not len(tris) or not n:
+        return loc, dist
+
+    a = points[tris[:, 0]]
+    b = points[tris[:, 1]]
+    c = points[tris[:, 2]]
+    tmin = np.minimum(np.minimum(a, b), c) - epsilon
+    tmax = np.maximum(np.maximum(a, b), c) + epsilon
+    extent = float(np.median((tmax - tmin).max(axis=1)))
+    cell = max(extent, epsilon * 4.0)
+    origin = tmin.min(axis=0)
+
+    cmin = np.floor((tmin - origin) / cell).astype(np.int64)
+    cmax = np.floor((tmax - origin) / cell).astype(np.int64)
+    span = cmax - cmin + 1
+    n_cells = span.prod(axis=1)
+    small = np.flatnonzero(n_cells <= _MAX_TRIANGLE_CELLS)
+    large = np.flatnonzero(n_cells > _MAX_TRIANGLE_CELLS)
+
+    def _test(q_idx, t_idx):
+        p = queries[q_idx]
+        closest = closest_points_on_triangles(p, a[t_idx], b[t_idx], c[t_idx])
+        diff = closest - p
+        d = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+        d[np.isnan(d)] = np.inf
+        rows, hit = _first_per_row(q_idx, d)
+        better = d[hit] < dist[rows]
+        rows = rows[better]
+        hit = hit[better]
+        dist[rows] = d[hit]
+        loc[rows] = closest[hit]
+
+    # 每个三角形登记到其（扩展 epsilon 后的）包围盒覆盖的所有网格
+    tri_of = np.repeat(small, n_cells[small])
+    k = np.arange(len(tri_of)) - np.repeat(np.cumsum(n_cells[small]) - n_cells[small], n_cells[small])
+    sx = span[tri_of, 0]
+    sy = span[tri_of, 1]
+    offs = np.stack((k % sx, (k // sx) % sy, k // (sx * sy)), axis=1)
+    keys = _cell_keys(cmin[tri_of] + offs)
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    tri_of = tri_of[order]
+
+    for lo in range(0, n, _QUERY_CHUNK):
+        q = np.arange(lo, min(lo + _QUERY_CHUNK, n))
+        qkeys = _cell_keys(np.floor((queries[q] - origin) / cell).astype(np.int64))
+        start = np.searchsorted(keys, qkeys, "left")
+        end = np.searchsorted(keys, qkeys, "right")
+        rows, pos = _expand_ranges(start, end)
+        if len(rows):
+            _test(q[rows], tri_of[pos])
+        for t in large.tolist():
+            _test(q, np.full(len(q), t))
+    return loc, dist
+
+
+def hybrid_sources(source_state, target_state, snap_threshold, surface_epsilon):
+    """
+    Start location of every target vertex for a topology-changing step.
+
+    Same priority rules as the per-vertex BVH/KDTree loop it replaces:
+    snap to the nearest source vertex when it is within snap_threshold,
+    else to the source surface when the vertex lies on it, else to the
+    nearest source vertex.
+    """
+    points = source_state.coords.astype(np.float64)
+    queries = target_state.coords.astype(np.float64)
+    if not len(points):
+        return target_state.coords.copy()
+
+    if source_state.n_edges:
+        e = points[source_state.edges[:, 0]] - points[source_state.edges[:, 1]]
+        cell = float(np.sqrt(np.einsum("ij,ij->i", e, e)).mean())
+    else:
+        cell = 0.0
+    if cell <= 1e-9:
+        extent = float(np.linalg.norm(points.max(axis=0) - points.min(axis=0)))
+        cell = max(extent / max(len(points), 1) ** (1.0 / 3.0), 1e-6)
+
+    vert_idx, vert_dist = _nearest_vertices(points, queries, cell)
+    sources = points[vert_idx]
+
+    off_vertex = np.flatnonzero(vert_dist >= snap_threshold)
+    if len(off_vertex) and source_state.n_faces:
+        tris = triangulate(source_state.face_offsets, source_state.face_indices)
+        surf_loc, surf_dist = _nearest_surface(points, tris, queries[off_vertex], surface_epsilon)
+        on_surface = surf_dist < surface_epsilon
+        sources[off_vertex[on_surface]] = surf_loc[on_surface]
+
+    return sources.astype(np.float32)
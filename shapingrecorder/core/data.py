@@ -1,5 +1,7 @@
 # Data serialization and deserialization functions for ShapingRecorder
 
+from .mesh_state import MeshState
+
 def serialize_view(view):
     """Serialize view state for storage"""
     if not view:
@@ -51,12 +53,12 @@ def serialize_state(state):
     if not state:
         return None
     return {
-        "verts": [[v.x, v.y, v.z] for v in state["verts"]],
-        "edges": state["edges"],
-        "faces": state["faces"],
-        "hash": state.get("hash"),
-        "view": serialize_view(state.get("view")),
-        "camera": serialize_camera(state.get("camera")),
+        "verts": state.coords.tolist(),
+        "edges": state.edges.tolist(),
+        "faces": list(state.iter_faces()),
+        "hash": state.hash,
+        "view": serialize_view(state.view),
+        "camera": serialize_camera(state.camera),
     }
 
 
@@ -64,12 +66,11 @@ def deserialize_state(data):
     """Deserialize mesh state from storage"""
     if not data:
         return None
-    from mathutils import Vector
-    return {
-        "verts": [Vector(v) for v in data["verts"]],
-        "edges": [tuple(e) for e in data["edges"]],
-        "faces": [tuple(f) for f in data["faces"]],
-        "hash": data.get("hash"),
-        "view": deserialize_view(data.get("view")),
-        "camera": deserialize_camera(data.get("camera")),
-    }
\ No newline at end of file
+    return MeshState.from_lists(
+        data["verts"],
+        data["edges"],
+        data["faces"],
+        hash=data.get("hash"),
+        view=deserialize_view(data.get("view")),
+        camera=deserialize_camera(data.get("camera")),
+    )
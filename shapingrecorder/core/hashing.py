@@ -0,0 +1,125 @@
+# Change-detection hashing for ShapingRecorder
+
+import hashlib
+
+import numpy as np
+
+# Coordinates are quantized to 1e-4 before hashing, like round(co, 4) did,
+# so float noise from undo/redo round-trips still yields the same hash.
+HASH_SCALE = 1e4
+HASH_DIGEST_SIZE = 8
+HASH_BLOCK_SIZE = 4096  # vertices per block
+
+
+def read_coords(obj):
+    """Bulk-read vertex coordinates into a flat float32 buffer"""
+    mesh = obj.data
+    if obj.mode == "EDIT":
+        # 把编辑网格写回 mesh 数据块，foreach_get 才能读到最新坐标。
+        # 写回本身是 O(网格)，录制定时器只在依赖图报告改动后才调用这里
+        obj.update_from_editmode()
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    return coords
+
+
+def quantize_coords(coords):
+    """Quantize coordinates to integer grid steps in a single vectorized op"""
+    return np.rint(np.multiply(coords, HASH_SCALE, dtype=np.float64)).astype(np.int64)
+
+
+def _block_digest(coords):
+    h = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+    h.update(np.ascontiguousarray(quantize_coords(coords)))
+    return h.digest()
+
+
+def _root_hash(digests, vert_count, edge_count):
+    h = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+    h.update(b"".join(digests))
+    h.update(int(vert_count).to_bytes(8, "little"))
+    h.update(int(edge_count).to_bytes(8, "little"))
+    return int.from_bytes(h.digest(), "little")
+
+
+class BlockHasher:
+    """
+    Merkle-style mesh hash over fixed vertex blocks.
+
+    Each block of HASH_BLOCK_SIZE vertices keeps its own digest and the root
+    combines them. On update only blocks whose raw bytes differ from the
+    previous read are quantized and rehashed, so an update of an unchanged
+    mesh costs one bulk read plus one vectorized compare. The recording
+    timer only calls update() after the depsgraph reported a change to the
+    mesh; an idle tick reuses root and costs a flag check.
+    """
+
+    def __init__(self, block_size=HASH_BLOCK_SIZE):
+        self.block_size = block_size
+        self.root = None
+        self.dirty_blocks = []
+        self._coords = None
+        self._digests = []
+        self._edge_count = -1
+        self._pending_dirty = set()
+        self._pending_full = True
+
+    @property
+    def coords(self):
+        """Coordinate buffer of the most recent read"""
+        return self._coords
+
+    def update(self, obj):
+        """Read obj's mesh and return the updated root hash"""
+        return self.update_from_coords(read_coords(obj), len(obj.data.edges))
+
+    def update_from_coords(self, coords, edge_count):
+        stride = self.block_size * 3
+        n_blocks = (len(coords) + stride - 1) // stride
+
+        if self._coords is None or len(self._coords) != len(coords):
+            dirty = range(n_blocks)
+            self._digests = [b""] * n_blocks
+            self._pending_full = True
+        else:
+            diff = coords != self._coords
+            if n_blocks and diff.any():
+                starts = np.arange(0, len(coords), stride)
+                dirty = np.flatnonzero(np.logical_or.reduceat(diff, starts)).tolist()
+            else:
+                dirty = []
+            if not dirty and edge_count == self._edge_count:
+                self.dirty_blocks = []
+                return self.root
+
+        for b in dirty:
+            self._digests[b] = _block_digest(coords[b * stride:(b + 1) * stride])
+
+        self.dirty_blocks = list(dirty)
+        self._pending_dirty.update(self.dirty_blocks)
+        self._coords = coords
+        self._edge_count = edge_count
+        self.root = _root_hash(self._digests, len(coords) // 3, edge_count)
+        return self.root
+
+    def take_dirty_ranges(self):
+        """
+        Return vertex ranges changed since the previous call, as a list of
+        (start, end) pairs, or None when the vertex count changed in between.
+        """
+        if self._pending_full:
+            ranges = None
+        else:
+            n_verts = len(self._coords) // 3 if self._coords is not None else 0
+            ranges = [
+                (b * self.block_size, min((b + 1) * self.block_size, n_verts))
+                for b in sorted(self._pending_dirty)
+            ]
+        self._pending_dirty = set()
+        self._pending_full = False
+        return ranges
+
+
+def compute_mesh_hash(obj):
+    """Calculate hash of mesh geometry for change detection"""
+    return BlockHasher().update(obj)
@@ -1,57 +1,104 @@
 # Mesh operations and utilities for ShapingRecorder
 
-import bmesh
-from array import array
-from mathutils import kdtree, Vector
-from mathutils.bvhtree import BVHTree
+import numpy as np
+
+from .correspondence import hybrid_sources
+from .hashing import compute_mesh_hash, read_coords
+from .mesh_state import MeshState
 
 def get_mesh_hash(obj):
     """Calculate hash of mesh geometry for change detection"""
     # 如果传入的是 Evaluated Object，直接读取 data
-    mesh = obj.data
+    # 对于 Dyntopo，必须确保传入的是 evaluated_obj
+    return compute_mesh_hash(obj)
 
-    if obj.mode == "EDIT":
-        bm = bmesh.from_edit_mesh(mesh)
-        verts = tuple(
-            (round(v.co.x, 4), round(v.co.y, 4), round(v.co.z, 4)) for v in bm.verts
-        )
-        edges = len(bm.edges)
-    else:
-        # Object/Sculpt 模式下直接读取 mesh 数据块
-        # 对于 Dyntopo，必须确保传入的是 evaluated_obj
-        coords = [0.0] * (len(mesh.vertices) * 3)
-        mesh.vertices.foreach_get("co", coords)
-        verts = tuple(round(c, 4) for c in coords)
-        edges = len(mesh.edges)
-    return hash((verts, edges))
 
+def save_mesh_state(obj, coords=None):
+    """
+    Save current mesh state (vertices, edges, faces).
 
-def save_mesh_state(obj):
-    """Save current mesh state (vertices, edges, faces)"""
+    coords may pass a buffer already read this tick (e.g. by the block
+    hasher) to skip a second read of the vertex coordinates.
+    """
     mesh = obj.data
+    if coords is None:
+        coords = read_coords(obj)
 
-    if obj.mode == "EDIT":
-        bm = bmesh.from_edit_mesh(mesh)
-        verts = [v.co.copy() for v in bm.verts]
-        edges = [(e.verts[0].index, e.verts[1].index) for e in bm.edges]
-        faces = [tuple(v.index for v in f.verts) for f in bm.faces]
-    else:
-        verts = [v.co.copy() for v in mesh.vertices]
-        edges = [(e.vertices[0], e.vertices[1]) for e in mesh.edges]
-        faces = [tuple(f.vertices) for f in mesh.polygons]
-    return {"verts": verts, "edges": edges, "faces": faces}
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+
+    # 4.x 中面的 loop 连续存放，loop_start 即 CSR 偏移
+    face_offsets = np.empty(len(mesh.polygons) + 1, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", face_offsets[:-1])
+    face_offsets[-1] = len(mesh.loops)
+    face_indices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", face_indices)
 
+    return MeshState(coords.reshape(-1, 3), edges.reshape(-1, 2), face_offsets, face_indices)
 
-def update_mesh_vertices(mesh, verts):
-    """Update mesh vertices with new positions"""
-    if len(mesh.vertices) != len(verts):
+
+def update_mesh_vertices(mesh, coords):
+    """
+    Update mesh vertices with new positions.
+    A contiguous float32 (n, 3) buffer is passed to foreach_set without a copy.
+    """
+    if len(mesh.vertices) != len(coords):
         return False
-    coords = array("f", (c for v in verts for c in v))
-    mesh.vertices.foreach_set("co", coords)
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(coords, dtype=np.float32).reshape(-1))
     mesh.update()
     return True
 
 
+def fill_mesh(mesh, s):
+    """
+    Replace the geometry of a mesh datablock with a state in bulk:
+    element counts are added once and every attribute is written with
+    foreach_set from the flat state arrays (no bmesh, no per-element calls).
+    Returns True when validate() had to remove invalid geometry, in which
+    case the mesh no longer has the state's topology.
+    """
+    mesh.clear_geometry()
+    mesh.vertices.add(s.n_verts)
+    mesh.edges.add(s.n_edges)
+    mesh.loops.add(len(s.face_indices))
+    mesh.polygons.add(s.n_faces)
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(s.coords, dtype=np.float32).reshape(-1))
+    mesh.edges.foreach_set("vertices", np.ascontiguousarray(s.edges, dtype=np.int32).reshape(-1))
+    mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(s.face_indices, dtype=np.int32))
+    mesh.polygons.foreach_set("loop_start", np.ascontiguousarray(s.face_offsets[:-1], dtype=np.int32))
+    mesh.update()
+    # 旧数据中可能有重复或越界的面，validate 会将其移除
+    return mesh.validate(clean_customdata=False)
+
+
+def mesh_matches_topology(mesh, s):
+    """Cheap check that a mesh has the element counts of a state"""
+    return (
+        len(mesh.vertices) == s.n_verts
+        and len(mesh.edges) == s.n_edges
+        and len(mesh.polygons) == s.n_faces
+        and len(mesh.loops) == len(s.face_indices)
+    )
+
+
+def is_direct_step(source_state, target_state):
+    """True when a step keeps the vertex/edge/face counts and interpolates vertex-to-vertex"""
+    return (
+        source_state.n_verts == target_state.n_verts
+        and source_state.n_edges == target_state.n_edges
+        and source_state.n_faces == target_state.n_faces
+    )
+
+
+def step_motion(start, end):
+    """(max displacement, mean displacement, model size) of a step from start to end coordinates"""
+    if not len(end):
+        return 0.0, 0.0, 1e-6
+    lengths = np.linalg.norm(np.subtract(end, start, dtype=np.float32), axis=1)
+    diag = float(np.linalg.norm(np.ptp(end, axis=0)))
+    return float(lengths.max()), float(lengths.mean()), max(diag, 1e-6)
+
+
 def compute_step_cache(source_state, target_state):
     """
     Compute interpolation using a Prioritized Hybrid Strategy.
@@ -63,48 +110,27 @@ def compute_step_cache(source_state, target_state):
        -> YES: It's a Loop Cut/Subdivision. Snap to Surface (Animation: Static/Fade).
     3. Is the point OFF the surface?
        -> YES: It's an Extrusion. Snap to Nearest Vertex (Animation: Grow/Extrude).
+
+    The cache also holds the step's "motion" (see step_motion), so playback
+    can weigh steps without decoding them.
     """
-    verts1 = source_state["verts"]
-    verts2 = target_state["verts"]
-    n1 = len(verts1)
-    n2 = len(verts2)
+    n1 = source_state.n_verts
+    n2 = target_state.n_verts
 
     # 1. Topology Check
-    def _topo_signature(state):
-        edges = state.get("edges") or []
-        faces = state.get("faces") or []
-        return len(edges), len(faces)
-
-    topo_same = False
-    if n1 == n2:
-        try:
-            e_count1, f_count1 = _topo_signature(source_state)
-            e_count2, f_count2 = _topo_signature(target_state)
-            if e_count1 == e_count2 and f_count1 == f_count2:
-                topo_same = True
-        except Exception:
-            topo_same = False
-
-    if topo_same:
+    if is_direct_step(source_state, target_state):
         return {
             "n1": n1,
             "n2": n2,
             "mode": "direct",
+            "motion": step_motion(source_state.coords, target_state.coords),
         }
 
     # 2. Setup Spatial Search
     # Calculate scale for adaptive thresholds
     if n1 > 0:
-        min_v = Vector((float('inf'), float('inf'), float('inf')))
-        max_v = Vector((float('-inf'), float('-inf'), float('-inf')))
-        for v in verts1:
-            min_v.x = min(min_v.x, v.x)
-            min_v.y = min(min_v.y, v.y)
-            min_v.z = min(min_v.z, v.z)
-            max_v.x = max(max_v.x, v.x)
-            max_v.y = max(max_v.y, v.y)
-            max_v.z = max(max_v.z, v.z)
-        bbox_diag = (max_v - min_v).length
+        coords1 = source_state.coords
+        bbox_diag = float(np.linalg.norm(coords1.max(axis=0) - coords1.min(axis=0)))
     else:
         bbox_diag = 1.0
 
@@ -116,90 +142,49 @@ def compute_step_cache(source_state, target_state):
     # SURFACE_EPSILON: Tolerance to consider a point "On the Surface".
     SURFACE_EPSILON = 1e-4
 
-    # Build BVH (Source Surface)
-    bm_temp = bmesh.new()
-    source_bm_verts = []
-    for co in verts1:
-        source_bm_verts.append(bm_temp.verts.new(co))
-    bm_temp.verts.ensure_lookup_table()
-    for e in source_state.get("edges", []):
-        try: bm_temp.edges.new((source_bm_verts[e[0]], source_bm_verts[e[1]]))
-        except ValueError: pass
-    for f in source_state.get("faces", []):
-        try: bm_temp.faces.new([source_bm_verts[i] for i in f])
-        except ValueError: pass
-    if bm_temp.faces:
-        bmesh.ops.triangulate(bm_temp, faces=bm_temp.faces)
-
-    try:
-        bvh = BVHTree.FromBMesh(bm_temp)
-    except:
-        bvh = None
-
-    # Build KDTree (Source Vertices)
-    kd = kdtree.KDTree(n1)
-    for i, v in enumerate(verts1):
-        kd.insert(v, i)
-    kd.balance()
-
-    source_locations = []
-
-    for v2 in verts2:
-        start_loc = v2 # Fallback
-
-        # Get Surface Point (Projection)
-        loc_surf = None
-        dist_surf = 99999.0
-        if bvh:
-            loc_surf, _, _, dist_surf = bvh.find_nearest(v2)
-
-        # Get Vertex Point (Snap)
-        loc_vert, _, dist_vert = kd.find(v2)
-
-        # --- PRIORITY LOGIC ---
-
-        # Priority 1: Closeness to Vertex (Handles Bevels, Chamfers)
-        # If we are close to an old vertex, we almost certainly grew from it.
-        # This fixes "Vertex Bevel shrinking" by forcing it to snap to the corner.
-        if dist_vert < SNAP_THRESHOLD:
-            start_loc = loc_vert
-
-        # Priority 2: On Surface (Handles Loop Cuts, Subdivisions)
-        # If we aren't close to a vertex, but we are ON the surface, stay there.
-        elif bvh and loc_surf and dist_surf < SURFACE_EPSILON:
-            start_loc = loc_surf
-
-        # Priority 3: Off Surface (Handles Extrusions, Inflation)
-        # If we are far from vertices AND far from surface, we assume extrusion.
-        # Extrusion should grow from the base (nearest vertex), not project to surface.
-        else:
-            start_loc = loc_vert
-
-        source_locations.append(start_loc)
-
-    bm_temp.free()
+    # 3. Batched nearest-vertex / nearest-surface search over all target vertices
+    sources = hybrid_sources(source_state, target_state, SNAP_THRESHOLD, SURFACE_EPSILON)
 
     return {
         "n1": n1,
         "n2": n2,
         "mode": "hybrid",
-        "sources": source_locations
+        "sources": sources,
+        "motion": step_motion(sources, target_state.coords),
     }
 
 
-def interpolate_states_cached(source_state, target_state, t, cache):
-    """Interpolate using the computed cache"""
-    verts1 = source_state["verts"]
-    verts2 = target_state["verts"]
+class InterpolationKernel:
+    """
+    Interpolation of one step, set up once per step.
+
+    The start positions and the delta to the target are kept as contiguous
+    float32 arrays, and every evaluate() writes start + delta * t into the
+    same preallocated output buffer, ready for foreach_set.
+    """
 
-    if cache.get("mode") == "direct":
-        n1 = cache["n1"]
-        new_verts = [verts1[i].lerp(verts2[i], t) for i in range(n1)]
-        return new_verts, target_state
+    def __init__(self, source_state, target_state, cache):
+        self.target_state = target_state
+        end = np.ascontiguousarray(target_state.coords, dtype=np.float32)
+        mode = cache.get("mode")
+        if mode == "direct":
+            start = source_state.coords
+        elif mode == "hybrid":
+            start = cache["sources"]
+        else:
+            start = end
+        self.start = np.ascontiguousarray(start, dtype=np.float32)
+        self.delta = end - self.start
+        self.out = np.empty_like(self.start)
+
+    def evaluate(self, t):
+        """Return the coordinates at t; the buffer is overwritten by the next call"""
+        np.multiply(self.delta, np.float32(t), out=self.out)
+        np.add(self.out, self.start, out=self.out)
+        return self.out
 
-    if cache.get("mode") == "hybrid":
-        source_locs = cache["sources"]
-        new_verts = [s.lerp(e, t) for s, e in zip(source_locs, verts2)]
-        return new_verts, target_state
 
-    return [v.copy() for v in verts2], target_state
+def interpolate_states_cached(source_state, target_state, t, cache):
+    """Interpolate using the computed cache"""
+    kernel = InterpolationKernel(source_state, target_state, cache)
+    return kernel.evaluate(t).copy(), target_state
@@ -0,0 +1,73 @@
+# Compact array-backed mesh state for ShapingRecorder
+
+import numpy as np
+
+
+class MeshState:
+    """
+    One recorded mesh state.
+
+    Geometry is held in flat NumPy buffers: float32 coordinates (n, 3),
+    int32 edge pairs (m, 2) and a CSR face layout where face i uses
+    face_indices[face_offsets[i]:face_offsets[i + 1]].
+    """
+
+    __slots__ = ("coords", "edges", "face_offsets", "face_indices", "hash", "view", "camera")
+
+    def __init__(self, coords, edges, face_offsets, face_indices, hash=None, view=None, camera=None):
+        self.coords = coords
+        self.edges = edges
+        self.face_offsets = face_offsets
+        self.face_indices = face_indices
+        self.hash = hash
+        self.view = view
+        self.camera = camera
+
+    @classmethod
+    def from_lists(cls, verts, edges, faces, **meta):
+        """Build a state from Python sequences of coordinates, edges and faces"""
+        coords = np.array(verts, dtype=np.float32).reshape(-1, 3)
+        edge_arr = np.array(edges, dtype=np.int32).reshape(-1, 2)
+        sizes = np.fromiter((len(f) for f in faces), dtype=np.int32, count=len(faces))
+        offsets = np.zeros(len(faces) + 1, dtype=np.int32)
+        np.cumsum(sizes, out=offsets[1:])
+        indices = np.fromiter((i for f in faces for i in f), dtype=np.int32, count=int(offsets[-1]))
+        return cls(coords, edge_arr, offsets, indices, **meta)
+
+    @property
+    def n_verts(self):
+        return len(self.coords)
+
+    @property
+    def n_edges(self):
+        return len(self.edges)
+
+    @property
+    def n_faces(self):
+        return len(self.face_offsets) - 1
+
+    @property
+    def nbytes(self):
+        return self.coords.nbytes + self.edges.nbytes + self.face_offsets.nbytes + self.face_indices.nbytes
+
+    def iter_faces(self):
+        """Yield each face as a list of vertex indices"""
+        offsets = self.face_offsets.tolist()
+        indices = self.face_indices.tolist()
+        for i in range(len(offsets) - 1):
+            yield indices[offsets[i]:offsets[i + 1]]
+
+    def same_topology(self, other):
+        return (
+            self.n_verts == other.n_verts
+            and np.array_equal(self.edges, other.edges)
+            and np.array_equal(self.face_offsets, other.face_offsets)
+            and np.array_equal(self.face_indices, other.face_indices)
+        )
+
+    def with_coords(self, coords):
+        """Return a state sharing this topology with different coordinates"""
+        return MeshState(
+            coords, self.edges, self.face_offsets, self.face_indices,
+            hash=None, view=self.view, camera=self.camera,
+        )
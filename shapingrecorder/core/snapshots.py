@@ -0,0 +1,443 @@
+# Delta-encoded step history for ShapingRecorder
+
+from collections import OrderedDict
+from functools import partial
+
+import numpy as np
+
+from .mesh_state import MeshState
+
+# A full keyframe snapshot is stored at least every KEYFRAME_INTERVAL steps;
+# steps in between only keep the vertices that moved since the previous step.
+KEYFRAME_INTERVAL = 20
+_MATERIALIZED_CACHE_SIZE = 4
+
+
+def _topology_bytes(topology):
+    return sum(a.nbytes for a in topology)
+
+
+def _same_topology(a, b):
+    return all(np.array_equal(x, y) for x, y in zip(a, b))
+
+
+def _state_meta(s):
+    return {"hash": s.hash, "view": s.view, "camera": s.camera}
+
+
+def _payload_bytes(payload):
+    coords, indices, topology = payload
+    size = coords.nbytes
+    if indices is not None:
+        size += indices.nbytes
+    if topology is not None:
+        size += _topology_bytes(topology)
+    return size
+
+
+class _Entry:
+    """
+    One stored step. The payload (coords, indices, topology) is either held
+    directly or produced by a loader on first access, so a history read
+    from disk only decodes the steps that are actually used.
+    """
+
+    __slots__ = ("meta", "n_verts", "keyframe", "raw_nbytes", "stored_nbytes", "_payload", "_loader")
+
+    def __init__(self, meta, n_verts, keyframe, raw_nbytes, payload=None, loader=None, stored_nbytes=0):
+        self.meta = meta
+        self.n_verts = n_verts
+        self.keyframe = keyframe
+        self.raw_nbytes = raw_nbytes
+        self.stored_nbytes = _payload_bytes(payload) if payload is not None else stored_nbytes
+        self._payload = payload
+        self._loader = loader
+
+    @property
+    def is_keyframe(self):
+        return self.keyframe
+
+    @property
+    def is_loaded(self):
+        return self._payload is not None
+
+    @property
+    def payload(self):
+        if self._payload is None:
+            self._payload = _payload_from_arrays(self._loader())
+            self._loader = None
+        return self._payload
+
+    def peek(self):
+        """The payload without keeping it, for readers outside the main thread"""
+        payload = self._payload
+        if payload is None:
+            loader = self._loader
+            if loader is None:
+                # 主线程刚解码完成
+                return self._payload
+            payload = _payload_from_arrays(loader())
+        return payload
+
+    @property
+    def coords(self):
+        return self.payload[0]
+
+    @property
+    def indices(self):
+        return self.payload[1]
+
+    @property
+    def topology(self):
+        return self.payload[2]
+
+    def arrays(self):
+        coords, indices, topology = self.payload
+        return (coords, indices) + tuple(topology or (None, None, None))
+
+    def info(self):
+        return {
+            "n_verts": self.n_verts,
+            "keyframe": self.keyframe,
+            "raw_bytes": self.raw_nbytes,
+            "stored_bytes": self.stored_nbytes,
+        }
+
+
+def _payload_from_arrays(arrays):
+    coords, indices, edges, face_offsets, face_indices = arrays
+    topology = None
+    if edges is not None:
+        topology = (edges.reshape(-1, 2), face_offsets, face_indices)
+    return coords.reshape(-1, 3), indices, topology
+
+
+def _rebuild(chain, meta):
+    coords, _, topology = chain[0].peek()
+    coords = coords.copy()
+    for entry in chain[1:]:
+        values, indices, step_topology = entry.peek()
+        coords[indices] = values
+        if step_topology is not None:
+            topology = step_topology
+    return MeshState(coords, *topology, **meta)
+
+
+class StepHistory:
+    """
+    List-like container of recorded step states.
+
+    Steps are stored as keyframes (full coordinates and topology) or deltas
+    against the previous step (changed vertex indices plus their new
+    coordinates, and topology only when it changed). Indexing rebuilds the
+    full MeshState on demand; the last few rebuilt states are cached.
+    Metadata (hash, view, camera) must be edited through update_meta().
+
+    Every mutation is also logged as a journal op (see take_journal) so
+    persistence can write just the change instead of the whole history.
+    """
+
+    def __init__(self, states=None, keyframe_interval=KEYFRAME_INTERVAL):
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._entries = []
+        self._cache = OrderedDict()
+        self._journal = []
+        for s in states or []:
+            self.append(s)
+
+    # --- list protocol -------------------------------------------------
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __bool__(self):
+        return bool(self._entries)
+
+    def __iter__(self):
+        for coords, topology, meta in self.iter_geometry():
+            yield MeshState(coords, *topology, **meta)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._entries)))]
+        index = self._normalize(index)
+        return self._materialize(index)
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._entries))
+            if step == 1 and stop == len(self._entries):
+                self.truncate(start)
+                return
+            for i in sorted(range(start, stop, step), reverse=True):
+                self._delete(i)
+            return
+        self._delete(self._normalize(index))
+
+    def append(self, s, dirty_ranges=None):
+        """
+        Append a state. dirty_ranges, a list of (start, end) vertex ranges
+        that may have changed since the last step, limits the delta scan.
+        """
+        prev = self._decode(len(self._entries) - 1) if self._entries else None
+        self._push(self._encode(s, prev, len(self._entries), dirty_ranges))
+
+    def append_entry(self, meta, info, arrays):
+        """Append an already encoded entry, as produced by dump_entries()"""
+        payload = _payload_from_arrays(arrays)
+        coords, indices, topology = payload
+        if indices is None and topology is None:
+            raise ValueError("keyframe without topology")
+        if not self._entries and indices is not None:
+            raise ValueError("history must start with a keyframe")
+        n_verts = info["n_verts"]
+        raw = self._raw_nbytes(n_verts, topology)
+        self._push(_Entry(meta, n_verts, indices is None, raw, payload=payload))
+
+    def append_lazy(self, meta, info, loader):
+        """
+        Append an encoded entry whose arrays are only fetched through
+        loader() the first time the step is rebuilt. info must carry the
+        keyframe flag and byte counts written by dump_entries().
+        """
+        if "keyframe" not in info:
+            self.append_entry(meta, info, loader())
+            return
+        self._push(_Entry(
+            meta, info["n_verts"], info["keyframe"], info.get("raw_bytes", 0),
+            loader=loader, stored_nbytes=info.get("stored_bytes", 0),
+        ))
+
+    def truncate(self, length):
+        """Drop every step from length on"""
+        length = max(0, length)
+        if length >= len(self._entries):
+            return
+        del self._entries[length:]
+        for index in [i for i in self._cache if i >= length]:
+            del self._cache[index]
+        self._journal.append(("truncate", length))
+
+    def extend(self, states):
+        for s in states:
+            self.append(s)
+
+    def insert(self, index, s):
+        index = max(0, min(index, len(self._entries)))
+        if index == len(self._entries):
+            self.append(s)
+            return
+        following = self._decode(index)
+        prev = self._decode(index - 1) if index > 0 else None
+        self._entries.insert(index, self._encode(s, prev, index))
+        self._cache.clear()
+        self._reencode(index + 1, following)
+        self._journal.append(("insert", index, s))
+
+    def update_meta(self, index, **meta):
+        index = self._normalize(index)
+        self._entries[index].meta.update(meta)
+        cached = self._cache.get(index)
+        if cached is not None:
+            for key, value in meta.items():
+                setattr(cached, key, value)
+        self._journal.append(("meta", index, meta))
+
+    def take_journal(self):
+        """
+        Return and clear the ops logged since the last call:
+        ("append", entry), ("truncate", length), ("delete", index),
+        ("insert", index, MeshState) and ("meta", index, dict).
+        Replaying them in order on the previous contents reproduces the
+        current entries exactly.
+        """
+        ops = self._journal
+        self._journal = []
+        return ops
+
+    def meta(self, index):
+        """Return the metadata dict (hash, view, camera) of a step without rebuilding geometry"""
+        return self._entries[self._normalize(index)].meta
+
+    def hashes(self):
+        """Return the hash of every step without rebuilding geometry"""
+        return [entry.meta["hash"] for entry in self._entries]
+
+    def state_loader(self, index):
+        """
+        Return a callable that rebuilds the state of a step as stored now.
+        It only reads the entries captured here, so it can run on a worker
+        thread while the history keeps changing.
+        """
+        index = self._normalize(index)
+        start = index
+        while not self._entries[start].is_keyframe:
+            start -= 1
+        return partial(_rebuild, self._entries[start:index + 1], dict(self._entries[index].meta))
+
+    def iter_geometry(self):
+        """Yield (coords, topology, meta) for every step, decoding sequentially"""
+        coords = None
+        topology = None
+        for entry in self._entries:
+            if entry.is_keyframe:
+                coords = entry.coords.copy()
+            else:
+                coords = coords.copy()
+                coords[entry.indices] = entry.coords
+            if entry.topology is not None:
+                topology = entry.topology
+            yield coords, topology, entry.meta
+
+    def iter_changes(self):
+        """
+        Yield (indices, coords, topology, meta) for every step as stored,
+        without rebuilding states: a delta gives the changed vertex indices
+        and their new coordinates, a keyframe gives indices None and all
+        coordinates. topology is None when it did not change.
+        """
+        for entry in self._entries:
+            yield entry.indices, entry.coords, entry.topology, entry.meta
+
+    def select(self, indices):
+        """Return a new StepHistory with only the given steps, rebuilt in one sequential pass"""
+        keep = set(indices)
+        result = StepHistory(keyframe_interval=self.keyframe_interval)
+        coords = None
+        topology = None
+        for i, (changed, values, step_topology, meta) in enumerate(self.iter_changes()):
+            if changed is None:
+                coords = values.copy()
+            else:
+                coords[changed] = values
+            if step_topology is not None:
+                topology = step_topology
+            if i in keep:
+                result.append(MeshState(coords.copy(), *topology, **meta))
+        result.take_journal()
+        return result
+
+    # --- storage -------------------------------------------------------
+
+    def dump_entries(self):
+        """
+        Yield (meta, info, arrays) for every stored entry, as encoded.
+        arrays is (coords, indices, edges, face_offsets, face_indices) with
+        None for missing parts, so deltas are persisted as deltas.
+        """
+        for entry in self._entries:
+            yield entry.meta, entry.info(), entry.arrays()
+
+    # --- metrics -------------------------------------------------------
+
+    def memory_stats(self):
+        """Return raw vs stored geometry bytes and the fraction saved"""
+        raw = sum(entry.raw_nbytes for entry in self._entries)
+        stored = sum(entry.stored_nbytes for entry in self._entries)
+        saved = 1.0 - stored / raw if raw else 0.0
+        return {
+            "steps": len(self._entries),
+            "keyframes": sum(1 for e in self._entries if e.is_keyframe),
+            "loaded": sum(1 for e in self._entries if e.is_loaded),
+            "raw_bytes": raw,
+            "stored_bytes": stored,
+            "saved": saved,
+        }
+
+    # --- internals -----------------------------------------------------
+
+    def _normalize(self, index):
+        if index < 0:
+            index += len(self._entries)
+        if index < 0 or index >= len(self._entries):
+            raise IndexError("step index out of range")
+        return index
+
+    def _push(self, entry):
+        if not self._entries and not entry.is_keyframe:
+            raise ValueError("history must start with a keyframe")
+        self._entries.append(entry)
+        self._journal.append(("append", entry))
+
+    def _raw_nbytes(self, n_verts, topology):
+        """Size of the full copy of a step appended after the current last one"""
+        if topology is None:
+            prev = self._entries[-1]
+            return prev.raw_nbytes - prev.n_verts * 12 + n_verts * 12
+        return n_verts * 12 + _topology_bytes(topology)
+
+    def _encode(self, s, prev, index, dirty_ranges=None):
+        meta = _state_meta(s)
+        coords = s.coords
+        topology = (s.edges, s.face_offsets, s.face_indices)
+        n_verts = len(coords)
+        raw = n_verts * 12 + _topology_bytes(topology)
+
+        chain = 0
+        for back in range(index - 1, -1, -1):
+            if self._entries[back].is_keyframe:
+                break
+            chain += 1
+        if prev is None or prev[0].shape != coords.shape or chain + 1 >= self.keyframe_interval:
+            return _Entry(meta, n_verts, True, raw, payload=(coords, None, topology))
+
+        prev_coords, prev_topology = prev
+        if dirty_ranges is None:
+            changed = np.flatnonzero(np.any(coords != prev_coords, axis=1))
+        else:
+            parts = []
+            for start, end in dirty_ranges:
+                block = np.any(coords[start:end] != prev_coords[start:end], axis=1)
+                parts.append(np.flatnonzero(block) + start)
+            changed = np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+        if len(changed) * 16 >= n_verts * 12:
+            # 变化的顶点太多时，差分比关键帧更大
+            return _Entry(meta, n_verts, True, raw, payload=(coords, None, topology))
+
+        if _same_topology(topology, prev_topology):
+            topology = None
+        return _Entry(meta, n_verts, False, raw, payload=(coords[changed], changed.astype(np.int32), topology))
+
+    def _decode(self, index):
+        """Return (coords, topology) of a step by replaying its delta chain"""
+        start = index
+        while not self._entries[start].is_keyframe:
+            start -= 1
+        key = self._entries[start]
+        coords = key.coords.copy()
+        topology = key.topology
+        for entry in self._entries[start + 1:index + 1]:
+            coords[entry.indices] = entry.coords
+            if entry.topology is not None:
+                topology = entry.topology
+        return coords, topology
+
+    def _materialize(self, index):
+        cached = self._cache.get(index)
+        if cached is not None:
+            self._cache.move_to_end(index)
+            return cached
+        coords, topology = self._decode(index)
+        s = MeshState(coords, *topology, **self._entries[index].meta)
+        self._cache[index] = s
+        if len(self._cache) > _MATERIALIZED_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return s
+
+    def _reencode(self, index, decoded):
+        """Re-encode the step at index, whose predecessor just changed"""
+        if index >= len(self._entries):
+            return
+        coords, topology = decoded
+        entry = self._entries[index]
+        prev = self._decode(index - 1) if index > 0 else None
+        s = MeshState(coords, *topology, **entry.meta)
+        self._entries[index] = self._encode(s, prev, index)
+
+    def _delete(self, index):
+        following = self._decode(index + 1) if index + 1 < len(self._entries) else None
+        del self._entries[index]
+        self._cache.clear()
+        if following is not None:
+            self._reencode(index, following)
+        self._journal.append(("delete", index))
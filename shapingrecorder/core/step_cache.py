@@ -0,0 +1,129 @@
+# Persistent per-step-pair interpolation caches for ShapingRecorder
+
+from .mesh_ops import compute_step_cache
+
+# Bump whenever compute_step_cache changes its output, so caches stored
+# in older files are recomputed instead of reused.
+CORRESPONDENCE_VERSION = 2
+
+
+class StepCacheStore:
+    """
+    Interpolation caches (see compute_step_cache) keyed by
+    (source hash, target hash, CORRESPONDENCE_VERSION).
+
+    Because the key is the geometry of both ends rather than the step
+    index, deleting or restoring a step simply makes a different pair
+    adjacent: its cache is computed on first use and the orphaned ones
+    are dropped by prune(). Entries read from disk may be held as a
+    loader and are only decoded when first used; their step motion is
+    kept apart so motion() never decodes anything.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._motion = {}
+        self._added = []
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(source_state, target_state):
+        return StepCacheStore.hash_key(source_state.hash, target_state.hash)
+
+    @staticmethod
+    def hash_key(source_hash, target_hash):
+        if source_hash is None or target_hash is None:
+            return None
+        return (source_hash, target_hash, CORRESPONDENCE_VERSION)
+
+    def lookup(self, source_state, target_state):
+        """Return the stored cache for this pair, or None"""
+        key = self.key(source_state, target_state)
+        cache = self._resolve(key) if key is not None else None
+        if cache is None:
+            return None
+        if cache["n1"] != source_state.n_verts or cache["n2"] != target_state.n_verts:
+            # 哈希碰撞或旧数据，丢弃后重新计算
+            del self._entries[key]
+            self._motion.pop(key, None)
+            return None
+        return cache
+
+    def get(self, source_state, target_state):
+        """Return the cache for this pair, computing and storing it if needed"""
+        cache = self.lookup(source_state, target_state)
+        if cache is None:
+            cache = compute_step_cache(source_state, target_state)
+            key = self.key(source_state, target_state)
+            if key is not None:
+                self.store(key, cache)
+        return cache
+
+    def store(self, key, cache):
+        if key[2] != CORRESPONDENCE_VERSION:
+            return
+        if key not in self._entries:
+            self._added.append(key)
+        self._entries[key] = cache
+        self._motion[key] = cache.get("motion")
+
+    def store_lazy(self, key, loader, motion=None):
+        """Store an entry whose cache dict is produced by loader() on first use"""
+        if key[2] != CORRESPONDENCE_VERSION:
+            return
+        self._entries[key] = loader
+        self._motion[key] = motion
+
+    def motion(self, key):
+        """Step motion (see mesh_ops.step_motion) stored for key, or None; never computes or decodes"""
+        return self._motion.get(key)
+
+    def pair_keys(self, initial_mesh, history):
+        """Keys of every adjacent (source, target) pair of a recording"""
+        hashes = [initial_mesh.hash] + history.hashes()
+        return [
+            (a, b, CORRESPONDENCE_VERSION) if a is not None and b is not None else None
+            for a, b in zip(hashes, hashes[1:])
+        ]
+
+    def missing_steps(self, initial_mesh, history):
+        """Indices of the steps whose pair has no cache yet"""
+        return [i for i, key in enumerate(self.pair_keys(initial_mesh, history)) if key not in self._entries]
+
+    def precompute(self, initial_mesh, history):
+        """Compute the caches of every step that does not have one; returns the count"""
+        missing = self.missing_steps(initial_mesh, history)
+        for i in missing:
+            source = initial_mesh if i == 0 else history[i - 1]
+            self.get(source, history[i])
+        return len(missing)
+
+    def prune(self, initial_mesh, history):
+        """Drop the entries that no longer belong to an adjacent pair"""
+        keep = set(self.pair_keys(initial_mesh, history))
+        for key in [k for k in self._entries if k not in keep]:
+            del self._entries[key]
+            self._motion.pop(key, None)
+        self._added = [k for k in self._added if k in keep]
+
+    def take_added(self):
+        """Return and clear the keys stored since the last call"""
+        added = [k for k in self._added if k in self._entries]
+        self._added = []
+        return added
+
+    def items(self, keys=None):
+        """Yield (key, cache) for the given keys (default: all), decoding lazy entries"""
+        for key in list(self._entries) if keys is None else keys:
+            cache = self._resolve(key)
+            if cache is not None:
+                yield key, cache
+
+    def _resolve(self, key):
+        entry = self._entries.get(key)
+        if callable(entry):
+            entry = entry()
+            self._entries[key] = entry
+        return entry
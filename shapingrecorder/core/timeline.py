@@ -0,0 +1,122 @@
+# Compiled playback timeline for ShapingRecorder
+
+import hashlib
+import math
+from bisect import bisect_right
+from itertools import accumulate
+
+
+def allocate_frames(weights, budget, minimums):
+    """
+    Split budget frames over items in proportion to weights on top of each
+    item's minimum, rounding by largest remainder. Returns the counts.
+    """
+    counts = list(minimums)
+    spare = budget - sum(counts)
+    total = sum(weights)
+    if spare <= 0 or total <= 0.0:
+        return counts
+    shares = [spare * w / total for w in weights]
+    extra = [int(share) for share in shares]
+    order = sorted(range(len(shares)), key=lambda i: shares[i] - extra[i], reverse=True)
+    for i in order[:spare - sum(extra)]:
+        extra[i] += 1
+    return [c + e for c, e in zip(counts, extra)]
+
+
+class Timeline:
+    """
+    Timing table of one playback range, built once before playback.
+
+    Step first_step + k starts at starts[k] and spends cam[k] seconds on the
+    camera move (0 when the view does not change) followed by mesh[k]
+    seconds of mesh interpolation. Global time maps back to a step by
+    bisecting the start times.
+    """
+
+    def __init__(self, first_step, cam_durations, mesh_durations, view_changed):
+        self.first_step = first_step
+        self.changed = list(view_changed)
+        self.cam = [c if changed else 0.0 for c, changed in zip(cam_durations, self.changed)]
+        self.mesh = list(mesh_durations)
+        totals = [c + m for c, m in zip(self.cam, self.mesh)]
+        self.starts = [0.0] + list(accumulate(totals))[:-1] if totals else []
+        self.duration = sum(totals)
+
+    def __len__(self):
+        return len(self.mesh)
+
+    @property
+    def last_step(self):
+        return self.first_step + len(self.mesh) - 1
+
+    def span(self, step):
+        """Return (cam_duration, mesh_duration, view_changed) of a step"""
+        k = step - self.first_step
+        return self.cam[k], self.mesh[k], self.changed[k]
+
+    def start_time(self, step):
+        return self.starts[step - self.first_step]
+
+    def phase(self, step, elapsed):
+        """Return (cam_t, mesh_t) at elapsed seconds into a step"""
+        cam, mesh, changed = self.span(step)
+        if changed and elapsed < cam:
+            return elapsed / cam, 0.0
+        mesh_t = min(max(elapsed - cam, 0.0) / max(mesh, 1e-6), 1.0)
+        cam_t = 1.0 if changed else min(elapsed / max(mesh, 1e-6), 1.0)
+        return cam_t, mesh_t
+
+    def locate(self, t):
+        """Map a global time to (step, elapsed in step, cam_t, mesh_t)"""
+        if not self.mesh:
+            raise IndexError("empty timeline")
+        t = min(max(t, 0.0), self.duration)
+        k = min(max(bisect_right(self.starts, t) - 1, 0), len(self.mesh) - 1)
+        step = self.first_step + k
+        elapsed = t - self.starts[k]
+        cam_t, mesh_t = self.phase(step, elapsed)
+        return step, elapsed, cam_t, mesh_t
+
+    def step_frame_count(self, step, frame_time):
+        """Frames a step yields at a fixed frame_time, the last one showing the step's end"""
+        cam, mesh, _ = self.span(step)
+        return max(1, math.ceil((cam + mesh) / frame_time - 1e-9))
+
+    def frame_count(self, frame_time):
+        return sum(self.step_frame_count(step, frame_time) for step in range(self.first_step, self.last_step + 1))
+
+    def frames(self, frame_time, start=0):
+        """
+        Yield (frame, step, cam_t, mesh_t, end) for every frame of the range
+        at a fixed frame_time, from global frame start on: frames sample the
+        step at frame_time, 2 * frame_time, ... and the last one (end=True)
+        is the end of the step. Fixed-clock playback and batch export both
+        consume this sequence.
+        """
+        frame = 0
+        for step in range(self.first_step, self.last_step + 1):
+            count = self.step_frame_count(step, frame_time)
+            if frame + count <= start:
+                frame += count
+                continue
+            for k in range(1, count + 1):
+                if frame >= start:
+                    end = k == count
+                    cam_t, mesh_t = (1.0, 1.0) if end else self.phase(step, k * frame_time)
+                    yield frame, step, cam_t, mesh_t, end
+                frame += 1
+
+    def seek_frame(self, frame, frame_time):
+        """Return (step, frames of that step before it) for a global frame index of frames()"""
+        for step in range(self.first_step, self.last_step + 1):
+            count = self.step_frame_count(step, frame_time)
+            if frame < count:
+                return step, frame
+            frame -= count
+        return self.last_step + 1, 0
+
+    def fingerprint(self, state_hashes, frame_time):
+        """Hex digest of the timing table, the states it plays and the frame time"""
+        data = (self.first_step, self.cam, self.mesh, self.changed, list(state_hashes), frame_time)
+        return hashlib.blake2b(repr(data).encode(), digest_size=16).hexdigest()
@@ -1,9 +1,27 @@
 import json
+from functools import partial
 
 import bpy
 
 from . import state
-from ..core.data import deserialize_state, serialize_state
+from ..core import container
+from ..core.compaction import remap_step_timing
+from ..core.data import (
+    deserialize_camera,
+    deserialize_state,
+    deserialize_view,
+    serialize_camera,
+    serialize_view,
+)
+from ..core.mesh_state import MeshState
+from ..core.snapshots import StepHistory
+from ..core.step_cache import StepCacheStore
+
+BLOB_KEY = "mesh_recorder_blob"
+JOURNAL_KEY = "mesh_recorder_journal"
+LEGACY_KEY = "mesh_recorder_data"
+SEQUENCE_KEY = "mesh_recorder_seq"
+JOURNAL_MAX_RECORDS = 64
 
 
 def sync_step_list(context, keep_index=None):
@@ -26,39 +44,389 @@ def sync_step_list(context, keep_index=None):
     state._is_auto_selecting = False
 
 
-def save_to_scene(context):
-    scene = context.scene
+def compact_history(context, kept):
+    """
+    Keep only the given steps of the displayed recording, carrying their
+    per-step settings along, and rewrite the saved data in full.
+    """
+    rec = state.get_current_record()
+    if not rec:
+        return
     settings = state.get_settings(context)
-    data = {
+    timing = _collect_step_timing(settings)
+    rec["history"] = rec["history"].select(kept)
+    rec["correspondence"].prune(rec["initial_mesh"], rec["history"])
+    sync_step_list(context)
+    _apply_step_timing(settings, remap_step_timing(timing, kept))
+    save_to_scene(context, compact=True)
+
+
+def _serialize_meta(meta, chunk, info=None):
+    return {
+        "chunk": chunk,
+        **(info or {}),
+        "hash": meta.get("hash"),
+        "view": serialize_view(meta.get("view")),
+        "camera": serialize_camera(meta.get("camera")),
+    }
+
+
+def _deserialize_meta(data):
+    return {
+        "hash": data.get("hash"),
+        "view": deserialize_view(data.get("view")),
+        "camera": deserialize_camera(data.get("camera")),
+    }
+
+
+def _deserialize_info(data):
+    return {k: data[k] for k in ("n_verts", "keyframe", "raw_bytes", "stored_bytes") if k in data}
+
+
+def _collect_step_timing(settings):
+    timing_list = []
+    for item in settings.step_items:
+        timing_list.append({
+            "use_custom": item.use_custom_timing,
+            "cam": item.cam_duration,
+            "mesh": item.mesh_duration,
+            "marked_edges": item.marked_edge_indices,
+            "show_edges": item.show_changed_edges,
+        })
+    return timing_list
+
+
+def _apply_step_timing(settings, timing_list):
+    for i, timing in enumerate(timing_list):
+        if i < len(settings.step_items):
+            settings.step_items[i].use_custom_timing = timing.get("use_custom", False)
+            settings.step_items[i].cam_duration = timing.get("cam", 0.5)
+            settings.step_items[i].mesh_duration = timing.get("mesh", 0.5)
+            settings.step_items[i].marked_edge_indices = timing.get("marked_edges", "")
+            settings.step_items[i].show_changed_edges = timing.get("show_edges", False)
+
+
+def _pack_state(s, chunks):
+    chunks.append(container.pack_arrays(
+        (s.coords, None, s.edges, s.face_offsets, s.face_indices)
+    ))
+    return _serialize_meta(
+        {"hash": s.hash, "view": s.view, "camera": s.camera}, len(chunks) - 1, {"n_verts": s.n_verts}
+    )
+
+
+def _unpack_state(data, state_meta):
+    coords, _, edges, face_offsets, face_indices = data.arrays(state_meta["chunk"])
+    return MeshState(
+        coords.reshape(-1, 3), edges.reshape(-1, 2), face_offsets, face_indices,
+        **_deserialize_meta(state_meta),
+    )
+
+
+def _pack_step_cache(key, cache, chunks):
+    item = {
+        "source": key[0],
+        "target": key[1],
+        "version": key[2],
+        "mode": cache["mode"],
+        "n1": cache["n1"],
+        "n2": cache["n2"],
+        "motion": list(cache["motion"]) if cache.get("motion") else None,
+        "chunk": None,
+    }
+    if "sources" in cache:
+        chunks.append(container.pack_arrays((cache["sources"],)))
+        item["chunk"] = len(chunks) - 1
+    return item
+
+
+def _load_step_cache(data, item):
+    cache = {"mode": item["mode"], "n1": item["n1"], "n2": item["n2"]}
+    if item.get("motion"):
+        cache["motion"] = tuple(item["motion"])
+    if item.get("chunk") is not None:
+        (sources,) = data.arrays(item["chunk"])
+        cache["sources"] = sources.reshape(-1, 3)
+    return cache
+
+
+def _unpack_step_caches(store, data, items):
+    for item in items:
+        key = (item["source"], item["target"], item["version"])
+        motion = tuple(item["motion"]) if item.get("motion") else None
+        store.store_lazy(key, partial(_load_step_cache, data, item), motion)
+
+
+def _pack_record(rec, chunks):
+    rec_meta = {"initial_mesh": _pack_state(rec["initial_mesh"], chunks), "history": []}
+    for step_meta, info, arrays in rec["history"].dump_entries():
+        chunks.append(container.pack_arrays(arrays))
+        rec_meta["history"].append(_serialize_meta(step_meta, len(chunks) - 1, info))
+    step_caches = rec["correspondence"]
+    step_caches.prune(rec["initial_mesh"], rec["history"])
+    rec_meta["step_caches"] = [_pack_step_cache(key, cache, chunks) for key, cache in step_caches.items()]
+    return rec_meta
+
+
+def _unpack_record(data, rec_meta):
+    # 只读取索引与视图元数据，顶点/拓扑在首次使用该步骤时才解码
+    history = StepHistory()
+    for m in rec_meta.get("history", []):
+        history.append_lazy(_deserialize_meta(m), _deserialize_info(m), partial(data.arrays, m["chunk"]))
+    history.take_journal()
+    step_caches = StepCacheStore()
+    _unpack_step_caches(step_caches, data, rec_meta.get("step_caches", []))
+    return {
+        "initial_mesh": _unpack_state(data, rec_meta["initial_mesh"]),
+        "history": history,
+        "redo": [],
+        "correspondence": step_caches,
+    }
+
+
+def apply_saved_step_timing(context):
+    """Re-apply the saved per-step timings of the displayed object to the step list"""
+    if state.current_display_obj in state._step_timing:
+        _apply_step_timing(state.get_settings(context), state._step_timing[state.current_display_obj])
+
+
+def _update_step_timing(settings):
+    if state.current_display_obj:
+        state._step_timing[state.current_display_obj] = _collect_step_timing(settings)
+
+
+def pack_records(settings, compress=True):
+    """Encode all object records into a binary container"""
+    _update_step_timing(settings)
+    meta = {
         "object_records": {},
         "current_display_obj": state.current_display_obj,
-        "step_timing": {},
+        "step_timing": {k: v for k, v in state._step_timing.items() if k in state.object_records},
     }
+    chunks = []
     for obj_name, rec in state.object_records.items():
-        data["object_records"][obj_name] = {
-            "initial_mesh": serialize_state(rec["initial_mesh"]),
-            "history": [serialize_state(s) for s in rec["history"]],
-        }
-    if state.current_display_obj:
-        timing_list = []
-        for item in settings.step_items:
-            timing_list.append({
-                "use_custom": item.use_custom_timing,
-                "cam": item.cam_duration,
-                "mesh": item.mesh_duration,
-                "marked_edges": item.marked_edge_indices,
-                "show_edges": item.show_changed_edges,
-            })
-        data["step_timing"][state.current_display_obj] = timing_list
-    scene["mesh_recorder_data"] = json.dumps(data)
+        meta["object_records"][obj_name] = _pack_record(rec, chunks)
+    return container.pack(meta, chunks, compress=compress)
+
+
+def unpack_records(blob):
+    """Decode a binary container into (object_records, meta)"""
+    data = container.Container(blob)
+    records = {}
+    for obj_name, rec_meta in data.meta.get("object_records", {}).items():
+        records[obj_name] = _unpack_record(data, rec_meta)
+    return records, data.meta
+
+
+def _pack_journal_record(settings):
+    """Encode the changes since the last save as one journal record"""
+    _update_step_timing(settings)
+    ops = []
+    chunks = []
+    for obj_name, rec in state.object_records.items():
+        history_ops = rec["history"].take_journal()
+        added_caches = rec["correspondence"].take_added()
+        if obj_name not in state._persisted_objects:
+            ops.append({"op": "record", "obj": obj_name, "record": _pack_record(rec, chunks)})
+            continue
+        for op in history_ops:
+            kind = op[0]
+            if kind == "append":
+                entry = op[1]
+                chunks.append(container.pack_arrays(entry.arrays()))
+                ops.append({"op": "append", "obj": obj_name,
+                            **_serialize_meta(entry.meta, len(chunks) - 1, entry.info())})
+            elif kind == "insert":
+                ops.append({"op": "insert", "obj": obj_name, "index": op[1],
+                            **_pack_state(op[2], chunks)})
+            elif kind == "meta":
+                ops.append({"op": "meta", "obj": obj_name, "index": op[1], "keys": sorted(op[2]),
+                            **_serialize_meta(op[2], None, None)})
+            else:
+                ops.append({"op": kind, "obj": obj_name, "index": op[1]})
+        for key, cache in rec["correspondence"].items(added_caches):
+            ops.append({"op": "step_cache", "obj": obj_name, **_pack_step_cache(key, cache, chunks)})
+    for obj_name in state._persisted_objects - set(state.object_records):
+        ops.append({"op": "drop", "obj": obj_name})
+    meta = {
+        "ops": ops,
+        "current_display_obj": state.current_display_obj,
+        "step_timing": {state.current_display_obj: state._step_timing[state.current_display_obj]}
+        if state.current_display_obj in state._step_timing else {},
+    }
+    return container.pack(meta, chunks)
+
+
+def _replay_op(records, data, op):
+    kind = op["op"]
+    name = op["obj"]
+    if kind == "record":
+        records[name] = _unpack_record(data, op["record"])
+        return
+    if kind == "drop":
+        records.pop(name, None)
+        return
+    if kind == "step_cache":
+        _unpack_step_caches(records[name]["correspondence"], data, [op])
+        return
+    history = records[name]["history"]
+    if kind == "append":
+        history.append_lazy(_deserialize_meta(op), _deserialize_info(op), partial(data.arrays, op["chunk"]))
+    elif kind == "insert":
+        history.insert(op["index"], _unpack_state(data, op))
+    elif kind == "meta":
+        meta = _deserialize_meta(op)
+        history.update_meta(op["index"], **{k: meta[k] for k in op.get("keys", [])})
+    elif kind == "delete":
+        del history[op["index"]]
+    elif kind == "truncate":
+        history.truncate(op["index"])
+
+
+def _replay_journal_record(records, step_timing, blob, base=None, failed=None):
+    """
+    Apply one journal record to records. When an op fails, that object
+    falls back to its record in base (the unpacked base container, or
+    dropped if it has none), its later ops are skipped and its name is
+    added to failed; the other objects are unaffected.
+    """
+    failed = set() if failed is None else failed
+    data = container.Container(blob)
+    for op in data.meta.get("ops", []):
+        name = op["obj"]
+        if name in failed:
+            continue
+        try:
+            _replay_op(records, data, op)
+        except Exception as e:
+            print(f"Failed to replay recorder journal for {name}, using its last full save: {e}")
+            failed.add(name)
+            records.pop(name, None)
+            if base is not None and name in base.meta.get("object_records", {}):
+                records[name] = _unpack_record(base, base.meta["object_records"][name])
+    step_timing.update(data.meta.get("step_timing", {}))
+    return data.meta
+
+
+def _journal_size(scene):
+    journal = scene.get(JOURNAL_KEY)
+    if not journal:
+        return 0, 0
+    return len(journal), sum(len(journal[k]) for k in journal.keys())
+
+
+def in_sync(scene):
+    """
+    True when the saved data in scene is the one this session last wrote.
+    Every save bumps a sequence number stored both in the scene and in
+    state; undo reverts the scene's copy (with the blob and journal) but
+    not the in-memory records, so the journal can no longer be appended to.
+    """
+    return state._persist_seq is not None and scene.get(SEQUENCE_KEY) == state._persist_seq
+
+
+def _bump_sequence(scene):
+    # 严格递增，撤销栈里的旧存档不会与之重号
+    state._persist_seq = max(state._persist_seq or 0, scene.get(SEQUENCE_KEY, 0)) + 1
+    scene[SEQUENCE_KEY] = state._persist_seq
+
+
+def save_to_scene(context, compact=False):
+    """
+    Persist recorder data. Normally only the changes since the last save
+    are appended to the journal; the journal is folded back into the base
+    container when it grows past JOURNAL_MAX_RECORDS or half the base size,
+    and rewritten in full when the scene data is not the one last written
+    (see in_sync).
+    """
+    scene = context.scene
+    settings = state.get_settings(context)
+    count, size = _journal_size(scene)
+    if (
+        compact
+        or not in_sync(scene)
+        or BLOB_KEY not in scene
+        or LEGACY_KEY in scene
+        or count >= JOURNAL_MAX_RECORDS
+        or size > len(scene[BLOB_KEY]) // 2
+    ):
+        _compact(scene, settings)
+        return
+    journal = scene.get(JOURNAL_KEY)
+    if journal is None:
+        scene[JOURNAL_KEY] = {}
+        journal = scene[JOURNAL_KEY]
+    journal[f"{count:06d}"] = _pack_journal_record(settings)
+    state._persisted_objects = set(state.object_records)
+    _bump_sequence(scene)
+    state._precompute_unsaved = False
+
+
+def _compact(scene, settings):
+    scene[BLOB_KEY] = pack_records(settings)
+    for rec in state.object_records.values():
+        rec["history"].take_journal()
+        rec["correspondence"].take_added()
+    state._persisted_objects = set(state.object_records)
+    state._precompute_unsaved = False
+    if JOURNAL_KEY in scene:
+        del scene[JOURNAL_KEY]
+    if LEGACY_KEY in scene:
+        del scene[LEGACY_KEY]
+    _bump_sequence(scene)
 
 
 def load_from_scene(context):
     scene = context.scene
-    if "mesh_recorder_data" not in scene:
+    state._persist_seq = None
+    if BLOB_KEY in scene:
+        _load_blob(context, bytes(scene[BLOB_KEY]))
+    elif LEGACY_KEY in scene:
+        _load_legacy_json(context, scene[LEGACY_KEY])
+
+
+def _load_blob(context, blob):
+    scene = context.scene
+    failed = set()
+    try:
+        records, meta = unpack_records(blob)
+        step_timing = dict(meta.get("step_timing", {}))
+        journal = scene.get(JOURNAL_KEY)
+        if journal:
+            base = container.Container(blob)
+            for key in sorted(journal.keys()):
+                meta = _replay_journal_record(records, step_timing, bytes(journal[key]), base, failed)
+        persisted = set(records)
+        for rec in records.values():
+            rec["history"].take_journal()
+    except Exception as e:
+        print(f"Failed to load recorder data: {e}")
         return
+    # 回放失败的对象与存档不一致，下次保存时整份重写
+    state._persist_seq = None if failed else scene.get(SEQUENCE_KEY)
+    state.object_records.clear()
+    for obj_name, rec in records.items():
+        if obj_name in bpy.data.objects:
+            state.object_records[obj_name] = rec
+    state._persisted_objects = persisted
+    state._step_timing = step_timing
+    state.current_display_obj = meta.get("current_display_obj")
+    if state.current_display_obj and state.current_display_obj not in state.object_records:
+        state.current_display_obj = next(iter(state.object_records), None)
+    sync_step_list(context)
+
+    settings = state.get_settings(context)
+    if state.current_display_obj and state.current_display_obj in step_timing:
+        _apply_step_timing(settings, step_timing[state.current_display_obj])
+
+
+def _load_legacy_json(context, payload):
+    """Migration path for data saved as JSON before the binary container"""
+    state._persisted_objects = set()
+    state._persist_seq = None
+    state._step_timing = {}
     try:
-        data = json.loads(scene["mesh_recorder_data"])
+        data = json.loads(payload)
         if "object_records" in data:
             state.object_records.clear()
             for obj_name, rec in data.get("object_records", {}).items():
@@ -66,8 +434,9 @@ def load_from_scene(context):
                     continue
                 state.object_records[obj_name] = {
                     "initial_mesh": deserialize_state(rec.get("initial_mesh")),
-                    "history": [deserialize_state(s) for s in rec.get("history", [])],
+                    "history": StepHistory(deserialize_state(s) for s in rec.get("history", [])),
                     "redo": [],
+                    "correspondence": StepCacheStore(),
                 }
             state.current_display_obj = data.get("current_display_obj")
             if state.current_display_obj and state.current_display_obj not in state.object_records:
@@ -78,8 +447,9 @@ def load_from_scene(context):
             if old_name and old_name in bpy.data.objects:
                 state.object_records[old_name] = {
                     "initial_mesh": deserialize_state(data.get("initial_mesh")),
-                    "history": [deserialize_state(s) for s in data.get("operation_history", [])],
+                    "history": StepHistory(deserialize_state(s) for s in data.get("operation_history", [])),
                     "redo": [],
+                    "correspondence": StepCacheStore(),
                 }
                 state.current_display_obj = old_name
         sync_step_list(context)
@@ -87,13 +457,6 @@ def load_from_scene(context):
         settings = state.get_settings(context)
         step_timing = data.get("step_timing", {})
         if state.current_display_obj and state.current_display_obj in step_timing:
-            timing_list = step_timing[state.current_display_obj]
-            for i, timing in enumerate(timing_list):
-                if i < len(settings.step_items):
-                    settings.step_items[i].use_custom_timing = timing.get("use_custom", False)
-                    settings.step_items[i].cam_duration = timing.get("cam", 0.5)
-                    settings.step_items[i].mesh_duration = timing.get("mesh", 0.5)
-                    settings.step_items[i].marked_edge_indices = timing.get("marked_edges", "")
-                    settings.step_items[i].show_changed_edges = timing.get("show_edges", False)
+            _apply_step_timing(settings, step_timing[state.current_display_obj])
     except Exception as e:
         print(f"Failed to load recorder data: {e}")
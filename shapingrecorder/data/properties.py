@@ -43,6 +43,13 @@ def on_step_select(self, context):
     source_state = initial_mesh if target_idx == 0 else operation_history[target_idx - 1]
     operators.start_interpolated_jump(context, source_state, target_state, target_idx)
 
+def on_scrub(self, context):
+    from ..operators import playback as operators
+
+    if state.is_playing or state.is_recording or state._is_auto_selecting:
+        return
+    operators.scrub_to(context, self.scrub_position * operators.scrub_duration(context))
+
 class MeshRecorderStepItem(bpy.types.PropertyGroup):
     index: bpy.props.IntProperty()
     use_custom_timing: bpy.props.BoolProperty(
@@ -64,6 +71,19 @@ class MeshRecorderSettings(bpy.types.PropertyGroup):
     interp_steps: bpy.props.IntProperty(
         name="Interpolation Steps", default=10, min=1, max=60
     )
+    realtime_playback: bpy.props.BoolProperty(
+        name="Real-time Playback", default=True,
+        description="Sample playback at wall-clock time and drop frames when behind. Frame export always renders every frame",
+    )
+    adaptive_frames: bpy.props.BoolProperty(
+        name="Adaptive Frames", default=False,
+        description="Share the frame budget between steps by how far the mesh and the view move, "
+        "instead of timing every step alike. Steps with custom timing keep it",
+    )
+    frame_budget: bpy.props.IntProperty(
+        name="Frame Budget", default=0, min=0,
+        description="Total frames of the playback range in adaptive mode; 0 keeps the count of uniform timing",
+    )
     playback_start_step: bpy.props.IntProperty(
         name="Start Step", default=1, min=1
     )
@@ -81,6 +101,15 @@ class MeshRecorderSettings(bpy.types.PropertyGroup):
         ],
         default="VIEWPORT",
     )
+    resume_export: bpy.props.BoolProperty(
+        name="Resume Export", default=False,
+        description="Continue an interrupted frame sequence export from the first missing frame, "
+        "as long as the recording and render settings are unchanged",
+    )
+    export_workers: bpy.props.IntProperty(
+        name="Workers", default=1, min=1, max=64,
+        description="Background Blender processes used by Batch Export; each renders a contiguous slice of the frames",
+    )
     step_items: bpy.props.CollectionProperty(type=MeshRecorderStepItem)
     active_step_index: bpy.props.IntProperty(
         name="Active Step", update=on_step_select
@@ -97,6 +126,11 @@ class MeshRecorderSettings(bpy.types.PropertyGroup):
     )
     edge_width: bpy.props.FloatProperty(name="Edge Width", default=2.0, min=1.0, max=10.0)
     edge_glow: bpy.props.FloatProperty(name="Edge Glow", default=0.0, min=0.0, max=5.0)
+    scrub_position: bpy.props.FloatProperty(
+        name="Scrub", default=0.0, min=0.0, max=1.0, subtype="FACTOR",
+        description="Preview any moment of the recording without playing it",
+        update=on_scrub,
+    )
     playback_mode: bpy.props.EnumProperty(
         name="Playback Mode",
         items=[
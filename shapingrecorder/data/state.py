@@ -14,7 +14,14 @@ target_obj_name = None
 interp_progress = 0.0
 
 _locked_objects = []  
+_recording_dirty = True
 _step_cache = None
+_playback_mesh = None
+_clock = None
+_timeline = None
+_frames = None
+_scrub = None
+_playback_stats = None
 _highlight_obj_name = "__MeshRecorder_NewEdges"
 _render_frame_idx = 0
 _view_lock_state = {}
@@ -29,12 +36,22 @@ _is_auto_selecting = False
 _prev_selection = None
 _temp_frame_dir = None
 _is_video_export = False
+_export_session = None
+_export_report = None
 _total_export_frames = 0
 _vse_backup = None
 _edge_draw_handler = None
 _current_edge_coords = []
 _is_marking_edge = False
 _marking_step_index = -1
+_persisted_objects = set()
+_persist_seq = None
+_step_timing = {}
+_precompute_executor = None
+_precompute_jobs = {}
+_precompute_done = 0
+_precompute_total = 0
+_precompute_unsaved = False
 
 
 def get_current_record():
@@ -0,0 +1,319 @@
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import traceback
+
+import bpy
+
+from ..data import persistence
+from ..data import state
+from ..utils import export as export_utils
+from ..utils import precompute
+from ..utils import view as view_utils
+from ..core.mesh_ops import InterpolationKernel
+from .playback import (
+    apply_state_to_object,
+    build_timeline,
+    ensure_object_mode,
+    get_step_cache,
+    resolve_playback_range,
+)
+
+
+def _save_camera(cam):
+    if not cam:
+        return None
+    return cam.location.copy(), cam.rotation_mode, cam.rotation_quaternion.copy(), cam.rotation_euler.copy()
+
+
+def _restore_camera(cam, saved):
+    if not cam or not saved:
+        return
+    cam.location, cam.rotation_mode, cam.rotation_quaternion, cam.rotation_euler = saved
+
+
+def export_frames(context, mode="range", frame_range=None, out_dir=None, prefix=None, render_mode="FINAL"):
+    """
+    Render the playback range synchronously, one frame after another,
+    without timers, overlays or view locking, so it also runs under
+    `blender -b`. Frames come from Timeline.frames at the fixed playback
+    frame time, the same sequence fixed-clock playback shows, and are
+    written as <prefix>_<frame>.<ext>.
+    Frames identical to the previous one are linked instead of rendered.
+
+    frame_range (first, last), inclusive global frame indices, limits
+    the export to part of the sequence. Returns a stats dict, or None
+    when there is nothing to export; "missing" counts the frames of the
+    range the renderer did not write. Errors propagate to the caller;
+    the object's mesh, the view and the camera are restored either way.
+    """
+    operation_history = state.get_current_history()
+    initial_mesh = state.get_current_initial_mesh()
+    obj = state.get_recorded_object()
+    if not obj or not operation_history or state.is_recording or state.is_playing:
+        return None
+
+    ensure_object_mode(context, obj)
+    settings = state.get_settings(context)
+    scene = context.scene
+    start_idx, end_idx = resolve_playback_range(settings, len(operation_history), mode)
+    timeline = build_timeline(context, start_idx, end_idx)
+    frame_time = settings.step_duration / max(1, settings.interp_steps)
+    frame_count = timeline.frame_count(frame_time)
+    first, last = frame_range if frame_range else (0, frame_count - 1)
+    last = min(last, frame_count - 1)
+    if first > last:
+        return None
+    expected = last - first + 1
+
+    out_dir = out_dir or export_utils.output_dir(scene)
+    os.makedirs(out_dir, exist_ok=True)
+    prefix = prefix or settings.render_prefix
+
+    prev_path = scene.render.filepath
+    prev_format = scene.render.image_settings.file_format
+    file_format = "PNG" if prev_format in export_utils.MOVIE_FORMATS else prev_format
+    ext = export_utils.frame_extension(file_format)
+
+    # 原网格加假用户，免得第一帧切换到回放网格时被删除
+    prev_mesh = obj.data
+    prev_fake_user = prev_mesh.use_fake_user
+    prev_mesh.use_fake_user = True
+    state._playback_mesh = None
+    prev_view = view_utils.save_view_state(context)
+    prev_camera = _save_camera(scene.camera)
+
+    kernel_step = None
+    kernel = None
+    rendered = 0
+    reused = 0
+    last_frame = None
+    start = time.perf_counter()
+    try:
+        scene.render.image_settings.file_format = file_format
+        for frame, step, cam_t, mesh_t, end in timeline.frames(frame_time, first):
+            if frame > last:
+                break
+            target_state = operation_history[step]
+            source_state = initial_mesh if step == 0 else operation_history[step - 1]
+            if step != kernel_step:
+                kernel = InterpolationKernel(source_state, target_state, get_step_cache(source_state, target_state))
+                kernel_step = step
+
+            camera = view_utils.interpolate_camera_state(source_state.camera, target_state.camera, cam_t)
+            view = None
+            if render_mode == "VIEWPORT":
+                view = view_utils.interpolate_view_state(source_state.view, target_state.view, cam_t)
+                view_utils.apply_view_state(context, view)
+            view_utils.apply_camera_state(context, camera)
+            apply_state_to_object(obj, target_state.with_coords(kernel.evaluate(mesh_t)))
+
+            filepath = os.path.join(out_dir, f"{prefix}_{frame:04d}{ext}")
+            if end:
+                mesh_key = ("end", target_state.hash)
+            else:
+                mesh_key = ("step", step, source_state.hash, target_state.hash, round(mesh_t, 6))
+            fingerprint = export_utils.frame_fingerprint(mesh_key, camera, view)
+            if fingerprint is not None and last_frame and last_frame[0] == fingerprint and export_utils.reuse_frame(last_frame[1], filepath):
+                reused += 1
+                continue
+
+            scene.render.filepath = filepath
+            if render_mode == "VIEWPORT":
+                bpy.ops.render.opengl(write_still=True, view_context=True)
+            else:
+                bpy.ops.render.render(write_still=True, use_viewport=False)
+            written = os.path.exists(filepath)
+            if written:
+                rendered += 1
+            else:
+                print(f"Frame {frame} was not written")
+            last_frame = (fingerprint, filepath) if fingerprint is not None and written else None
+    finally:
+        scene.render.filepath = prev_path
+        scene.render.image_settings.file_format = prev_format
+        export_mesh = obj.data
+        obj.data = prev_mesh
+        prev_mesh.use_fake_user = prev_fake_user
+        if export_mesh != prev_mesh and export_mesh.users == 0:
+            bpy.data.meshes.remove(export_mesh)
+        state._playback_mesh = None
+        view_utils.apply_view_state(context, prev_view)
+        _restore_camera(scene.camera, prev_camera)
+
+    elapsed = time.perf_counter() - start
+    frames = rendered + reused
+    print(
+        f"Batch export: {frames} frames ({first}-{last}, {reused} reused) in {elapsed:.1f}s, "
+        f"{frames / elapsed if elapsed > 0 else 0.0:.2f} frames/s -> {out_dir}"
+    )
+    if frames < expected:
+        print(f"  {expected - frames} of {expected} frames missing")
+    return {
+        "frames": frames,
+        "missing": expected - frames,
+        "rendered": rendered,
+        "reused": reused,
+        "first": first,
+        "last": last,
+        "seconds": elapsed,
+        "out_dir": out_dir,
+    }
+
+
+def split_frames(first, last, workers):
+    """Split [first, last] into at most `workers` contiguous, near-equal ranges"""
+    total = last - first + 1
+    workers = max(1, min(workers, total))
+    ranges = []
+    start = first
+    for i in range(workers):
+        size = total // workers + (1 if i < total % workers else 0)
+        ranges.append((start, start + size - 1))
+        start += size
+    return ranges
+
+
+def export_frames_parallel(context, workers, mode="range", out_dir=None, prefix=None, frame_range=None):
+    """
+    Render the playback range with `workers` background Blender processes.
+
+    The current file (with the recording flushed into it) is saved as a
+    temporary copy, the frame range is split into contiguous chunks, and
+    each chunk is rendered by `blender -b <copy> --python batch_render.py`
+    into the same directory. Frame files carry their global index, so the
+    sequence needs no stitching. Render threads are divided between the
+    workers. A chunk counts as failed when its worker exits non-zero or
+    any of its frames is missing or incomplete on disk afterwards. Errors
+    saving the copy or launching a worker propagate to the caller after
+    the workers already started are stopped.
+    """
+    operation_history = state.get_current_history()
+    obj = state.get_recorded_object()
+    if not obj or not operation_history or state.is_recording or state.is_playing:
+        return None
+
+    settings = state.get_settings(context)
+    scene = context.scene
+    start_idx, end_idx = resolve_playback_range(settings, len(operation_history), mode)
+    frame_time = settings.step_duration / max(1, settings.interp_steps)
+    frame_count = build_timeline(context, start_idx, end_idx).frame_count(frame_time)
+    first, last = frame_range or (0, frame_count - 1)
+    last = min(last, frame_count - 1)
+    if first > last:
+        return None
+    out_dir = os.path.abspath(out_dir or export_utils.output_dir(scene))
+    prefix = prefix or settings.render_prefix
+    file_format = scene.render.image_settings.file_format
+    ext = export_utils.frame_extension("PNG" if file_format in export_utils.MOVIE_FORMATS else file_format)
+    chunks = split_frames(first, last, workers)
+    threads = max(1, (os.cpu_count() or 1) // len(chunks))
+    script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "batch_render.py")
+
+    persistence.save_to_scene(context)
+    temp_dir = tempfile.mkdtemp(prefix="shapingrecorder_")
+    blend_copy = os.path.join(temp_dir, "export.blend")
+    start = time.perf_counter()
+    failed = []
+    processes = []
+    wm = context.window_manager
+    try:
+        bpy.ops.wm.save_as_mainfile(filepath=blend_copy, copy=True)
+        for chunk_first, chunk_last in chunks:
+            cmd = [
+                bpy.app.binary_path, "-b", blend_copy, "-t", str(threads),
+                "--python", script, "--",
+                "--object", obj.name, "--mode", mode,
+                "--frames", f"{chunk_first}-{chunk_last}",
+                "--output", out_dir, "--prefix", prefix,
+            ]
+            processes.append(((chunk_first, chunk_last), subprocess.Popen(cmd, stdout=subprocess.DEVNULL)))
+        # 有意阻塞到所有分块完成：并行导出面向渲染节点和“导出完再继续”的用法，
+        # 界面期间不响应，只有进度光标随分块完成推进
+        wm.progress_begin(0, len(processes))
+        for done, ((chunk_first, chunk_last), process) in enumerate(processes, 1):
+            code = process.wait()
+            wm.progress_update(done)
+            written = sum(
+                export_utils.frame_complete(os.path.join(out_dir, f"{prefix}_{frame:04d}{ext}"))
+                for frame in range(chunk_first, chunk_last + 1)
+            )
+            if code != 0 or written < chunk_last - chunk_first + 1:
+                failed.append((chunk_first, chunk_last, written))
+    finally:
+        wm.progress_end()
+        for _, process in processes:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    elapsed = time.perf_counter() - start
+    frames = last - first + 1 - sum(b - a + 1 - written for a, b, written in failed)
+    print(
+        f"Parallel export: {frames} frames ({first}-{last}) with {len(chunks)} workers in {elapsed:.1f}s, "
+        f"{frames / elapsed if elapsed > 0 else 0.0:.2f} frames/s -> {out_dir}"
+    )
+    for a, b, written in failed:
+        print(f"  worker for frames {a}-{b} failed ({written} of {b - a + 1} frames written)")
+    return {
+        "frames": frames,
+        "missing": last - first + 1 - frames,
+        "first": first,
+        "last": last,
+        "workers": len(chunks),
+        "seconds": elapsed,
+        "failed": failed,
+        "out_dir": out_dir,
+    }
+
+
+def _parse_frame_range(text):
+    first, _, last = text.partition("-")
+    return int(first), int(last or first)
+
+
+def run_cli(argv):
+    """
+    Entry point of batch_render.py, for use with `blender -b file.blend`.
+    argv are the arguments after "--".
+    """
+    parser = argparse.ArgumentParser(prog="batch_render.py")
+    parser.add_argument("--object", help="recorded object to export (default: the one last displayed)")
+    parser.add_argument("--mode", choices=("start", "active", "range"), default="range")
+    parser.add_argument("--frames", type=_parse_frame_range, help="frame range FIRST-LAST, inclusive")
+    parser.add_argument("--output", help="output directory (default: the scene output path)")
+    parser.add_argument("--prefix", help="file prefix (default: the File Prefix setting)")
+    parser.add_argument("--workers", type=int, default=1, help="render with this many background Blender processes")
+    args = parser.parse_args(argv)
+
+    # 后台渲染不需要预计算线程，缺少的缓存按需计算
+    precompute.shutdown()
+    context = bpy.context
+    if not state.object_records:
+        persistence.load_from_scene(context)
+    if args.object:
+        if args.object not in state.object_records:
+            print(f"No recording for object {args.object}")
+            return 1
+        state.current_display_obj = args.object
+        persistence.sync_step_list(context)
+        persistence.apply_saved_step_timing(context)
+
+    out_dir = bpy.path.abspath(args.output) if args.output else None
+    try:
+        if args.workers > 1:
+            stats = export_frames_parallel(
+                context, args.workers, mode=args.mode, out_dir=out_dir, prefix=args.prefix, frame_range=args.frames
+            )
+            return 0 if stats and not stats["failed"] else 1
+        stats = export_frames(context, mode=args.mode, frame_range=args.frames, out_dir=out_dir, prefix=args.prefix)
+    except Exception:
+        # blender -b 不会因脚本异常返回非零，这里自己打印并报告失败
+        traceback.print_exc()
+        return 1
+    # 只有区间内每一帧都写出才算成功，父进程据此判断分块是否失败
+    return 0 if stats and stats["frames"] and not stats["missing"] else 1
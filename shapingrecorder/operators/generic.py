@@ -1,6 +1,7 @@
 import bpy
 import bmesh
 import json
+import time
 
 from bpy.app.translations import pgettext_iface as iface_
 
@@ -8,12 +9,16 @@ from ..utils import graphics
 from ..data import state
 from ..utils import view as view_utils
 from ..utils.handlers import depsgraph_update_handler, load_post_handler
-from ..data.persistence import load_from_scene, save_to_scene, sync_step_list
+from ..data.persistence import compact_history, load_from_scene, save_to_scene, sync_step_list
+from ..core import compaction
+from ..utils import precompute
+from . import batch
 from .playback import (
     jump_step,
     jump_to_state_immediate,
     play_forward,
     play_step,
+    scrub_to,
     start_interpolated_jump,
     stop_playing,
 )
@@ -132,6 +137,61 @@ class RestoreStepOperator(bpy.types.Operator):
         save_to_scene(context)
         return {"FINISHED"}
 
+def _compaction_breaks(settings, initial_mesh, operation_history):
+    """Steps compaction must keep: view or camera changes, custom timing and marked edges"""
+    breaks = {
+        item.index for item in settings.step_items
+        if item.index >= 0 and (item.use_custom_timing or item.marked_edge_indices)
+    }
+    prev_view, prev_camera = initial_mesh.view, initial_mesh.camera
+    for i in range(len(operation_history)):
+        meta = operation_history.meta(i)
+        if (view_utils.view_state_changed(prev_view, meta["view"])
+                or view_utils.camera_state_changed(prev_camera, meta["camera"])):
+            breaks.add(i)
+        prev_view, prev_camera = meta["view"], meta["camera"]
+    return breaks
+
+class CompactStepsOperator(bpy.types.Operator):
+    bl_idname = "mesh.compact_recorder_steps"
+    bl_label = "Compact Steps"
+    bl_description = "Merge runs of consecutive small steps with unchanged topology into single steps"
+    bl_options = {"REGISTER", "UNDO"}
+    threshold: bpy.props.FloatProperty(
+        name="Max Movement", default=0.01, min=0.0, max=1.0, precision=4,
+        description="Largest vertex movement a merged step may add up to, as a fraction of the model size",
+    )
+    max_steps: bpy.props.IntProperty(
+        name="Max Steps", default=0, min=0,
+        description="Raise the movement limit until at most this many steps remain (0: no limit)",
+    )
+    @classmethod
+    def poll(cls, context):
+        return not state.is_recording and not state.is_playing and bool(state.get_current_history())
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+    def execute(self, context):
+        operation_history = state.get_current_history()
+        initial_mesh = state.get_current_initial_mesh()
+        settings = state.get_settings(context)
+        start = time.perf_counter()
+        before = len(operation_history)
+        keep = _compaction_breaks(settings, initial_mesh, operation_history)
+        kept, _ = compaction.plan_compaction_limited(
+            initial_mesh, operation_history, self.threshold, keep, self.max_steps
+        )
+        if len(kept) < before:
+            if state._deleted_step and state._deleted_step.get("obj_name") == state.current_display_obj:
+                state._deleted_step = None
+            state._scrub = None
+            state._step_cache = None
+            compact_history(context, kept)
+            precompute.submit_missing(state.current_display_obj)
+        self.report({"INFO"}, iface_("Steps: {before} -> {after} ({s:.2f}s)").format(
+            before=before, after=len(kept), s=time.perf_counter() - start
+        ))
+        return {"FINISHED"}
+
 class ResetStepViewOperator(bpy.types.Operator):
     bl_idname = "mesh.reset_step_view"
     bl_label = "Reset Camera"
@@ -157,7 +217,7 @@ class ConfirmStepViewOperator(bpy.types.Operator):
         settings = state.get_settings(context)
         item = settings.step_items[settings.active_step_index]
         operation_history = state.get_current_history()
-        operation_history[item.index]["view"] = view_utils.save_view_state(context)
+        operation_history.update_meta(item.index, view=view_utils.save_view_state(context))
         save_to_scene(context)
         state._is_resetting_view = False
         return {"FINISHED"}
@@ -192,6 +252,36 @@ class RecordUnifiedOperator(bpy.types.Operator):
         play_forward(context, export_frames=True, mode=mode)
         return {"FINISHED"}
 
+class BatchExportOperator(bpy.types.Operator):
+    bl_idname = "mesh.batch_export_frames"
+    bl_label = "Batch Export"
+    bl_description = "Render every frame of the playback range with the scene render engine, without live playback"
+    bl_options = {"REGISTER"}
+    @classmethod
+    def poll(cls, context):
+        return not state.is_recording and not state.is_playing and bool(state.get_current_history())
+    def execute(self, context):
+        settings = state.get_settings(context)
+        if settings.playback_mode == "ACTIVE" and not _require_active_step(self, context):
+            return {"CANCELLED"}
+        mode = {"START": "start", "ACTIVE": "active", "RANGE": "range"}.get(settings.playback_mode, "range")
+        try:
+            if settings.export_workers > 1:
+                stats = batch.export_frames_parallel(context, settings.export_workers, mode=mode)
+            else:
+                stats = batch.export_frames(context, mode=mode)
+        except Exception as e:
+            self.report({"ERROR"}, iface_("Batch export failed: {error}").format(error=e))
+            return {"CANCELLED"}
+        if not stats:
+            return {"CANCELLED"}
+        if stats["missing"]:
+            total = stats["frames"] + stats["missing"]
+            self.report({"WARNING"}, iface_("Export incomplete: {n} of {total} frames written").format(n=stats["frames"], total=total))
+            return {"FINISHED"}
+        self.report({"INFO"}, iface_("Exported {n} frames in {s:.1f}s").format(n=stats["frames"], s=stats["seconds"]))
+        return {"FINISHED"}
+
 class SetStartStepOperator(bpy.types.Operator):
     bl_idname = "mesh.set_start_step"
     bl_label = "Set Start"
@@ -222,6 +312,23 @@ class SetEndStepOperator(bpy.types.Operator):
             settings.playback_end_step = new_end
         return {"FINISHED"}
 
+class ScrubRecorderOperator(bpy.types.Operator):
+    bl_idname = "mesh.scrub_recorder"
+    bl_label = "Scrub Recording"
+    bl_options = {"REGISTER"}
+    time: bpy.props.FloatProperty(name="Time", min=0.0, description="Global playback time in seconds")
+    @classmethod
+    def poll(cls, context):
+        return not state.is_recording and not state.is_playing and bool(state.get_current_history())
+    def execute(self, context):
+        start = time.perf_counter()
+        step = scrub_to(context, self.time)
+        if step is None:
+            return {"CANCELLED"}
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        self.report({"INFO"}, iface_("Step {n} at {t:.2f}s ({ms:.1f} ms)").format(n=step + 1, t=self.time, ms=elapsed_ms))
+        return {"FINISHED"}
+
 class ToggleChangedEdgesOperator(bpy.types.Operator):
     bl_idname = "mesh.toggle_changed_edges"
     bl_label = "Toggle Highlighted Edges"
@@ -1,13 +1,20 @@
-import os
-
-import bmesh
 import bpy
+import numpy as np
 
 from ..utils import export as export_utils
 from ..utils import graphics
 from ..data import state
 from ..utils import view as view_utils
-from ..core.mesh_ops import compute_step_cache, interpolate_states_cached, update_mesh_vertices
+from ..core import clock
+from ..core.step_cache import StepCacheStore
+from ..core.timeline import Timeline, allocate_frames
+from ..core.mesh_ops import (
+    InterpolationKernel,
+    compute_step_cache,
+    fill_mesh,
+    mesh_matches_topology,
+    update_mesh_vertices,
+)
 
 
 def ensure_object_mode(context, obj):
@@ -24,34 +31,150 @@ def get_step_timing(context, step_index):
     return settings.global_cam_duration, settings.global_mesh_duration
 
 
+def build_timeline(context, start_idx, end_idx):
+    """Compile per-step timings and view-change flags of a playback range once"""
+    settings = state.get_settings(context)
+    operation_history = state.get_current_history()
+    initial_mesh = state.get_current_initial_mesh()
+    rec = state.get_current_record()
+    custom = {
+        item.index: (item.cam_duration, item.mesh_duration)
+        for item in settings.step_items
+        if item.use_custom_timing
+    }
+    default = (settings.global_cam_duration, settings.global_mesh_duration)
+
+    if start_idx == 0:
+        prev_view, prev_camera, prev_hash = initial_mesh.view, initial_mesh.camera, initial_mesh.hash
+    else:
+        prev_meta = operation_history.meta(start_idx - 1)
+        prev_view, prev_camera, prev_hash = prev_meta["view"], prev_meta["camera"], prev_meta["hash"]
+
+    cam_durations, mesh_durations, changed, weights = [], [], [], []
+    for i in range(start_idx, end_idx + 1):
+        meta = operation_history.meta(i)
+        changed.append(
+            view_utils.view_state_changed(prev_view, meta["view"])
+            or view_utils.camera_state_changed(prev_camera, meta["camera"])
+        )
+        cam_dur, mesh_dur = custom.get(i, default)
+        cam_durations.append(cam_dur)
+        mesh_durations.append(mesh_dur)
+        if settings.adaptive_frames and i not in custom:
+            motion = rec["correspondence"].motion(StepCacheStore.hash_key(prev_hash, meta["hash"]))
+            weights.append(_step_weights(motion, prev_view, prev_camera, meta))
+        prev_view, prev_camera, prev_hash = meta["view"], meta["camera"], meta["hash"]
+    timeline = Timeline(start_idx, cam_durations, mesh_durations, changed)
+    if settings.adaptive_frames:
+        timeline = _adaptive_timeline(settings, timeline, custom, weights)
+    return timeline
+
+
+def _step_weights(motion, prev_view, prev_camera, meta):
+    """
+    (camera weight, mesh weight) of a step in screen-size units, from the
+    step motion stored with its cache; None when the step has no cache yet.
+    """
+    if motion is None:
+        return None
+    max_disp, mean_disp, diag = motion
+    cam_weight = max(
+        view_utils.view_change_amount(prev_view, meta["view"]),
+        view_utils.camera_change_amount(prev_camera, meta["camera"], diag),
+    )
+    return cam_weight, 0.5 * (max_disp + mean_disp) / diag
+
+
+def _adaptive_timeline(settings, timeline, custom, weights):
+    """
+    Re-time the steps without custom timing so their frame counts follow
+    their motion: settings.frame_budget frames (0: as many as uniform
+    timing gives) are shared in proportion to the camera and mesh weights,
+    with at least one frame per phase. Weights come only from stored step
+    caches; steps whose cache is not computed yet keep uniform timing and
+    their frames are taken off the budget.
+    """
+    frame_time = settings.step_duration / max(1, settings.interp_steps)
+    steps = [i for i in range(timeline.first_step, timeline.last_step + 1) if i not in custom]
+    budget = settings.frame_budget or sum(timeline.step_frame_count(i, frame_time) for i in steps)
+    budget -= sum(timeline.step_frame_count(i, frame_time) for i, w in zip(steps, weights) if w is None)
+    weighted = [(i, w) for i, w in zip(steps, weights) if w is not None]
+    flat_weights, minimums = [], []
+    for i, (cam_weight, mesh_weight) in weighted:
+        changed = timeline.span(i)[2]
+        flat_weights += [cam_weight if changed else 0.0, mesh_weight]
+        minimums += [1 if changed else 0, 1]
+    counts = allocate_frames(flat_weights, budget, minimums)
+
+    cam, mesh = list(timeline.cam), list(timeline.mesh)
+    for k, (i, _) in enumerate(weighted):
+        cam[i - timeline.first_step] = counts[2 * k] * frame_time
+        mesh[i - timeline.first_step] = counts[2 * k + 1] * frame_time
+    return Timeline(timeline.first_step, cam, mesh, timeline.changed)
+
+
+def get_step_cache(source_state, target_state):
+    """Interpolation cache of a step pair, reused from the recording when stored"""
+    rec = state.get_current_record()
+    if not rec:
+        return compute_step_cache(source_state, target_state)
+    return rec["correspondence"].get(source_state, target_state)
+
+
 def create_mesh_from_state(state_data, name="playback_mesh"):
     mesh = bpy.data.meshes.new(name)
-    bm = bmesh.new()
-    for co in state_data["verts"]:
-        bm.verts.new(co)
-    bm.verts.ensure_lookup_table()
-    for e in state_data["edges"]:
-        if e[0] < len(bm.verts) and e[1] < len(bm.verts):
-            try:
-                bm.edges.new((bm.verts[e[0]], bm.verts[e[1]]))
-            except ValueError:
-                pass
-    for f in state_data["faces"]:
-        try:
-            bm.faces.new([bm.verts[i] for i in f])
-        except ValueError:
-            pass
-    bm.to_mesh(mesh)
-    bm.free()
+    if fill_mesh(mesh, state_data):
+        print(f"Invalid geometry removed while building {mesh.name}")
     return mesh
 
 
+def _same_topology_arrays(a, b):
+    return all(x is y or np.array_equal(x, y) for x, y in zip(a, b))
+
+
 def apply_state_to_object(obj, state_data, name_suffix="playback"):
+    """
+    Show a state on obj. The playback mesh datablock created here is kept
+    and reused: only coordinates are written while the topology stays the
+    same, and it is refilled in place when the topology changes. The cached
+    topology is dropped by the undo and depsgraph handlers as soon as the
+    mesh is changed by anything but this function.
+    """
+    topology = (state_data.edges, state_data.face_offsets, state_data.face_indices)
+    mesh = obj.data
+    owned = state._playback_mesh if state._playback_mesh and state._playback_mesh["name"] == mesh.name else None
+
+    if owned and mesh.users == 1:
+        if mesh_matches_topology(mesh, state_data) and _same_topology_arrays(owned["topology"], topology):
+            update_mesh_vertices(mesh, state_data.coords)
+        elif fill_mesh(mesh, state_data):
+            print(f"Invalid geometry removed while building {mesh.name}")
+            state._playback_mesh = None
+            return
+        owned["topology"] = topology
+        owned["own_update"] = True
+        return
+
     new_mesh = create_mesh_from_state(state_data, name=f"{obj.name}_{name_suffix}")
     old_mesh = obj.data
     obj.data = new_mesh
     if old_mesh and old_mesh.users == 0:
         bpy.data.meshes.remove(old_mesh)
+    if mesh_matches_topology(new_mesh, state_data):
+        state._playback_mesh = {"name": new_mesh.name, "topology": topology, "own_update": True}
+    else:
+        state._playback_mesh = None
+
+
+def begin_step_mesh(obj, target_state, kernel):
+    """
+    Switch obj to the target topology once at the start of a step, placed
+    at the kernel's start positions, so every following frame of the step
+    only writes vertex coordinates. Topology-preserving steps only rewrite
+    the coordinates; steps that change topology (including ones that keep
+    the vertex count) refill the mesh once here.
+    """
+    apply_state_to_object(obj, target_state.with_coords(kernel.evaluate(0.0)))
 
 
 def jump_to_state_immediate(context, state_data):
@@ -60,8 +183,8 @@ def jump_to_state_immediate(context, state_data):
         return
     ensure_object_mode(context, obj)
     apply_state_to_object(obj, state_data)
-    view_utils.apply_view_state(context, state_data.get("view"))
-    view_utils.apply_camera_state(context, state_data.get("camera"))
+    view_utils.apply_view_state(context, state_data.view)
+    view_utils.apply_camera_state(context, state_data.camera)
 
 
 def start_interpolated_jump(context, source_state, target_state, step_index=0):
@@ -70,11 +193,12 @@ def start_interpolated_jump(context, source_state, target_state, step_index=0):
         return
     ensure_object_mode(context, obj)
     settings = state.get_settings(context)
-    apply_state_to_object(obj, source_state)
-    view_utils.apply_view_state(context, source_state.get("view"))
-    cache = compute_step_cache(source_state, target_state)
+    cache = get_step_cache(source_state, target_state)
+    kernel = InterpolationKernel(source_state, target_state, cache)
+    begin_step_mesh(obj, target_state, kernel)
+    view_utils.apply_view_state(context, source_state.view)
     cam_dur, mesh_dur = get_step_timing(context, step_index)
-    cam_changed = view_utils.view_state_changed(source_state.get("view"), target_state.get("view"))
+    cam_changed = view_utils.view_state_changed(source_state.view, target_state.view)
 
     source_step_idx = step_index
     edge_indices = graphics.get_edge_indices_for_step(source_step_idx)
@@ -84,7 +208,7 @@ def start_interpolated_jump(context, source_state, target_state, step_index=0):
     state._jump_state = {
         "source": source_state,
         "target": target_state,
-        "cache": cache,
+        "kernel": kernel,
         "elapsed": 0.0,
         "cam_duration": cam_dur if cam_changed else 0.0,
         "mesh_duration": mesh_dur,
@@ -93,6 +217,9 @@ def start_interpolated_jump(context, source_state, target_state, step_index=0):
     state.is_playing = True
     total_dur = state._jump_state["cam_duration"] + state._jump_state["mesh_duration"]
     interval = total_dur / max(1, settings.interp_steps)
+    jump_clock = clock.PlaybackClock(clock.REALTIME, interval)
+    jump_clock.start()
+    state._jump_state["clock"] = jump_clock
     bpy.app.timers.register(lambda: jump_step(context), first_interval=interval)
 
 
@@ -107,16 +234,15 @@ def jump_step(context):
         state._jump_state = None
         return None
 
-    settings = state.get_settings(context)
     cam_duration = state._jump_state["cam_duration"]
     mesh_duration = state._jump_state["mesh_duration"]
     total_duration = cam_duration + mesh_duration
-    interval = total_duration / max(1, settings.interp_steps)
-    state._jump_state["elapsed"] += interval
+    jump_clock = state._jump_state["clock"]
+    state._jump_state["elapsed"] += jump_clock.tick()
     elapsed = state._jump_state["elapsed"]
     source = state._jump_state["source"]
     target = state._jump_state["target"]
-    cache = state._jump_state["cache"]
+    kernel = state._jump_state["kernel"]
     source_step_idx = state._jump_state.get("source_step_idx", -1)
 
     if cam_duration > 0 and elapsed < cam_duration:
@@ -127,13 +253,13 @@ def jump_step(context):
         mesh_elapsed = elapsed - cam_duration if cam_duration > 0 else elapsed
         mesh_t = min(mesh_elapsed / max(mesh_duration, 1e-6), 1.0)
 
-    view_utils.apply_view_state(context, view_utils.interpolate_view_state(source.get("view"), target.get("view"), cam_t))
-    view_utils.apply_camera_state(context, view_utils.interpolate_camera_state(source.get("camera"), target.get("camera"), cam_t))
+    view_utils.apply_view_state(context, view_utils.interpolate_view_state(source.view, target.view, cam_t))
+    view_utils.apply_camera_state(context, view_utils.interpolate_camera_state(source.camera, target.camera, cam_t))
 
     if mesh_t > 0:
-        new_verts, topo = interpolate_states_cached(source, target, mesh_t, cache)
+        new_verts = kernel.evaluate(mesh_t)
         if not update_mesh_vertices(obj.data, new_verts):
-            apply_state_to_object(obj, {"verts": new_verts, "edges": topo["edges"], "faces": topo["faces"]})
+            apply_state_to_object(obj, target.with_coords(new_verts))
 
         graphics.update_edge_draw_coords(source_step_idx)
 
@@ -141,7 +267,92 @@ def jump_step(context):
         state.is_playing = False
         state._jump_state = None
         return None
-    return interval
+    return jump_clock.next_interval()
+
+
+def _scrub_timeline(context):
+    """Timeline of the whole recording, rebuilt only when steps or timings change"""
+    settings = state.get_settings(context)
+    operation_history = state.get_current_history()
+    signature = (
+        state.current_display_obj,
+        tuple(operation_history.hashes()),
+        settings.global_cam_duration,
+        settings.global_mesh_duration,
+        (settings.adaptive_frames, settings.frame_budget, settings.step_duration, settings.interp_steps),
+        tuple(
+            (item.index, item.cam_duration, item.mesh_duration)
+            for item in settings.step_items
+            if item.use_custom_timing
+        ),
+    )
+    scrub = state._scrub
+    if scrub is None or scrub["signature"] != signature:
+        scrub = state._scrub = {
+            "signature": signature,
+            "timeline": build_timeline(context, 0, len(operation_history) - 1),
+            "step": None,
+            "kernel": None,
+        }
+    return scrub
+
+
+def scrub_to(context, t):
+    """
+    Show the recording at global time t in one shot: the step is found by
+    bisecting the timeline, the mesh comes from the step cache and the
+    interpolation kernel, the view is interpolated directly.
+    Returns the step index shown, or None.
+    """
+    operation_history = state.get_current_history()
+    initial_mesh = state.get_current_initial_mesh()
+    obj = state.get_recorded_object()
+    if not obj or not operation_history or state.is_playing or state.is_recording:
+        return None
+    ensure_object_mode(context, obj)
+
+    scrub = _scrub_timeline(context)
+    step, _, cam_t, mesh_t = scrub["timeline"].locate(t)
+    target_state = operation_history[step]
+    source_state = initial_mesh if step == 0 else operation_history[step - 1]
+
+    step_changed = scrub["step"] != step
+    if step_changed:
+        cache = get_step_cache(source_state, target_state)
+        scrub["kernel"] = InterpolationKernel(source_state, target_state, cache)
+        scrub["step"] = step
+
+    # 拓扑相同时只写坐标；网格被其他操作替换过时会在这里重建一次
+    apply_state_to_object(obj, target_state.with_coords(scrub["kernel"].evaluate(mesh_t)))
+    if step_changed:
+        graphics.update_mesh_new_edge_attribute(obj, graphics.get_edge_indices_for_step(step))
+    graphics.update_edge_draw_coords(step)
+
+    view_utils.apply_view_state(context, view_utils.interpolate_view_state(source_state.view, target_state.view, cam_t))
+    view_utils.apply_camera_state(context, view_utils.interpolate_camera_state(source_state.camera, target_state.camera, cam_t))
+    return step
+
+
+def scrub_duration(context):
+    if not state.get_current_history():
+        return 0.0
+    return _scrub_timeline(context)["timeline"].duration
+
+
+def resolve_playback_range(settings, step_count, mode="range"):
+    """Return the (start, end) step indices played for a playback mode"""
+    if mode == "start":
+        start_idx = 0
+        end_idx = step_count - 1
+    elif mode == "active":
+        idx = settings.active_step_index
+        start_idx = max(0, idx - 1) if idx > 0 else 0
+        end_idx = step_count - 1
+    else:
+        start_idx = max(0, min(step_count - 1, settings.playback_start_step - 1))
+        end_idx = (settings.playback_end_step - 1 if settings.playback_end_step > 0 else step_count - 1)
+        end_idx = max(start_idx, min(step_count - 1, end_idx))
+    return start_idx, end_idx
 
 
 def play_forward(context, export_frames=False, mode="range"):
@@ -162,42 +373,47 @@ def play_forward(context, export_frames=False, mode="range"):
 
     state._is_video_export = False
     state._temp_frame_dir = None
-    if export_frames:
-        scene = context.scene
-        movie_formats = {"FFMPEG", "AVI_JPEG", "AVI_RAW"}
-        if scene.render.image_settings.file_format in movie_formats:
-            state._is_video_export = True
-            base_path = bpy.path.abspath(scene.render.filepath)
-            out_dir = os.path.dirname(base_path) if base_path else bpy.path.abspath("//")
-            state._temp_frame_dir = os.path.join(out_dir, "_temp_frames")
-            os.makedirs(state._temp_frame_dir, exist_ok=True)
+    start_idx, end_idx = resolve_playback_range(settings, len(operation_history), mode)
+    timeline = build_timeline(context, start_idx, end_idx)
+    interval = settings.step_duration / max(1, settings.interp_steps)
 
-    if mode == "start":
-        start_idx = 0
-        end_idx = len(operation_history) - 1
-    elif mode == "active":
-        idx = settings.active_step_index
-        start_idx = max(0, idx - 1) if idx > 0 else 0
-        end_idx = len(operation_history) - 1
-    else:
-        start_idx = max(0, min(len(operation_history) - 1, settings.playback_start_step - 1))
-        end_idx = (settings.playback_end_step - 1 if settings.playback_end_step > 0 else len(operation_history) - 1)
-        end_idx = max(start_idx, min(len(operation_history) - 1, end_idx))
+    first_step, first_frame = start_idx, 0
+    state._export_session = None
+    if export_frames:
+        state._export_report = None
+        # 哈希取自步骤元数据，不解码几何
+        hashes = [initial_mesh.hash if start_idx == 0 else operation_history.meta(start_idx - 1)["hash"]]
+        hashes += operation_history.hashes()[start_idx:end_idx + 1]
+        frame_count = timeline.frame_count(interval)
+        session = export_utils.ExportSession(
+            context, timeline.fingerprint(hashes, interval), frame_count, settings.resume_export
+        )
+        state._export_session = session
+        if session.start_frame >= frame_count:
+            print("Export already complete")
+            state.is_exporting_frames = False
+            state._export_report = session.close()
+            state._export_session = None
+            return
+        # 续传时从第一张缺失的帧所在位置开始播放
+        first_frame = session.start_frame
+        first_step, _ = timeline.seek_frame(first_frame, interval)
 
     state._playback_start_idx = start_idx
     state._playback_end_idx = end_idx
 
-    if start_idx == 0:
+    if first_step == 0:
         apply_state_to_object(obj, initial_mesh, name_suffix="start")
-        view_utils.apply_view_state(context, initial_mesh.get("view"))
-        view_utils.apply_camera_state(context, initial_mesh.get("camera"))
+        view_utils.apply_view_state(context, initial_mesh.view)
+        view_utils.apply_camera_state(context, initial_mesh.camera)
     else:
-        prev_state = operation_history[start_idx - 1]
+        prev_state = operation_history[first_step - 1]
         apply_state_to_object(obj, prev_state, name_suffix="start")
-        view_utils.apply_view_state(context, prev_state.get("view"))
-        view_utils.apply_camera_state(context, prev_state.get("camera"))
+        view_utils.apply_view_state(context, prev_state.view)
+        view_utils.apply_camera_state(context, prev_state.camera)
 
-    state.current_step = start_idx
+    state._timeline = timeline
+    state.current_step = first_step
     state.interp_progress = 0.0
     state._step_cache = None
     state._render_frame_idx = 0
@@ -205,10 +421,47 @@ def play_forward(context, export_frames=False, mode="range"):
     view_utils.lock_view_to_camera(context, True)
     toggle_overlays(True)
 
-    interval = settings.step_duration / max(1, settings.interp_steps)
+    # 导出必须逐帧确定；预览按实际时间采样，跟不上时丢帧
+    clock_mode = clock.FIXED if export_frames or not settings.realtime_playback else clock.REALTIME
+    state._clock = clock.PlaybackClock(clock_mode, interval)
+    state._frames = timeline.frames(interval, first_frame) if clock_mode == clock.FIXED else None
+    state._clock.start()
     bpy.app.timers.register(lambda: play_step(context), first_interval=interval)
 
 
+def _next_frame():
+    """
+    (step, cam_t, mesh_t, end) of the next playback frame, or None past the
+    range. The fixed clock takes frames from Timeline.frames, the sequence
+    batch export renders; the real-time clock samples the current step at
+    the wall-clock time and carries overshoot into the next step.
+    """
+    if state._frames is not None:
+        frame = next(state._frames, None)
+        if frame is None:
+            return None
+        state._clock.tick()
+        _, step, cam_t, mesh_t, end = frame
+        state.current_step = step + 1 if end else step
+        return step, cam_t, mesh_t, end
+
+    step = state.current_step
+    if step > state._playback_end_idx:
+        return None
+    timeline = state._timeline
+    cam_duration, mesh_duration, _ = timeline.span(step)
+    total_duration = cam_duration + mesh_duration
+    state.interp_progress += state._clock.tick()
+    elapsed = state.interp_progress
+    if elapsed >= total_duration:
+        # 实时模式把超出的时间带入下一步，保持整体时长不漂移
+        state.current_step += 1
+        state.interp_progress = elapsed - total_duration
+        return step, 1.0, 1.0, True
+    cam_t, mesh_t = timeline.phase(step, elapsed)
+    return step, cam_t, mesh_t, False
+
+
 def play_step(context):
     if not state.is_playing:
         return None
@@ -221,81 +474,93 @@ def play_step(context):
     operation_history = state.get_current_history()
     initial_mesh = state.get_current_initial_mesh()
     settings = state.get_settings(context)
-    interp_steps = max(1, settings.interp_steps)
-    interval = settings.step_duration / interp_steps
-
-    state._is_auto_selecting = True
-    settings.active_step_index = state.current_step + 1
-    state._is_auto_selecting = False
 
-    if state.current_step > state._playback_end_idx:
+    frame = _next_frame()
+    if frame is None:
         stop_playing()
         return None
+    step, cam_t, mesh_t, end = frame
 
-    target_state = operation_history[state.current_step]
-    source_state = initial_mesh if state.current_step == 0 else operation_history[state.current_step - 1]
-    source_step_idx = state.current_step
+    state._is_auto_selecting = True
+    settings.active_step_index = step + 1
+    state._is_auto_selecting = False
 
-    cache_key = state.current_step
-    if state._step_cache is None or state._step_cache.get("key") != cache_key:
-        state._step_cache = compute_step_cache(source_state, target_state)
-        state._step_cache["key"] = cache_key
-        edge_indices = graphics.get_edge_indices_for_step(source_step_idx)
+    target_state = operation_history[step]
+    source_state = initial_mesh if step == 0 else operation_history[step - 1]
+
+    if state._step_cache is None or state._step_cache.get("key") != step:
+        cache = get_step_cache(source_state, target_state)
+        state._step_cache = {
+            "key": step,
+            "kernel": InterpolationKernel(source_state, target_state, cache),
+        }
+        begin_step_mesh(obj, target_state, state._step_cache["kernel"])
+        edge_indices = graphics.get_edge_indices_for_step(step)
         graphics.update_mesh_new_edge_attribute(obj, edge_indices)
-        graphics.update_edge_draw_coords(source_step_idx)
-
-    state.interp_progress += interval
-    cam_changed = view_utils.view_state_changed(source_state.get("view"), target_state.get("view")) or \
-                  view_utils.camera_state_changed(source_state.get("camera"), target_state.get("camera"))
-
-    step_cam_dur, step_mesh_dur = get_step_timing(context, state.current_step)
-    cam_duration = step_cam_dur if cam_changed else 0.0
-    mesh_duration = step_mesh_dur
-    total_duration = cam_duration + mesh_duration
-    elapsed = state.interp_progress
-
-    if cam_changed and elapsed < cam_duration:
-        cam_t = elapsed / cam_duration if cam_duration > 0.0 else 1.0
-        mesh_t = 0.0
-    else:
-        cam_t = 1.0 if cam_changed else min(elapsed / mesh_duration, 1.0)
-        mesh_elapsed = elapsed - cam_duration if cam_changed else elapsed
-        mesh_t = min(mesh_elapsed / max(mesh_duration, 1e-6), 1.0)
+        graphics.update_edge_draw_coords(step)
 
-    if elapsed >= total_duration:
-        view_utils.apply_view_state(context, target_state.get("view"))
-        view_utils.apply_camera_state(context, target_state.get("camera"))
+    if end:
+        view_utils.apply_view_state(context, target_state.view)
+        view_utils.apply_camera_state(context, target_state.camera)
         apply_state_to_object(obj, target_state)
         graphics.update_mesh_new_edge_attribute(obj, [])
         graphics.update_edge_draw_coords(None)
-        export_utils.maybe_render_viewport_frame(context)
-
-        state.current_step += 1
-        state.interp_progress = 0.0
+        export_utils.maybe_render_viewport_frame(
+            context, _export_fingerprint(settings, ("end", target_state.hash), target_state.camera, target_state.view)
+        )
         state._step_cache = None
-        return interval
+        return state._clock.next_interval()
 
-    view_utils.apply_view_state(context, view_utils.interpolate_view_state(source_state.get("view"), target_state.get("view"), cam_t))
-    view_utils.apply_camera_state(context, view_utils.interpolate_camera_state(source_state.get("camera"), target_state.get("camera"), cam_t))
+    view = view_utils.interpolate_view_state(source_state.view, target_state.view, cam_t)
+    camera = view_utils.interpolate_camera_state(source_state.camera, target_state.camera, cam_t)
+    view_utils.apply_view_state(context, view)
+    view_utils.apply_camera_state(context, camera)
 
-    if not (cam_changed and elapsed < cam_duration):
-        new_verts, topo_state = interpolate_states_cached(source_state, target_state, mesh_t, state._step_cache)
+    # 相机阶段网格停在起点，无需求值
+    if mesh_t > 0.0:
+        new_verts = state._step_cache["kernel"].evaluate(mesh_t)
         if not update_mesh_vertices(obj.data, new_verts):
-            apply_state_to_object(obj, {"verts": new_verts, "edges": topo_state["edges"], "faces": topo_state["faces"]})
-        graphics.update_edge_draw_coords(source_step_idx)
+            apply_state_to_object(obj, target_state.with_coords(new_verts))
+        graphics.update_edge_draw_coords(step)
+
+    mesh_key = ("step", step, source_state.hash, target_state.hash, round(mesh_t, 6))
+    export_utils.maybe_render_viewport_frame(context, _export_fingerprint(settings, mesh_key, camera, view))
+    return state._clock.next_interval()
 
-    export_utils.maybe_render_viewport_frame(context)
-    return interval
+
+def _export_fingerprint(settings, mesh_key, camera, view):
+    """Fingerprint of the frame about to be exported; None when not exporting"""
+    if not state.is_exporting_frames:
+        return None
+    # 最终渲染只看场景相机，视口渲染还取决于视图
+    return export_utils.frame_fingerprint(
+        mesh_key, camera, view if settings.export_render_mode == "VIEWPORT" else None
+    )
 
 
 def stop_playing():
     was_video_export = state._is_video_export
     state.is_playing = False
+    if state._clock is not None:
+        stats = state._clock.stats()
+        if stats["frames"]:
+            state._playback_stats = stats
+            print(
+                f"Playback ({stats['mode'].lower()}): {stats['frames']} frames in {stats['elapsed']:.2f}s, "
+                f"{stats['fps']:.1f} FPS, {stats['dropped']} dropped"
+            )
+        state._clock = None
+    state._timeline = None
     state._step_cache = None
     state.interp_progress = 0.0
+    state._frames = None
     state.is_exporting_frames = False
     view_utils.lock_view_to_camera(bpy.context, False)
     toggle_overlays(False)
+    if state._export_session is not None:
+        # 先恢复渲染设置，VSE 合成要用原来的影片格式
+        state._export_report = state._export_session.close()
+        state._export_session = None
     if was_video_export:
         export_utils.finalize_video_export(bpy.context)
     state._total_export_frames = 0
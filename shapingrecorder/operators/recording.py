@@ -2,10 +2,16 @@ import bpy
 
 from ..data import persistence
 from ..data import state
+from ..utils import precompute
 from ..utils import view as view_utils
+from ..core.hashing import BlockHasher
 from ..core.mesh_ops import get_mesh_hash, save_mesh_state
+from ..core.snapshots import StepHistory
+from ..core.step_cache import StepCacheStore
 from .playback import apply_state_to_object
 
+SCULPT_RESCAN_TICKS = 10
+
 
 def lock_other_objects(context, exclude_obj):
     state._locked_objects = []
@@ -42,10 +48,10 @@ def start_recording(context):
             last_state = history[-1]
             apply_state_to_object(obj, last_state, name_suffix="resume")
 
-            if last_state.get("view"):
-                view_utils.apply_view_state(context, last_state.get("view"))
-            if last_state.get("camera"):
-                view_utils.apply_camera_state(context, last_state.get("camera"))
+            if last_state.view:
+                view_utils.apply_view_state(context, last_state.view)
+            if last_state.camera:
+                view_utils.apply_camera_state(context, last_state.camera)
 
             state.last_hash = get_mesh_hash(obj)
         else:
@@ -57,20 +63,23 @@ def start_recording(context):
         print(f"Starting new recording for {obj.name}...")
 
         initial_mesh = save_mesh_state(obj)
-        initial_mesh["view"] = view_utils.save_view_state(context)
-        initial_mesh["camera"] = view_utils.save_camera_state(context)
+        initial_mesh.view = view_utils.save_view_state(context)
+        initial_mesh.camera = view_utils.save_camera_state(context)
 
         state.initial_hash = get_mesh_hash(obj)
         state.last_hash = state.initial_hash
-        initial_mesh["hash"] = state.initial_hash
+        initial_mesh.hash = state.initial_hash
 
         state.object_records[obj.name] = {
             "initial_mesh": initial_mesh,
-            "history": [],
+            "history": StepHistory(),
             "redo": [],
+            "correspondence": StepCacheStore(),
         }
         state.redo_history.clear()
 
+    # 录制会直接编辑该网格，回放不能再假定其拓扑
+    state._playback_mesh = None
     state.is_recording = True
     lock_other_objects(context, obj)
 
@@ -84,7 +93,15 @@ def stop_recording():
     state.is_recording = False
     state.redo_history.clear()
     unlock_other_objects()
-    state.get_current_record()
+    rec = state.get_current_record()
+    if rec:
+        stats = rec["history"].memory_stats()
+        print(
+            f"Recorded {stats['steps']} steps ({stats['keyframes']} keyframes): "
+            f"{stats['stored_bytes'] / 1048576:.1f} MB stored vs "
+            f"{stats['raw_bytes'] / 1048576:.1f} MB full copies ({stats['saved'] * 100:.0f}% saved)"
+        )
+        precompute.submit_missing(state.current_display_obj)
     persistence.sync_step_list(bpy.context)
     persistence.save_to_scene(bpy.context)
     state.target_obj_name = None
@@ -98,6 +115,8 @@ class MeshRecorderModal(bpy.types.Operator):
     _timer = None
     _stable_count = 0
     _pending_hash = None
+    _hasher = None
+    _ticks = 0
 
     def modal(self, context, event):
         if not state.is_recording:
@@ -126,14 +145,25 @@ class MeshRecorderModal(bpy.types.Operator):
                         depsgraph = context.evaluated_depsgraph_get()
                         data_source = obj.evaluated_get(depsgraph)
 
-                current_hash = get_mesh_hash(data_source)
+                # 空闲时不读网格：只有依赖图报告目标网格有改动才整份读取。
+                # 雕刻笔画未必经过依赖图通知，雕刻模式下每 SCULPT_RESCAN_TICKS 次强制读取
+                self._ticks += 1
+                if (
+                    state._recording_dirty
+                    or self._hasher.root is None
+                    or (obj.mode == "SCULPT" and self._ticks % SCULPT_RESCAN_TICKS == 0)
+                ):
+                    state._recording_dirty = False
+                    current_hash = self._hasher.update(data_source)
+                else:
+                    current_hash = self._hasher.root
 
                 if current_hash != state.last_hash:
                     if current_hash == self._pending_hash:
                         self._stable_count += 1
                         if self._stable_count >= 3:
                             base_hash = state.initial_hash if state.initial_hash is not None else state.last_hash
-                            history_hashes = [base_hash] + [s.get("hash") for s in operation_history]
+                            history_hashes = [base_hash] + operation_history.hashes()
 
                             if current_hash in history_hashes:
                                 match_idx = history_hashes.index(current_hash)
@@ -143,26 +173,37 @@ class MeshRecorderModal(bpy.types.Operator):
                                     state.redo_history[:] = removed + state.redo_history
                                     del operation_history[keep_len:]
                                 state.last_hash = current_hash
+                                # 网格已回到历史末尾那一步（哈希一致），之后的差分以它为基准，
+                                # 此前累积的脏块描述的是已撤销的改动，可以丢弃
+                                self._hasher.take_dirty_ranges()
 
                             else:
-                                redo_hashes = [s.get("hash") for s in state.redo_history]
+                                redo_hashes = [s.hash for s in state.redo_history]
                                 if current_hash in redo_hashes:
                                     redo_idx = redo_hashes.index(current_hash)
                                     restored = state.redo_history[: redo_idx + 1]
                                     operation_history.extend(restored)
                                     del state.redo_history[: redo_idx + 1]
                                     state.last_hash = current_hash
+                                    # 重做恢复的是已存的步骤，网格与新的历史末尾一致，
+                                    # 下一步的差分从这里重新累积
+                                    self._hasher.take_dirty_ranges()
                                 else:
                                     state.redo_history.clear()
 
-                                    s = save_mesh_state(data_source)
+                                    s = save_mesh_state(data_source, coords=self._hasher.coords)
 
-                                    s["view"] = view_utils.save_view_state(context)
-                                    s["camera"] = view_utils.save_camera_state(context)
-                                    s["hash"] = current_hash
-                                    operation_history.append(s)
+                                    s.view = view_utils.save_view_state(context)
+                                    s.camera = view_utils.save_camera_state(context)
+                                    s.hash = current_hash
+                                    operation_history.append(
+                                        s, dirty_ranges=self._hasher.take_dirty_ranges()
+                                    )
                                     state.last_hash = current_hash
 
+                                    source = rec["initial_mesh"] if len(operation_history) == 1 else operation_history[-2]
+                                    precompute.submit(state.target_obj_name, source, s)
+
                             self._stable_count = 0
                             self._pending_hash = None
                     else:
@@ -177,6 +218,9 @@ class MeshRecorderModal(bpy.types.Operator):
         wm.modal_handler_add(self)
         self._stable_count = 0
         self._pending_hash = None
+        self._hasher = BlockHasher()
+        self._ticks = 0
+        state._recording_dirty = True
         return {"RUNNING_MODAL"}
 
     def cancel(self, context):
@@ -1,6 +1,7 @@
 import bpy
 from bpy.app.translations import pgettext_iface as iface_
 from ..data import state
+from ..utils import precompute
 
 class MESH_UL_recorder_steps(bpy.types.UIList):
     bl_idname = "MESH_UL_recorder_steps"
@@ -37,6 +38,10 @@ class MeshRecorderPanel(bpy.types.Panel):
 
         layout.label(text=iface_("Steps: {n}").format(n=len(operation_history)))
 
+        pending = precompute.progress()
+        if pending:
+            layout.label(text=iface_("Precomputing: {done}/{total}").format(done=pending[0], total=pending[1]), icon="TIME")
+
         if state.is_exporting_frames and state._render_frame_idx > 0:
             layout.label(text=iface_("Exporting: {n} frames").format(n=state._render_frame_idx), icon="RENDER_ANIMATION")
 
@@ -55,6 +60,7 @@ class MeshRecorderPanel(bpy.types.Panel):
             )
             if state._deleted_step is not None:
                 layout.operator("mesh.restore_recorder_step", icon="LOOP_BACK")
+            layout.operator("mesh.compact_recorder_steps", text=iface_("Compact Steps"), icon="AUTOMERGE_ON")
             if settings.active_step_index < len(settings.step_items):
                 item = settings.step_items[settings.active_step_index]
                 if item.index != -1:
@@ -92,12 +98,20 @@ class MeshRecorderPanel(bpy.types.Panel):
         layout.prop(settings, "global_cam_duration")
         layout.prop(settings, "global_mesh_duration")
         layout.prop(settings, "interp_steps")
+        row = layout.row(align=True)
+        row.prop(settings, "adaptive_frames")
+        sub = row.row(align=True)
+        sub.active = settings.adaptive_frames
+        sub.prop(settings, "frame_budget", text=iface_("Budget"))
+        layout.prop(settings, "realtime_playback")
 
         layout.separator()
         layout.label(text=iface_("Replay Range (1..{n})").format(n=len(operation_history)))
         row = layout.row(align=True)
         row.prop(settings, "playback_start_step")
         row.prop(settings, "playback_end_step")
+        if operation_history and not state.is_recording:
+            layout.prop(settings, "scrub_position", slider=True, text=iface_("Scrub"))
 
         layout.separator()
         layout.label(text=iface_("Playback Mode"))
@@ -107,9 +121,32 @@ class MeshRecorderPanel(bpy.types.Panel):
         row.operator("mesh.record_unified", text=iface_("Record"))
         row.operator("mesh.play_unified", text=iface_("Play"))
         layout.operator("mesh.stop_playing", text=iface_("Stop"))
+        if state._playback_stats and not state.is_playing:
+            stats = state._playback_stats
+            layout.label(
+                text=iface_("Last playback: {fps:.1f} FPS, {dropped} dropped").format(
+                    fps=stats["fps"], dropped=stats["dropped"]
+                ),
+                icon="INFO",
+            )
 
         layout.separator()
         layout.label(text=iface_("Frame Export (Sequence)"))
         layout.prop(settings, "render_prefix")
         layout.prop(settings, "export_render_mode")
+        layout.prop(settings, "resume_export")
+        row = layout.row(align=True)
+        row.operator("mesh.batch_export_frames", text=iface_("Batch Export"), icon="RENDER_ANIMATION")
+        row.prop(settings, "export_workers", text=iface_("Workers"))
+        report = state._export_report
+        if report and not state.is_playing:
+            incomplete = report["written"] < report["total"] or report["errors"]
+            layout.label(
+                text=iface_("Last export: {n} of {total} frames written").format(
+                    n=report["written"], total=report["total"]
+                ),
+                icon="ERROR" if incomplete else "INFO",
+            )
+            for error in report["errors"][:3]:
+                layout.label(text=error)
         layout.label(text=iface_("Uses Output Path directory from Render Properties."))
@@ -11,18 +11,30 @@ translations = {
         ("*", "Step {n}"): "Step {n}",
         ("*", "Step {n} Settings"): "Step {n} Settings",
         ("*", "Exporting: {n} frames"): "Exporting: {n} frames",
+        ("*", "Precomputing: {done}/{total}"): "Precomputing: {done}/{total}",
         ("*", "No recorded object"): "No recorded object",
         ("*", "Resetting..."): "Resetting...",
         ("*", "Global Settings"): "Global Settings",
         ("*", "Replay Range (1..{n})"): "Replay Range (1..{n})",
         ("*", "Frame Export (Sequence)"): "Frame Export (Sequence)",
         ("*", "Uses Output Path directory from Render Properties."): "Uses Output Path directory from Render Properties.",
+        ("*", "Batch Export"): "Batch Export",
+        ("*", "Workers"): "Workers",
+        ("*", "Resume Export"): "Resume Export",
+        ("*", "Exported {n} frames in {s:.1f}s"): "Exported {n} frames in {s:.1f}s",
+        ("*", "Batch export failed: {error}"): "Batch export failed: {error}",
+        ("*", "Export incomplete: {n} of {total} frames written"): "Export incomplete: {n} of {total} frames written",
+        ("*", "Last export: {n} of {total} frames written"): "Last export: {n} of {total} frames written",
         ("*", "Edge Display"): "Edge Display",
         ("*", "Show Edge Settings"): "Show Edge Settings",
 
         
         ("*", "Step Duration"): "Step Duration",
         ("*", "Interpolation Steps"): "Interpolation Steps",
+        ("*", "Real-time Playback"): "Real-time Playback",
+        ("*", "Adaptive Frames"): "Adaptive Frames",
+        ("*", "Frame Budget"): "Frame Budget",
+        ("*", "Budget"): "Budget",
         ("*", "Start Step"): "Start Step",
         ("*", "End Step"): "End Step",
         ("*", "File Prefix"): "File Prefix",
@@ -47,15 +59,23 @@ translations = {
         ("*", "Stop Recording"): "Stop Recording",
         ("*", "Play"): "Play",
         ("*", "Stop"): "Stop",
+        ("*", "Last playback: {fps:.1f} FPS, {dropped} dropped"): "Last playback: {fps:.1f} FPS, {dropped} dropped",
         ("*", "Record"): "Record",
         ("*", "Record Frames"): "Record Frames",
         ("*", "Stop Playing"): "Stop Playing",
         ("Operator", "Delete Step"): "Delete Step",
         ("*", "Restore Deleted Step"): "Restore Deleted Step",
+        ("*", "Compact Steps"): "Compact Steps",
+        ("Operator", "Compact Steps"): "Compact Steps",
+        ("*", "Max Movement"): "Max Movement",
+        ("*", "Max Steps"): "Max Steps",
+        ("*", "Steps: {before} -> {after} ({s:.2f}s)"): "Steps: {before} -> {after} ({s:.2f}s)",
         ("*", "Reset Camera"): "Reset Camera",
         ("*", "Confirm Camera"): "Confirm Camera",
         ("*", "Set Start"): "Set Start",
         ("*", "Set End"): "Set End",
+        ("*", "Scrub"): "Scrub",
+        ("*", "Step {n} at {t:.2f}s ({ms:.1f} ms)"): "Step {n} at {t:.2f}s ({ms:.1f} ms)",
         ("Operator", "Toggle Highlighted Edges"): "Toggle Highlighted Edges",
         ("*", "Mark Edge"): "Mark Edge",
         ("*", "Confirm"): "Confirm",
@@ -110,7 +130,15 @@ translations = {
         ("*", "Use scene render engine"): "Use scene render engine",
         ("*", "Record Frames"): "Record Frames",
         ("*", "Exporting: {n} frames"): "Exporting: {n} frames",
+        ("*", "Precomputing: {done}/{total}"): "Precomputing: {done}/{total}",
         ("*", "Uses Output Path directory from Render Properties."): "Uses Output Path directory from Render Properties.",
+        ("*", "Batch Export"): "Batch Export",
+        ("*", "Workers"): "Workers",
+        ("*", "Resume Export"): "Resume Export",
+        ("*", "Exported {n} frames in {s:.1f}s"): "Exported {n} frames in {s:.1f}s",
+        ("*", "Batch export failed: {error}"): "Batch export failed: {error}",
+        ("*", "Export incomplete: {n} of {total} frames written"): "Export incomplete: {n} of {total} frames written",
+        ("*", "Last export: {n} of {total} frames written"): "Last export: {n} of {total} frames written",
     },
 
     
@@ -130,6 +158,8 @@ translations = {
         ("*", "Mesh Duration"): "网格持续时间",
         ("*", "Set Start"): "设置开始",
         ("*", "Set End"): "设置结束",
+        ("*", "Scrub"): "拖动预览",
+        ("*", "Step {n} at {t:.2f}s ({ms:.1f} ms)"): "步骤 {n}，{t:.2f} 秒（{ms:.1f} 毫秒）",
         ("*", "Edge Display"): "边显示",
         ("*", "Mark Edge"): "标记边",
         ("*", "Confirm"): "确认",
@@ -138,6 +168,10 @@ translations = {
         ("*", "Edge Glow"): "边发光",
         ("*", "Global Settings"): "全局设置",
         ("*", "Interpolation Steps"): "插值步数",
+        ("*", "Real-time Playback"): "实时回放",
+        ("*", "Adaptive Frames"): "自适应帧数",
+        ("*", "Frame Budget"): "帧数预算",
+        ("*", "Budget"): "预算",
         ("*", "Replay Range (1..{n})"): "回放范围 (1..{n})",
         ("*", "Start Step"): "起始步",
         ("*", "First recorded step to replay (1-based)"): "回放的第一步（从1开始）",
@@ -150,6 +184,7 @@ translations = {
         ("*", "Record"): "录制",
         ("*", "Play"): "播放",
         ("*", "Stop"): "停止",
+        ("*", "Last playback: {fps:.1f} FPS, {dropped} dropped"): "上次回放: {fps:.1f} FPS, 丢帧 {dropped}",
         ("*", "Frame Export (Sequence)"): "帧导出（序列）",
         ("*", "File Prefix"): "文件前缀",
         ("*", "Frame file prefix"): "导出帧文件名前缀",
@@ -160,7 +195,15 @@ translations = {
         ("*", "Final Render"): "最终渲染",
         ("*", "Use scene render engine"): "使用场景渲染器",
         ("*", "Uses Output Path directory from Render Properties."): "使用渲染属性中的输出路径目录。",
+        ("*", "Batch Export"): "批量导出",
+        ("*", "Workers"): "进程数",
+        ("*", "Resume Export"): "断点续导",
+        ("*", "Exported {n} frames in {s:.1f}s"): "已导出 {n} 帧，用时 {s:.1f} 秒",
+        ("*", "Batch export failed: {error}"): "批量导出失败：{error}",
+        ("*", "Export incomplete: {n} of {total} frames written"): "导出未完成：已写入 {n}/{total} 帧",
+        ("*", "Last export: {n} of {total} frames written"): "上次导出：已写入 {n}/{total} 帧",
         ("*", "Exporting: {n} frames"): "导出中: {n} 帧",
+        ("*", "Precomputing: {done}/{total}"): "预计算中: {done}/{total}",
         ("*", "No recorded object"): "未录制对象",
         ("*", "Resetting..."): "重置中...",
         ("*", "Play/record from beginning"): "从头播放/录制",
@@ -181,6 +224,11 @@ translations = {
         ("*", "Stop playback and return to initial state"): "停止播放并返回初始状态",
         ("*", "Delete the selected step from the recording"): "从录制中删除选定的步骤",
         ("*", "Restore Deleted Step"): "恢复删除的步骤",
+        ("*", "Compact Steps"): "合并细碎步骤",
+        ("Operator", "Compact Steps"): "合并细碎步骤",
+        ("*", "Max Movement"): "最大位移",
+        ("*", "Max Steps"): "最大步骤数",
+        ("*", "Steps: {before} -> {after} ({s:.2f}s)"): "步骤：{before} -> {after}（{s:.2f} 秒）",
         ("*", "Restore the most recently deleted step"): "恢复最近删除的步骤",
         ("*", "Reset the camera for this step to its recorded state"): "重新设定当前步骤的摄像机位置",
         ("*", "Confirm and save the current camera for this step"): "确认并保存此步骤的摄影机位置",
@@ -215,6 +263,8 @@ translations = {
         ("*", "Mesh Duration"): "網格持續時間",
         ("*", "Set Start"): "設定開始",
         ("*", "Set End"): "設定結束",
+        ("*", "Scrub"): "拖曳預覽",
+        ("*", "Step {n} at {t:.2f}s ({ms:.1f} ms)"): "步驟 {n}，{t:.2f} 秒（{ms:.1f} 毫秒）",
         ("*", "Edge Display"): "邊顯示",
         ("*", "Mark Edge"): "標記邊",
         ("*", "Confirm"): "確認",
@@ -223,6 +273,10 @@ translations = {
         ("*", "Edge Glow"): "邊發光",
         ("*", "Global Settings"): "全域設定",
         ("*", "Interpolation Steps"): "插值步數",
+        ("*", "Real-time Playback"): "即時回放",
+        ("*", "Adaptive Frames"): "自適應幀數",
+        ("*", "Frame Budget"): "幀數預算",
+        ("*", "Budget"): "預算",
         ("*", "Replay Range (1..{n})"): "回放範圍 (1..{n})",
         ("*", "Start Step"): "起始步",
         ("*", "First recorded step to replay (1-based)"): "回放的第一步（從1開始）",
@@ -235,6 +289,7 @@ translations = {
         ("*", "Record"): "錄製",
         ("*", "Play"): "播放",
         ("*", "Stop"): "停止",
+        ("*", "Last playback: {fps:.1f} FPS, {dropped} dropped"): "上次回放: {fps:.1f} FPS, 掉幀 {dropped}",
         ("*", "Frame Export (Sequence)"): "幀匯出（序列）",
         ("*", "File Prefix"): "檔案前綴",
         ("*", "Frame file prefix"): "匯出幀檔案名前綴",
@@ -245,7 +300,15 @@ translations = {
         ("*", "Final Render"): "最終渲染",
         ("*", "Use scene render engine"): "使用場景渲染引擎",
         ("*", "Uses Output Path directory from Render Properties."): "使用渲染屬性中的輸出路徑目錄。",
+        ("*", "Batch Export"): "批次匯出",
+        ("*", "Workers"): "程序數",
+        ("*", "Resume Export"): "斷點續匯出",
+        ("*", "Exported {n} frames in {s:.1f}s"): "已匯出 {n} 幀，用時 {s:.1f} 秒",
+        ("*", "Batch export failed: {error}"): "批次匯出失敗：{error}",
+        ("*", "Export incomplete: {n} of {total} frames written"): "匯出未完成：已寫入 {n}/{total} 幀",
+        ("*", "Last export: {n} of {total} frames written"): "上次匯出：已寫入 {n}/{total} 幀",
         ("*", "Exporting: {n} frames"): "匯出中: {n} 幀",
+        ("*", "Precomputing: {done}/{total}"): "預先計算中: {done}/{total}",
         ("*", "No recorded object"): "未錄製物件",
         ("*", "Resetting..."): "重置中...",
         ("*", "Play/record from beginning"): "從頭播放/錄製",
@@ -266,6 +329,11 @@ translations = {
         ("*", "Stop playback and return to initial state"): "停止播放並返回初始狀態",
         ("*", "Delete the selected step from the recording"): "從錄製中刪除選定的步驟",
         ("*", "Restore Deleted Step"): "恢復刪除的步驟",
+        ("*", "Compact Steps"): "合併細碎步驟",
+        ("Operator", "Compact Steps"): "合併細碎步驟",
+        ("*", "Max Movement"): "最大位移",
+        ("*", "Max Steps"): "最大步驟數",
+        ("*", "Steps: {before} -> {after} ({s:.2f}s)"): "步驟：{before} -> {after}（{s:.2f} 秒）",
         ("*", "Restore the most recently deleted step"): "恢復最近刪除的步驟",
         ("*", "Reset the camera for this step to its recorded state"): "重設此步驟的攝影機至錄製狀態",
         ("*", "Confirm and save the current camera for this step"): "確認並保存此步驟的當前攝影機",
@@ -300,6 +368,8 @@ translations = {
         ("*", "Mesh Duration"): "メッシュの期間",
         ("*", "Set Start"): "開始を設定",
         ("*", "Set End"): "終了を設定",
+        ("*", "Scrub"): "スクラブ",
+        ("*", "Step {n} at {t:.2f}s ({ms:.1f} ms)"): "ステップ {n}、{t:.2f} 秒（{ms:.1f} ms）",
         ("*", "Edge Display"): "辺の表示",
         ("*", "Mark Edge"): "辺をマーク",
         ("*", "Confirm"): "確定",
@@ -308,6 +378,10 @@ translations = {
         ("*", "Edge Glow"): "辺の発光",
         ("*", "Global Settings"): "グローバル設定",
         ("*", "Interpolation Steps"): "補間ステップ数",
+        ("*", "Real-time Playback"): "リアルタイム再生",
+        ("*", "Adaptive Frames"): "アダプティブフレーム",
+        ("*", "Frame Budget"): "フレーム予算",
+        ("*", "Budget"): "予算",
         ("*", "Replay Range (1..{n})"): "再生範囲 (1..{n})",
         ("*", "Start Step"): "開始ステップ",
         ("*", "First recorded step to replay (1-based)"): "再生する最初のステップ (1から開始)",
@@ -320,6 +394,7 @@ translations = {
         ("*", "Record"): "記録",
         ("*", "Play"): "再生",
         ("*", "Stop"): "停止",
+        ("*", "Last playback: {fps:.1f} FPS, {dropped} dropped"): "前回の再生: {fps:.1f} FPS, ドロップ {dropped}",
         ("*", "Frame Export (Sequence)"): "フレーム書き出し (連番)",
         ("*", "File Prefix"): "ファイル接頭辞",
         ("*", "Frame file prefix"): "書き出しフレームのファイル名接頭辞",
@@ -330,7 +405,15 @@ translations = {
         ("*", "Final Render"): "最終レンダリング",
         ("*", "Use scene render engine"): "シーンのレンダーエンジンを使用",
         ("*", "Uses Output Path directory from Render Properties."): "レンダープロパティの出力パスディレクトリを使用します。",
+        ("*", "Batch Export"): "一括書き出し",
+        ("*", "Workers"): "ワーカー数",
+        ("*", "Resume Export"): "エクスポートを再開",
+        ("*", "Exported {n} frames in {s:.1f}s"): "{n} フレームを {s:.1f} 秒で書き出しました",
+        ("*", "Batch export failed: {error}"): "一括書き出しに失敗しました: {error}",
+        ("*", "Export incomplete: {n} of {total} frames written"): "エクスポート未完了: {total} フレーム中 {n} フレームを書き出しました",
+        ("*", "Last export: {n} of {total} frames written"): "前回の書き出し: {total} フレーム中 {n} フレームを書き出しました",
         ("*", "Exporting: {n} frames"): "書き出し中: {n} フレーム",
+        ("*", "Precomputing: {done}/{total}"): "事前計算中: {done}/{total}",
         ("*", "No recorded object"): "記録されたオブジェクトがありません",
         ("*", "Resetting..."): "リセット中...",
         ("*", "Play/record from beginning"): "最初から再生/記録",
@@ -351,6 +434,11 @@ translations = {
         ("*", "Stop playback and return to initial state"): "再生を停止して初期状態に戻る",
         ("*", "Delete the selected step from the recording"): "記録から選択したステップを削除",
         ("*", "Restore Deleted Step"): "削除したステップを復元",
+        ("*", "Compact Steps"): "ステップを統合",
+        ("Operator", "Compact Steps"): "ステップを統合",
+        ("*", "Max Movement"): "最大移動量",
+        ("*", "Max Steps"): "最大ステップ数",
+        ("*", "Steps: {before} -> {after} ({s:.2f}s)"): "ステップ: {before} -> {after}（{s:.2f} 秒）",
         ("*", "Restore the most recently deleted step"): "最後に削除したステップを復元",
         ("*", "Reset the camera for this step to its recorded state"): "このステップのカメラを記録された状態にリセット",
         ("*", "Confirm and save the current camera for this step"): "このステップの現在のカメラを確定して保存",
@@ -385,6 +473,8 @@ translations = {
         ("*", "Mesh Duration"): "Duración de la malla",
         ("*", "Set Start"): "Establecer inicio",
         ("*", "Set End"): "Establecer fin",
+        ("*", "Scrub"): "Desplazar",
+        ("*", "Step {n} at {t:.2f}s ({ms:.1f} ms)"): "Paso {n} en {t:.2f}s ({ms:.1f} ms)",
         ("*", "Edge Display"): "Visualización de bordes",
         ("*", "Mark Edge"): "Marcar borde",
         ("*", "Confirm"): "Confirmar",
@@ -393,6 +483,10 @@ translations = {
         ("*", "Edge Glow"): "Brillo del borde",
         ("*", "Global Settings"): "Configuración global",
         ("*", "Interpolation Steps"): "Pasos de interpolación",
+        ("*", "Real-time Playback"): "Reproducción en tiempo real",
+        ("*", "Adaptive Frames"): "Fotogramas adaptativos",
+        ("*", "Frame Budget"): "Presupuesto de fotogramas",
+        ("*", "Budget"): "Presupuesto",
         ("*", "Replay Range (1..{n})"): "Rango de reproducción (1..{n})",
         ("*", "Start Step"): "Paso inicial",
         ("*", "First recorded step to replay (1-based)"): "Primer paso grabado para reproducir (base 1)",
@@ -405,6 +499,7 @@ translations = {
         ("*", "Record"): "Grabar",
         ("*", "Play"): "Reproducir",
         ("*", "Stop"): "Detener",
+        ("*", "Last playback: {fps:.1f} FPS, {dropped} dropped"): "Última reproducción: {fps:.1f} FPS, {dropped} descartados",
         ("*", "Frame Export (Sequence)"): "Exportar fotogramas (Secuencia)",
         ("*", "File Prefix"): "Prefijo de archivo",
         ("*", "Frame file prefix"): "Prefijo del nombre de archivo de fotogramas",
@@ -415,7 +510,15 @@ translations = {
         ("*", "Final Render"): "Renderizado final",
         ("*", "Use scene render engine"): "Usar motor de renderizado de la escena",
         ("*", "Uses Output Path directory from Render Properties."): "Usa el directorio de ruta de salida de las Propiedades de Renderizado.",
+        ("*", "Batch Export"): "Exportación por lotes",
+        ("*", "Workers"): "Procesos",
+        ("*", "Resume Export"): "Reanudar exportación",
+        ("*", "Exported {n} frames in {s:.1f}s"): "Exportados {n} fotogramas en {s:.1f}s",
+        ("*", "Batch export failed: {error}"): "La exportación por lotes falló: {error}",
+        ("*", "Export incomplete: {n} of {total} frames written"): "Exportación incompleta: {n} de {total} fotogramas escritos",
+        ("*", "Last export: {n} of {total} frames written"): "Última exportación: {n} de {total} fotogramas escritos",
         ("*", "Exporting: {n} frames"): "Exportando: {n} fotogramas",
+        ("*", "Precomputing: {done}/{total}"): "Precalculando: {done}/{total}",
         ("*", "No recorded object"): "Ningún objeto grabado",
         ("*", "Resetting..."): "Restableciendo...",
         ("*", "Play/record from beginning"): "Reproducir/grabar desde el principio",
@@ -436,6 +539,11 @@ translations = {
         ("*", "Stop playback and return to initial state"): "Detener la reproducción y volver al estado inicial",
         ("*", "Delete the selected step from the recording"): "Eliminar el paso seleccionado de la grabación",
         ("*", "Restore Deleted Step"): "Restaurar paso eliminado",
+        ("*", "Compact Steps"): "Compactar pasos",
+        ("Operator", "Compact Steps"): "Compactar pasos",
+        ("*", "Max Movement"): "Movimiento máximo",
+        ("*", "Max Steps"): "Pasos máximos",
+        ("*", "Steps: {before} -> {after} ({s:.2f}s)"): "Pasos: {before} -> {after} ({s:.2f} s)",
         ("*", "Restore the most recently deleted step"): "Restaurar el paso eliminado más recientemente",
         ("*", "Reset the camera for this step to its recorded state"): "Restablecer la cámara de este paso a su estado grabado",
         ("*", "Confirm and save the current camera for this step"): "Confirmar y guardar la cámara actual para este paso",
@@ -470,6 +578,8 @@ translations = {
         ("*", "Mesh Duration"): "Mesh-Dauer",
         ("*", "Set Start"): "Start setzen",
         ("*", "Set End"): "Ende setzen",
+        ("*", "Scrub"): "Scrubben",
+        ("*", "Step {n} at {t:.2f}s ({ms:.1f} ms)"): "Schritt {n} bei {t:.2f}s ({ms:.1f} ms)",
         ("*", "Edge Display"): "Kantenanzeige",
         ("*", "Mark Edge"): "Kante markieren",
         ("*", "Confirm"): "Bestätigen",
@@ -478,6 +588,10 @@ translations = {
         ("*", "Edge Glow"): "Kantenleuchten",
         ("*", "Global Settings"): "Globale Einstellungen",
         ("*", "Interpolation Steps"): "Interpolationsschritte",
+        ("*", "Real-time Playback"): "Echtzeit-Wiedergabe",
+        ("*", "Adaptive Frames"): "Adaptive Frames",
+        ("*", "Frame Budget"): "Frame-Budget",
+        ("*", "Budget"): "Budget",
         ("*", "Replay Range (1..{n})"): "Wiedergabebereich (1..{n})",
         ("*", "Start Step"): "Startschritt",
         ("*", "First recorded step to replay (1-based)"): "Erster Wiedergabeschritt (ab 1)",
@@ -490,6 +604,7 @@ translations = {
         ("*", "Record"): "Aufnehmen",
         ("*", "Play"): "Abspielen",
         ("*", "Stop"): "Stopp",
+        ("*", "Last playback: {fps:.1f} FPS, {dropped} dropped"): "Letzte Wiedergabe: {fps:.1f} FPS, {dropped} verworfen",
         ("*", "Frame Export (Sequence)"): "Frame-Export (Sequenz)",
         ("*", "File Prefix"): "Dateipräfix",
         ("*", "Frame file prefix"): "Präfix für Frame-Dateien",
@@ -500,7 +615,15 @@ translations = {
         ("*", "Final Render"): "Finales Rendern",
         ("*", "Use scene render engine"): "Szenen-Render-Engine verwenden",
         ("*", "Uses Output Path directory from Render Properties."): "Verwendet das Ausgabeverzeichnis aus den Render-Eigenschaften.",
+        ("*", "Batch Export"): "Stapelexport",
+        ("*", "Workers"): "Prozesse",
+        ("*", "Resume Export"): "Export fortsetzen",
+        ("*", "Exported {n} frames in {s:.1f}s"): "{n} Frames in {s:.1f}s exportiert",
+        ("*", "Batch export failed: {error}"): "Stapelexport fehlgeschlagen: {error}",
+        ("*", "Export incomplete: {n} of {total} frames written"): "Export unvollständig: {n} von {total} Frames geschrieben",
+        ("*", "Last export: {n} of {total} frames written"): "Letzter Export: {n} von {total} Frames geschrieben",
         ("*", "Exporting: {n} frames"): "Exportiere: {n} Frames",
+        ("*", "Precomputing: {done}/{total}"): "Vorberechnung: {done}/{total}",
         ("*", "No recorded object"): "Kein Objekt aufgenommen",
         ("*", "Resetting..."): "Zurücksetzen...",
         ("*", "Play/record from beginning"): "Vom Anfang abspielen/aufnehmen",
@@ -521,6 +644,11 @@ translations = {
         ("*", "Stop playback and return to initial state"): "Wiedergabe stoppen und zum Anfangszustand zurückkehren",
         ("*", "Delete the selected step from the recording"): "Ausgewählten Schritt aus der Aufnahme löschen",
         ("*", "Restore Deleted Step"): "Gelöschten Schritt wiederherstellen",
+        ("*", "Compact Steps"): "Schritte zusammenfassen",
+        ("Operator", "Compact Steps"): "Schritte zusammenfassen",
+        ("*", "Max Movement"): "Maximale Bewegung",
+        ("*", "Max Steps"): "Maximale Schritte",
+        ("*", "Steps: {before} -> {after} ({s:.2f}s)"): "Schritte: {before} -> {after} ({s:.2f} s)",
         ("*", "Restore the most recently deleted step"): "Zuletzt gelöschten Schritt wiederherstellen",
         ("*", "Reset the camera for this step to its recorded state"): "Kamera für diesen Schritt auf den aufgenommenen Zustand zurücksetzen",
         ("*", "Confirm and save the current camera for this step"): "Aktuelle Kamera für diesen Schritt bestätigen und speichern",
@@ -555,6 +683,8 @@ translations = {
         ("*", "Mesh Duration"): "Durée du maillage",
         ("*", "Set Start"): "Définir début",
         ("*", "Set End"): "Définir fin",
+        ("*", "Scrub"): "Défilement",
+        ("*", "Step {n} at {t:.2f}s ({ms:.1f} ms)"): "Étape {n} à {t:.2f}s ({ms:.1f} ms)",
         ("*", "Edge Display"): "Affichage des arêtes",
         ("*", "Mark Edge"): "Marquer l'arête",
         ("*", "Confirm"): "Confirmer",
@@ -563,6 +693,10 @@ translations = {
         ("*", "Edge Glow"): "Lueur de l'arête",
         ("*", "Global Settings"): "Paramètres globaux",
         ("*", "Interpolation Steps"): "Étapes d'interpolation",
+        ("*", "Real-time Playback"): "Lecture en temps réel",
+        ("*", "Adaptive Frames"): "Images adaptatives",
+        ("*", "Frame Budget"): "Budget d'images",
+        ("*", "Budget"): "Budget",
         ("*", "Replay Range (1..{n})"): "Plage de lecture (1..{n})",
         ("*", "Start Step"): "Étape de début",
         ("*", "First recorded step to replay (1-based)"): "Première étape à lire (base 1)",
@@ -575,6 +709,7 @@ translations = {
         ("*", "Record"): "Enregistrer",
         ("*", "Play"): "Lire",
         ("*", "Stop"): "Arrêter",
+        ("*", "Last playback: {fps:.1f} FPS, {dropped} dropped"): "Dernière lecture : {fps:.1f} FPS, {dropped} ignorées",
         ("*", "Frame Export (Sequence)"): "Export d'images (Séquence)",
         ("*", "File Prefix"): "Préfixe de fichier",
         ("*", "Frame file prefix"): "Préfixe du nom de fichier d'images",
@@ -585,7 +720,15 @@ translations = {
         ("*", "Final Render"): "Rendu final",
         ("*", "Use scene render engine"): "Utiliser le moteur de rendu de la scène",
         ("*", "Uses Output Path directory from Render Properties."): "Utilise le répertoire de sortie des propriétés de rendu.",
+        ("*", "Batch Export"): "Export par lot",
+        ("*", "Workers"): "Processus",
+        ("*", "Resume Export"): "Reprendre l'export",
+        ("*", "Exported {n} frames in {s:.1f}s"): "{n} images exportées en {s:.1f}s",
+        ("*", "Batch export failed: {error}"): "Échec de l'export par lots : {error}",
+        ("*", "Export incomplete: {n} of {total} frames written"): "Export incomplet : {n} images sur {total} écrites",
+        ("*", "Last export: {n} of {total} frames written"): "Dernier export : {n} images sur {total} écrites",
         ("*", "Exporting: {n} frames"): "Exportation : {n} images",
+        ("*", "Precomputing: {done}/{total}"): "Précalcul : {done}/{total}",
         ("*", "No recorded object"): "Aucun objet enregistré",
         ("*", "Resetting..."): "Réinitialisation...",
         ("*", "Play/record from beginning"): "Lire/enregistrer depuis le début",
@@ -606,6 +749,11 @@ translations = {
         ("*", "Stop playback and return to initial state"): "Arrêter la lecture et revenir à l'état initial",
         ("*", "Delete the selected step from the recording"): "Supprimer l'étape sélectionnée de l'enregistrement",
         ("*", "Restore Deleted Step"): "Restaurer l'étape supprimée",
+        ("*", "Compact Steps"): "Compacter les étapes",
+        ("Operator", "Compact Steps"): "Compacter les étapes",
+        ("*", "Max Movement"): "Déplacement max",
+        ("*", "Max Steps"): "Nombre max d'étapes",
+        ("*", "Steps: {before} -> {after} ({s:.2f}s)"): "Étapes : {before} -> {after} ({s:.2f} s)",
         ("*", "Restore the most recently deleted step"): "Restaurer l'étape supprimée la plus récente",
         ("*", "Reset the camera for this step to its recorded state"): "Réinitialiser la caméra de cette étape à son état enregistré",
         ("*", "Confirm and save the current camera for this step"): "Confirmer et enregistrer la caméra actuelle pour cette étape",
@@ -640,6 +788,8 @@ translations = {
         ("*", "Mesh Duration"): "Durata mesh",
         ("*", "Set Start"): "Imposta inizio",
         ("*", "Set End"): "Imposta fine",
+        ("*", "Scrub"): "Scorrimento",
+        ("*", "Step {n} at {t:.2f}s ({ms:.1f} ms)"): "Passo {n} a {t:.2f}s ({ms:.1f} ms)",
         ("*", "Edge Display"): "Visualizzazione bordi",
         ("*", "Mark Edge"): "Segna bordo",
         ("*", "Confirm"): "Conferma",
@@ -648,6 +798,10 @@ translations = {
         ("*", "Edge Glow"): "Bagliore bordo",
         ("*", "Global Settings"): "Impostazioni globali",
         ("*", "Interpolation Steps"): "Passi interpolazione",
+        ("*", "Real-time Playback"): "Riproduzione in tempo reale",
+        ("*", "Adaptive Frames"): "Fotogrammi adattivi",
+        ("*", "Frame Budget"): "Budget fotogrammi",
+        ("*", "Budget"): "Budget",
         ("*", "Replay Range (1..{n})"): "Intervallo riproduzione (1..{n})",
         ("*", "Start Step"): "Passo iniziale",
         ("*", "First recorded step to replay (1-based)"): "Primo passo registrato da riprodurre (base 1)",
@@ -660,6 +814,7 @@ translations = {
         ("*", "Record"): "Registra",
         ("*", "Play"): "Riproduci",
         ("*", "Stop"): "Ferma",
+        ("*", "Last playback: {fps:.1f} FPS, {dropped} dropped"): "Ultima riproduzione: {fps:.1f} FPS, {dropped} saltati",
         ("*", "Frame Export (Sequence)"): "Esportazione fotogrammi (Sequenza)",
         ("*", "File Prefix"): "Prefisso file",
         ("*", "Frame file prefix"): "Prefisso nome file fotogrammi",
@@ -670,7 +825,15 @@ translations = {
         ("*", "Final Render"): "Render finale",
         ("*", "Use scene render engine"): "Usa motore di render della scena",
         ("*", "Uses Output Path directory from Render Properties."): "Usa la directory del percorso di output dalle Proprietà di Render.",
+        ("*", "Batch Export"): "Esportazione batch",
+        ("*", "Workers"): "Processi",
+        ("*", "Resume Export"): "Riprendi esportazione",
+        ("*", "Exported {n} frames in {s:.1f}s"): "Esportati {n} fotogrammi in {s:.1f}s",
+        ("*", "Batch export failed: {error}"): "Esportazione batch non riuscita: {error}",
+        ("*", "Export incomplete: {n} of {total} frames written"): "Esportazione incompleta: {n} di {total} fotogrammi scritti",
+        ("*", "Last export: {n} of {total} frames written"): "Ultima esportazione: {n} di {total} fotogrammi scritti",
         ("*", "Exporting: {n} frames"): "Esportazione: {n} fotogrammi",
+        ("*", "Precomputing: {done}/{total}"): "Precalcolo: {done}/{total}",
         ("*", "No recorded object"): "Nessun oggetto registrato",
         ("*", "Resetting..."): "Ripristino in corso...",
         ("*", "Play/record from beginning"): "Riproduci/registra dall'inizio",
@@ -691,6 +854,11 @@ translations = {
         ("*", "Stop playback and return to initial state"): "Ferma la riproduzione e torna allo stato iniziale",
         ("*", "Delete the selected step from the recording"): "Elimina il passo selezionato dalla registrazione",
         ("*", "Restore Deleted Step"): "Ripristina passo eliminato",
+        ("*", "Compact Steps"): "Compatta passi",
+        ("Operator", "Compact Steps"): "Compatta passi",
+        ("*", "Max Movement"): "Spostamento massimo",
+        ("*", "Max Steps"): "Passi massimi",
+        ("*", "Steps: {before} -> {after} ({s:.2f}s)"): "Passi: {before} -> {after} ({s:.2f} s)",
         ("*", "Restore the most recently deleted step"): "Ripristina il passo eliminato più di recente",
         ("*", "Reset the camera for this step to its recorded state"): "Ripristina la camera di questo passo al suo stato registrato",
         ("*", "Confirm and save the current camera for this step"): "Conferma e salva la camera corrente per questo passo",
@@ -725,6 +893,8 @@ translations = {
         ("*", "Mesh Duration"): "메쉬 지속 시간",
         ("*", "Set Start"): "시작 설정",
         ("*", "Set End"): "종료 설정",
+        ("*", "Scrub"): "스크럽",
+        ("*", "Step {n} at {t:.2f}s ({ms:.1f} ms)"): "단계 {n}, {t:.2f}초 ({ms:.1f} ms)",
         ("*", "Edge Display"): "엣지(Edge) 표시",
         ("*", "Mark Edge"): "엣지 표시",
         ("*", "Confirm"): "확인",
@@ -733,6 +903,10 @@ translations = {
         ("*", "Edge Glow"): "엣지 발광",
         ("*", "Global Settings"): "전역 설정",
         ("*", "Interpolation Steps"): "보간 단계 수",
+        ("*", "Real-time Playback"): "실시간 재생",
+        ("*", "Adaptive Frames"): "적응형 프레임",
+        ("*", "Frame Budget"): "프레임 예산",
+        ("*", "Budget"): "예산",
         ("*", "Replay Range (1..{n})"): "재생 범위 (1..{n})",
         ("*", "Start Step"): "시작 단계",
         ("*", "First recorded step to replay (1-based)"): "재생할 첫 번째 기록 단계 (1부터 시작)",
@@ -745,6 +919,7 @@ translations = {
         ("*", "Record"): "기록",
         ("*", "Play"): "재생",
         ("*", "Stop"): "정지",
+        ("*", "Last playback: {fps:.1f} FPS, {dropped} dropped"): "마지막 재생: {fps:.1f} FPS, {dropped} 프레임 누락",
         ("*", "Frame Export (Sequence)"): "프레임 내보내기 (시퀀스)",
         ("*", "File Prefix"): "파일 접두사",
         ("*", "Frame file prefix"): "내보낼 프레임 파일 이름 접두사",
@@ -755,7 +930,15 @@ translations = {
         ("*", "Final Render"): "최종 렌더",
         ("*", "Use scene render engine"): "씬 렌더 엔진 사용",
         ("*", "Uses Output Path directory from Render Properties."): "렌더 속성의 출력 경로 디렉토리를 사용합니다.",
+        ("*", "Batch Export"): "일괄 내보내기",
+        ("*", "Workers"): "작업 프로세스",
+        ("*", "Resume Export"): "내보내기 이어하기",
+        ("*", "Exported {n} frames in {s:.1f}s"): "{n} 프레임을 {s:.1f}초 만에 내보냈습니다",
+        ("*", "Batch export failed: {error}"): "일괄 내보내기 실패: {error}",
+        ("*", "Export incomplete: {n} of {total} frames written"): "내보내기 미완료: {total}개 중 {n}개 프레임 기록됨",
+        ("*", "Last export: {n} of {total} frames written"): "마지막 내보내기: {total}개 중 {n}개 프레임 기록",
         ("*", "Exporting: {n} frames"): "내보내는 중: {n} 프레임",
+        ("*", "Precomputing: {done}/{total}"): "사전 계산 중: {done}/{total}",
         ("*", "No recorded object"): "기록된 객체 없음",
         ("*", "Resetting..."): "초기화 중...",
         ("*", "Play/record from beginning"): "처음부터 재생/기록",
@@ -776,6 +959,11 @@ translations = {
         ("*", "Stop playback and return to initial state"): "재생을 중지하고 초기 상태로 복귀",
         ("*", "Delete the selected step from the recording"): "기록에서 선택한 단계 삭제",
         ("*", "Restore Deleted Step"): "삭제된 단계 복원",
+        ("*", "Compact Steps"): "단계 압축",
+        ("Operator", "Compact Steps"): "단계 압축",
+        ("*", "Max Movement"): "최대 이동량",
+        ("*", "Max Steps"): "최대 단계 수",
+        ("*", "Steps: {before} -> {after} ({s:.2f}s)"): "단계: {before} -> {after} ({s:.2f}초)",
         ("*", "Restore the most recently deleted step"): "가장 최근에 삭제된 단계 복원",
         ("*", "Reset the camera for this step to its recorded state"): "이 단계의 카메라를 기록된 상태로 재설정",
         ("*", "Confirm and save the current camera for this step"): "이 단계의 현재 카메라를 확인하고 저장",
@@ -810,6 +998,8 @@ translations = {
         ("*", "Mesh Duration"): "Czas trwania siatki",
         ("*", "Set Start"): "Ustaw początek",
         ("*", "Set End"): "Ustaw koniec",
+        ("*", "Scrub"): "Przewijanie",
+        ("*", "Step {n} at {t:.2f}s ({ms:.1f} ms)"): "Krok {n} w {t:.2f}s ({ms:.1f} ms)",
         ("*", "Edge Display"): "Wyświetlanie krawędzi",
         ("*", "Mark Edge"): "Oznacz krawędź",
         ("*", "Confirm"): "Zatwierdź",
@@ -818,6 +1008,10 @@ translations = {
         ("*", "Edge Glow"): "Poświata krawędzi",
         ("*", "Global Settings"): "Ustawienia globalne",
         ("*", "Interpolation Steps"): "Kroki interpolacji",
+        ("*", "Real-time Playback"): "Odtwarzanie w czasie rzeczywistym",
+        ("*", "Adaptive Frames"): "Adaptacyjne klatki",
+        ("*", "Frame Budget"): "Budżet klatek",
+        ("*", "Budget"): "Budżet",
         ("*", "Replay Range (1..{n})"): "Zakres odtwarzania (1..{n})",
         ("*", "Start Step"): "Krok początkowy",
         ("*", "First recorded step to replay (1-based)"): "Pierwszy nagrany krok do odtworzenia (od 1)",
@@ -830,6 +1024,7 @@ translations = {
         ("*", "Record"): "Nagraj",
         ("*", "Play"): "Odtwórz",
         ("*", "Stop"): "Stop",
+        ("*", "Last playback: {fps:.1f} FPS, {dropped} dropped"): "Ostatnie odtwarzanie: {fps:.1f} FPS, pominięto {dropped}",
         ("*", "Frame Export (Sequence)"): "Eksport klatek (Sekwencja)",
         ("*", "File Prefix"): "Prefiks pliku",
         ("*", "Frame file prefix"): "Prefiks nazwy pliku klatki",
@@ -840,7 +1035,15 @@ translations = {
         ("*", "Final Render"): "Render końcowy",
         ("*", "Use scene render engine"): "Użyj silnika renderującego sceny",
         ("*", "Uses Output Path directory from Render Properties."): "Używa katalogu ścieżki wyjściowej z Właściwości Renderowania.",
+        ("*", "Batch Export"): "Eksport wsadowy",
+        ("*", "Workers"): "Procesy",
+        ("*", "Resume Export"): "Wznów eksport",
+        ("*", "Exported {n} frames in {s:.1f}s"): "Wyeksportowano {n} klatek w {s:.1f}s",
+        ("*", "Batch export failed: {error}"): "Eksport wsadowy nie powiódł się: {error}",
+        ("*", "Export incomplete: {n} of {total} frames written"): "Eksport niepełny: zapisano {n} z {total} klatek",
+        ("*", "Last export: {n} of {total} frames written"): "Ostatni eksport: zapisano {n} z {total} klatek",
         ("*", "Exporting: {n} frames"): "Eksportowanie: {n} klatek",
+        ("*", "Precomputing: {done}/{total}"): "Wstępne obliczanie: {done}/{total}",
         ("*", "No recorded object"): "Brak nagranego obiektu",
         ("*", "Resetting..."): "Resetowanie...",
         ("*", "Play/record from beginning"): "Odtwarzaj/nagraj od początku",
@@ -861,6 +1064,11 @@ translations = {
         ("*", "Stop playback and return to initial state"): "Zatrzymaj odtwarzanie i wróć do stanu początkowego",
         ("*", "Delete the selected step from the recording"): "Usuń wybrany krok z nagrania",
         ("*", "Restore Deleted Step"): "Przywróć usunięty krok",
+        ("*", "Compact Steps"): "Scal kroki",
+        ("Operator", "Compact Steps"): "Scal kroki",
+        ("*", "Max Movement"): "Maks. przesunięcie",
+        ("*", "Max Steps"): "Maks. liczba kroków",
+        ("*", "Steps: {before} -> {after} ({s:.2f}s)"): "Kroki: {before} -> {after} ({s:.2f} s)",
         ("*", "Restore the most recently deleted step"): "Przywróć ostatnio usunięty krok",
         ("*", "Reset the camera for this step to its recorded state"): "Zresetuj kamerę dla tego kroku do stanu nagranego",
         ("*", "Confirm and save the current camera for this step"): "Zatwierdź i zapisz bieżącą kamerę dla tego kroku",
@@ -895,6 +1103,8 @@ translations = {
         ("*", "Mesh Duration"): "Duração da malha",
         ("*", "Set Start"): "Definir início",
         ("*", "Set End"): "Definir fim",
+        ("*", "Scrub"): "Percorrer",
+        ("*", "Step {n} at {t:.2f}s ({ms:.1f} ms)"): "Etapa {n} em {t:.2f}s ({ms:.1f} ms)",
         ("*", "Edge Display"): "Exibição de arestas",
         ("*", "Mark Edge"): "Marcar aresta",
         ("*", "Confirm"): "Confirmar",
@@ -903,6 +1113,10 @@ translations = {
         ("*", "Edge Glow"): "Brilho da aresta",
         ("*", "Global Settings"): "Configurações globais",
         ("*", "Interpolation Steps"): "Passos de interpolação",
+        ("*", "Real-time Playback"): "Reprodução em tempo real",
+        ("*", "Adaptive Frames"): "Quadros adaptativos",
+        ("*", "Frame Budget"): "Orçamento de quadros",
+        ("*", "Budget"): "Orçamento",
         ("*", "Replay Range (1..{n})"): "Intervalo de reprodução (1..{n})",
         ("*", "Start Step"): "Passo inicial",
         ("*", "First recorded step to replay (1-based)"): "Primeiro passo gravado para reproduzir (base 1)",
@@ -915,6 +1129,7 @@ translations = {
         ("*", "Record"): "Gravar",
         ("*", "Play"): "Reproduzir",
         ("*", "Stop"): "Parar",
+        ("*", "Last playback: {fps:.1f} FPS, {dropped} dropped"): "Última reprodução: {fps:.1f} FPS, {dropped} descartados",
         ("*", "Frame Export (Sequence)"): "Exportar quadros (Sequência)",
         ("*", "File Prefix"): "Prefixo do arquivo",
         ("*", "Frame file prefix"): "Prefixo do nome do arquivo de quadros",
@@ -925,7 +1140,15 @@ translations = {
         ("*", "Final Render"): "Render final",
         ("*", "Use scene render engine"): "Usar mecanismo de renderização da cena",
         ("*", "Uses Output Path directory from Render Properties."): "Usa o diretório de saída das Propriedades de Renderização.",
+        ("*", "Batch Export"): "Exportação em lote",
+        ("*", "Workers"): "Processos",
+        ("*", "Resume Export"): "Retomar exportação",
+        ("*", "Exported {n} frames in {s:.1f}s"): "{n} quadros exportados em {s:.1f}s",
+        ("*", "Batch export failed: {error}"): "Falha na exportação em lote: {error}",
+        ("*", "Export incomplete: {n} of {total} frames written"): "Exportação incompleta: {n} de {total} quadros gravados",
+        ("*", "Last export: {n} of {total} frames written"): "Última exportação: {n} de {total} quadros gravados",
         ("*", "Exporting: {n} frames"): "Exportando: {n} quadros",
+        ("*", "Precomputing: {done}/{total}"): "Pré-calculando: {done}/{total}",
         ("*", "No recorded object"): "Nenhum objeto gravado",
         ("*", "Resetting..."): "Redefinindo...",
         ("*", "Play/record from beginning"): "Reproduzir/gravar do início",
@@ -946,6 +1169,11 @@ translations = {
         ("*", "Stop playback and return to initial state"): "Parar reprodução e retornar ao estado inicial",
         ("*", "Delete the selected step from the recording"): "Excluir o passo selecionado da gravação",
         ("*", "Restore Deleted Step"): "Restaurar passo excluído",
+        ("*", "Compact Steps"): "Compactar etapas",
+        ("Operator", "Compact Steps"): "Compactar etapas",
+        ("*", "Max Movement"): "Movimento máximo",
+        ("*", "Max Steps"): "Máximo de etapas",
+        ("*", "Steps: {before} -> {after} ({s:.2f}s)"): "Etapas: {before} -> {after} ({s:.2f} s)",
         ("*", "Restore the most recently deleted step"): "Restaurar o passo excluído mais recentemente",
         ("*", "Reset the camera for this step to its recorded state"): "Redefinir a câmera deste passo para seu estado gravado",
         ("*", "Confirm and save the current camera for this step"): "Confirmar e salvar a câmera atual para este passo",
@@ -980,6 +1208,8 @@ translations = {
         ("*", "Mesh Duration"): "Duração da malha",
         ("*", "Set Start"): "Definir início",
         ("*", "Set End"): "Definir fim",
+        ("*", "Scrub"): "Percorrer",
+        ("*", "Step {n} at {t:.2f}s ({ms:.1f} ms)"): "Passo {n} em {t:.2f}s ({ms:.1f} ms)",
         ("*", "Edge Display"): "Visualização de arestas",
         ("*", "Mark Edge"): "Marcar aresta",
         ("*", "Confirm"): "Confirmar",
@@ -988,6 +1218,10 @@ translations = {
         ("*", "Edge Glow"): "Brilho da aresta",
         ("*", "Global Settings"): "Definições globais",
         ("*", "Interpolation Steps"): "Passos de interpolação",
+        ("*", "Real-time Playback"): "Reprodução em tempo real",
+        ("*", "Adaptive Frames"): "Fotogramas adaptativos",
+        ("*", "Frame Budget"): "Orçamento de fotogramas",
+        ("*", "Budget"): "Orçamento",
         ("*", "Replay Range (1..{n})"): "Intervalo de reprodução (1..{n})",
         ("*", "Start Step"): "Passo inicial",
         ("*", "First recorded step to replay (1-based)"): "Primeiro passo gravado a reproduzir (base 1)",
@@ -1000,6 +1234,7 @@ translations = {
         ("*", "Record"): "Gravar",
         ("*", "Play"): "Reproduzir",
         ("*", "Stop"): "Parar",
+        ("*", "Last playback: {fps:.1f} FPS, {dropped} dropped"): "Última reprodução: {fps:.1f} FPS, {dropped} descartados",
         ("*", "Frame Export (Sequence)"): "Exportar fotogramas (Sequência)",
         ("*", "File Prefix"): "Prefixo do ficheiro",
         ("*", "Frame file prefix"): "Prefixo do nome do ficheiro de fotogramas",
@@ -1010,7 +1245,15 @@ translations = {
         ("*", "Final Render"): "Renderização final",
         ("*", "Use scene render engine"): "Usar motor de renderização da cena",
         ("*", "Uses Output Path directory from Render Properties."): "Usa o diretório de saída das Propriedades de Renderização.",
+        ("*", "Batch Export"): "Exportação em lote",
+        ("*", "Workers"): "Processos",
+        ("*", "Resume Export"): "Retomar exportação",
+        ("*", "Exported {n} frames in {s:.1f}s"): "{n} fotogramas exportados em {s:.1f}s",
+        ("*", "Batch export failed: {error}"): "A exportação em lote falhou: {error}",
+        ("*", "Export incomplete: {n} of {total} frames written"): "Exportação incompleta: {n} de {total} fotogramas gravados",
+        ("*", "Last export: {n} of {total} frames written"): "Última exportação: {n} de {total} fotogramas gravados",
         ("*", "Exporting: {n} frames"): "A exportar: {n} fotogramas",
+        ("*", "Precomputing: {done}/{total}"): "A pré-calcular: {done}/{total}",
         ("*", "No recorded object"): "Nenhum objeto gravado",
         ("*", "Resetting..."): "A repor...",
         ("*", "Play/record from beginning"): "Reproduzir/gravar do início",
@@ -1031,6 +1274,11 @@ translations = {
         ("*", "Stop playback and return to initial state"): "Parar reprodução e regressar ao estado inicial",
         ("*", "Delete the selected step from the recording"): "Eliminar o passo selecionado da gravação",
         ("*", "Restore Deleted Step"): "Restaurar passo eliminado",
+        ("*", "Compact Steps"): "Compactar passos",
+        ("Operator", "Compact Steps"): "Compactar passos",
+        ("*", "Max Movement"): "Movimento máximo",
+        ("*", "Max Steps"): "Máximo de passos",
+        ("*", "Steps: {before} -> {after} ({s:.2f}s)"): "Passos: {before} -> {after} ({s:.2f} s)",
         ("*", "Restore the most recently deleted step"): "Restaurar o passo eliminado mais recentemente",
         ("*", "Reset the camera for this step to its recorded state"): "Repor a câmara deste passo para o seu estado gravado",
         ("*", "Confirm and save the current camera for this step"): "Confirmar e guardar a câmara atual para este passo",
@@ -1065,6 +1313,8 @@ translations = {
         ("*", "Mesh Duration"): "Длительность меша",
         ("*", "Set Start"): "Установить начало",
         ("*", "Set End"): "Установить конец",
+        ("*", "Scrub"): "Перемотка",
+        ("*", "Step {n} at {t:.2f}s ({ms:.1f} ms)"): "Шаг {n} на {t:.2f} с ({ms:.1f} мс)",
         ("*", "Edge Display"): "Отображение рёбер",
         ("*", "Mark Edge"): "Отметить ребро",
         ("*", "Confirm"): "Подтвердить",
@@ -1073,6 +1323,10 @@ translations = {
         ("*", "Edge Glow"): "Свечение ребра",
         ("*", "Global Settings"): "Глобальные настройки",
         ("*", "Interpolation Steps"): "Шаги интерполяции",
+        ("*", "Real-time Playback"): "Воспроизведение в реальном времени",
+        ("*", "Adaptive Frames"): "Адаптивные кадры",
+        ("*", "Frame Budget"): "Бюджет кадров",
+        ("*", "Budget"): "Бюджет",
         ("*", "Replay Range (1..{n})"): "Диапазон воспроизведения (1..{n})",
         ("*", "Start Step"): "Начальный шаг",
         ("*", "First recorded step to replay (1-based)"): "Первый шаг воспроизведения (с 1)",
@@ -1085,6 +1339,7 @@ translations = {
         ("*", "Record"): "Запись",
         ("*", "Play"): "Воспроизведение",
         ("*", "Stop"): "Стоп",
+        ("*", "Last playback: {fps:.1f} FPS, {dropped} dropped"): "Последнее воспроизведение: {fps:.1f} FPS, пропущено {dropped}",
         ("*", "Frame Export (Sequence)"): "Экспорт кадров (Последовательность)",
         ("*", "File Prefix"): "Префикс файла",
         ("*", "Frame file prefix"): "Префикс имени файла кадров",
@@ -1095,7 +1350,15 @@ translations = {
         ("*", "Final Render"): "Финальный рендер",
         ("*", "Use scene render engine"): "Использовать движок рендера сцены",
         ("*", "Uses Output Path directory from Render Properties."): "Использует папку вывода из Свойств Рендера.",
+        ("*", "Batch Export"): "Пакетный экспорт",
+        ("*", "Workers"): "Процессы",
+        ("*", "Resume Export"): "Продолжить экспорт",
+        ("*", "Exported {n} frames in {s:.1f}s"): "Экспортировано {n} кадров за {s:.1f} с",
+        ("*", "Batch export failed: {error}"): "Пакетный экспорт не удался: {error}",
+        ("*", "Export incomplete: {n} of {total} frames written"): "Экспорт не завершён: записано {n} из {total} кадров",
+        ("*", "Last export: {n} of {total} frames written"): "Последний экспорт: записано {n} из {total} кадров",
         ("*", "Exporting: {n} frames"): "Экспорт: {n} кадров",
+        ("*", "Precomputing: {done}/{total}"): "Предрасчёт: {done}/{total}",
         ("*", "No recorded object"): "Нет записанного объекта",
         ("*", "Resetting..."): "Сброс...",
         ("*", "Play/record from beginning"): "Воспроизвести/записать с начала",
@@ -1116,6 +1379,11 @@ translations = {
         ("*", "Stop playback and return to initial state"): "Остановить воспроизведение и вернуться к начальному состоянию",
         ("*", "Delete the selected step from the recording"): "Удалить выбранный шаг из записи",
         ("*", "Restore Deleted Step"): "Восстановить удаленный шаг",
+        ("*", "Compact Steps"): "Объединить шаги",
+        ("Operator", "Compact Steps"): "Объединить шаги",
+        ("*", "Max Movement"): "Макс. смещение",
+        ("*", "Max Steps"): "Макс. шагов",
+        ("*", "Steps: {before} -> {after} ({s:.2f}s)"): "Шаги: {before} -> {after} ({s:.2f} с)",
         ("*", "Restore the most recently deleted step"): "Восстановить последний удаленный шаг",
         ("*", "Reset the camera for this step to its recorded state"): "Сбросить камеру этого шага к записанному состоянию",
         ("*", "Confirm and save the current camera for this step"): "Подтвердить и сохранить текущую камеру для этого шага",
@@ -1150,6 +1418,8 @@ translations = {
         ("*", "Mesh Duration"): "Тривалість сітки",
         ("*", "Set Start"): "Встановити початок",
         ("*", "Set End"): "Встановити кінець",
+        ("*", "Scrub"): "Перемотування",
+        ("*", "Step {n} at {t:.2f}s ({ms:.1f} ms)"): "Крок {n} на {t:.2f} с ({ms:.1f} мс)",
         ("*", "Edge Display"): "Відображення ребер",
         ("*", "Mark Edge"): "Позначити ребро",
         ("*", "Confirm"): "Підтвердити",
@@ -1158,6 +1428,10 @@ translations = {
         ("*", "Edge Glow"): "Світіння ребра",
         ("*", "Global Settings"): "Глобальні налаштування",
         ("*", "Interpolation Steps"): "Кроки інтерполяції",
+        ("*", "Real-time Playback"): "Відтворення в реальному часі",
+        ("*", "Adaptive Frames"): "Адаптивні кадри",
+        ("*", "Frame Budget"): "Бюджет кадрів",
+        ("*", "Budget"): "Бюджет",
         ("*", "Replay Range (1..{n})"): "Діапазон відтворення (1..{n})",
         ("*", "Start Step"): "Початковий крок",
         ("*", "First recorded step to replay (1-based)"): "Перший крок відтворення (з 1)",
@@ -1170,6 +1444,7 @@ translations = {
         ("*", "Record"): "Запис",
         ("*", "Play"): "Відтворення",
         ("*", "Stop"): "Стоп",
+        ("*", "Last playback: {fps:.1f} FPS, {dropped} dropped"): "Останнє відтворення: {fps:.1f} FPS, пропущено {dropped}",
         ("*", "Frame Export (Sequence)"): "Експорт кадрів (Послідовність)",
         ("*", "File Prefix"): "Префікс файлу",
         ("*", "Frame file prefix"): "Префікс імені файлу кадрів",
@@ -1180,7 +1455,15 @@ translations = {
         ("*", "Final Render"): "Фінальний рендер",
         ("*", "Use scene render engine"): "Використовувати рушій рендера сцени",
         ("*", "Uses Output Path directory from Render Properties."): "Використовує теку виводу з Властивостей Рендера.",
+        ("*", "Batch Export"): "Пакетний експорт",
+        ("*", "Workers"): "Процеси",
+        ("*", "Resume Export"): "Продовжити експорт",
+        ("*", "Exported {n} frames in {s:.1f}s"): "Експортовано {n} кадрів за {s:.1f} с",
+        ("*", "Batch export failed: {error}"): "Пакетний експорт не вдався: {error}",
+        ("*", "Export incomplete: {n} of {total} frames written"): "Експорт не завершено: записано {n} з {total} кадрів",
+        ("*", "Last export: {n} of {total} frames written"): "Останній експорт: записано {n} з {total} кадрів",
         ("*", "Exporting: {n} frames"): "Експорт: {n} кадрів",
+        ("*", "Precomputing: {done}/{total}"): "Попередній розрахунок: {done}/{total}",
         ("*", "No recorded object"): "Немає записаного об'єкта",
         ("*", "Resetting..."): "Скидання...",
         ("*", "Play/record from beginning"): "Відтворити/записати з початку",
@@ -1201,6 +1484,11 @@ translations = {
         ("*", "Stop playback and return to initial state"): "Зупинити відтворення та повернутися до початкового стану",
         ("*", "Delete the selected step from the recording"): "Видалити вибраний крок із запису",
         ("*", "Restore Deleted Step"): "Відновити видалений крок",
+        ("*", "Compact Steps"): "Обʼєднати кроки",
+        ("Operator", "Compact Steps"): "Обʼєднати кроки",
+        ("*", "Max Movement"): "Макс. зміщення",
+        ("*", "Max Steps"): "Макс. кроків",
+        ("*", "Steps: {before} -> {after} ({s:.2f}s)"): "Кроки: {before} -> {after} ({s:.2f} с)",
         ("*", "Restore the most recently deleted step"): "Відновити останній видалений крок",
         ("*", "Reset the camera for this step to its recorded state"): "Скинути камеру цього кроку до записаного стану",
         ("*", "Confirm and save the current camera for this step"): "Підтвердити та зберегти поточну камеру для цього кроку",
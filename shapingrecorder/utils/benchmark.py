@@ -0,0 +1,347 @@
+# Benchmark helpers for ShapingRecorder
+#
+# Run from Blender's Python console with the add-on enabled, e.g.:
+#   from shapingrecorder.utils import benchmark
+#   benchmark.bench_mesh_hash(C.active_object)
+
+import json
+import time
+from array import array
+
+import bmesh
+import bpy
+import numpy as np
+from mathutils import Vector, kdtree
+from mathutils.bvhtree import BVHTree
+
+from ..core.correspondence import hybrid_sources
+from ..core.data import deserialize_state, serialize_state
+from ..core.hashing import BlockHasher
+from ..core.mesh_ops import InterpolationKernel, compute_step_cache, fill_mesh, get_mesh_hash
+from ..data import persistence
+from ..data import state
+
+
+def _time_call(func, repeat):
+    timings = []
+    result = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), sum(timings) / len(timings), result
+
+
+def _report(title, rows):
+    print(f"[ShapingRecorder] {title}")
+    for name, best, mean in rows:
+        print(f"  {name:<24} best {best * 1000.0:9.2f} ms   mean {mean * 1000.0:9.2f} ms")
+
+
+def _legacy_mesh_hash(obj):
+    """Tuple-based hash used before the NumPy engine, kept for comparison"""
+    mesh = obj.data
+    if obj.mode == "EDIT":
+        bm = bmesh.from_edit_mesh(mesh)
+        verts = tuple(
+            (round(v.co.x, 4), round(v.co.y, 4), round(v.co.z, 4)) for v in bm.verts
+        )
+        edges = len(bm.edges)
+    else:
+        coords = [0.0] * (len(mesh.vertices) * 3)
+        mesh.vertices.foreach_get("co", coords)
+        verts = tuple(round(c, 4) for c in coords)
+        edges = len(mesh.edges)
+    return hash((verts, edges))
+
+
+def bench_mesh_hash(obj, repeat=10):
+    """Compare the legacy tuple hash with the vectorized buffer hash"""
+    legacy_best, legacy_mean, _ = _time_call(lambda: _legacy_mesh_hash(obj), repeat)
+    numpy_best, numpy_mean, _ = _time_call(lambda: get_mesh_hash(obj), repeat)
+    _report(
+        f"Mesh hash, {len(obj.data.vertices)} vertices ({obj.mode})",
+        [
+            ("tuple hash", legacy_best, legacy_mean),
+            ("numpy hash", numpy_best, numpy_mean),
+        ],
+    )
+    return {
+        "vertices": len(obj.data.vertices),
+        "legacy_ms": legacy_best * 1000.0,
+        "numpy_ms": numpy_best * 1000.0,
+        "speedup": legacy_best / max(numpy_best, 1e-9),
+    }
+
+
+def bench_block_hasher(obj, repeat=10):
+    """Compare a full hash with an idle tick of the incremental block hasher"""
+    hasher = BlockHasher()
+    hasher.update(obj)
+    full_best, full_mean, _ = _time_call(lambda: get_mesh_hash(obj), repeat)
+    idle_best, idle_mean, _ = _time_call(lambda: hasher.update(obj), repeat)
+    _report(
+        f"Block hasher, {len(obj.data.vertices)} vertices ({obj.mode})",
+        [
+            ("full hash", full_best, full_mean),
+            ("incremental idle tick", idle_best, idle_mean),
+        ],
+    )
+    return {
+        "vertices": len(obj.data.vertices),
+        "full_ms": full_best * 1000.0,
+        "idle_ms": idle_best * 1000.0,
+    }
+
+
+def bench_persistence(context, repeat=3):
+    """Compare save/load time and size of the binary container with the JSON path"""
+    settings = state.get_settings(context)
+
+    def json_save():
+        return json.dumps({
+            name: {
+                "initial_mesh": serialize_state(rec["initial_mesh"]),
+                "history": [serialize_state(s) for s in rec["history"]],
+            }
+            for name, rec in state.object_records.items()
+        })
+
+    def json_load(payload):
+        return {
+            name: [deserialize_state(s) for s in rec["history"]]
+            for name, rec in json.loads(payload).items()
+        }
+
+    json_save_best, json_save_mean, payload = _time_call(json_save, repeat)
+    json_load_best, json_load_mean, _ = _time_call(lambda: json_load(payload), repeat)
+    bin_save_best, bin_save_mean, blob = _time_call(lambda: persistence.pack_records(settings), repeat)
+    bin_load_best, bin_load_mean, _ = _time_call(lambda: persistence.unpack_records(blob), repeat)
+
+    json_size = len(payload.encode("utf-8"))
+    _report(
+        f"Persistence, {sum(len(r['history']) for r in state.object_records.values())} steps",
+        [
+            ("json save", json_save_best, json_save_mean),
+            ("json load", json_load_best, json_load_mean),
+            ("binary save", bin_save_best, bin_save_mean),
+            ("binary load", bin_load_best, bin_load_mean),
+        ],
+    )
+    print(f"  size: json {json_size / 1048576:.2f} MB, binary {len(blob) / 1048576:.2f} MB")
+    return {
+        "json_save_ms": json_save_best * 1000.0,
+        "json_load_ms": json_load_best * 1000.0,
+        "binary_save_ms": bin_save_best * 1000.0,
+        "binary_load_ms": bin_load_best * 1000.0,
+        "json_bytes": json_size,
+        "binary_bytes": len(blob),
+    }
+
+
+def _legacy_hybrid_sources(source_state, target_state, snap_threshold, surface_epsilon):
+    """Per-vertex BVHTree/KDTree loop used before the batched search, kept for comparison"""
+    verts1 = source_state.coords.tolist()
+    bm_temp = bmesh.new()
+    source_bm_verts = [bm_temp.verts.new(co) for co in verts1]
+    bm_temp.verts.ensure_lookup_table()
+    for e in source_state.edges.tolist():
+        try: bm_temp.edges.new((source_bm_verts[e[0]], source_bm_verts[e[1]]))
+        except ValueError: pass
+    for f in source_state.iter_faces():
+        try: bm_temp.faces.new([source_bm_verts[i] for i in f])
+        except ValueError: pass
+    if bm_temp.faces:
+        bmesh.ops.triangulate(bm_temp, faces=bm_temp.faces)
+    bvh = BVHTree.FromBMesh(bm_temp) if bm_temp.faces else None
+
+    kd = kdtree.KDTree(len(verts1))
+    for i, v in enumerate(verts1):
+        kd.insert(v, i)
+    kd.balance()
+
+    source_locations = []
+    for v2 in target_state.coords.tolist():
+        loc_vert, _, dist_vert = kd.find(v2)
+        start_loc = loc_vert
+        if dist_vert >= snap_threshold and bvh:
+            loc_surf, _, _, dist_surf = bvh.find_nearest(v2)
+            if loc_surf and dist_surf < surface_epsilon:
+                start_loc = loc_surf
+        source_locations.append(start_loc)
+
+    bm_temp.free()
+    return np.array(source_locations, dtype=np.float32).reshape(-1, 3)
+
+
+def bench_correspondence(source_state, target_state, repeat=3, snap_threshold=0.02, surface_epsilon=1e-4):
+    """
+    Compare the per-vertex hybrid correspondence loop with the batched search,
+    and check that both give the same start positions.
+
+    e.g. for a recorded step i with a topology change:
+        history = state.object_records[name]["history"]
+        benchmark.bench_correspondence(history[i - 1], history[i])
+    """
+    legacy_best, legacy_mean, legacy = _time_call(
+        lambda: _legacy_hybrid_sources(source_state, target_state, snap_threshold, surface_epsilon), repeat
+    )
+    batched_best, batched_mean, batched = _time_call(
+        lambda: hybrid_sources(source_state, target_state, snap_threshold, surface_epsilon), repeat
+    )
+    deviation = np.linalg.norm(legacy - batched, axis=1) if len(legacy) else np.zeros(0)
+    # 等距最近点可能选到不同顶点，容差外的才算不一致
+    mismatched = int(np.count_nonzero(deviation > max(surface_epsilon, 1e-5)))
+    _report(
+        f"Correspondence, {source_state.n_verts} -> {target_state.n_verts} vertices",
+        [
+            ("bvh/kdtree loop", legacy_best, legacy_mean),
+            ("batched numpy", batched_best, batched_mean),
+        ],
+    )
+    print(f"  max deviation {float(deviation.max(initial=0.0)):.6f}, mismatched {mismatched}")
+    return {
+        "legacy_ms": legacy_best * 1000.0,
+        "batched_ms": batched_best * 1000.0,
+        "speedup": legacy_best / max(batched_best, 1e-9),
+        "max_deviation": float(deviation.max(initial=0.0)),
+        "mismatched": mismatched,
+    }
+
+
+def bench_interpolation(obj, source_state, target_state, steps=60):
+    """
+    Compare one step of Vector.lerp interpolation with the NumPy kernel,
+    writing every frame to obj's mesh (which must match the target vertex count).
+    """
+    mesh = obj.data
+    cache = compute_step_cache(source_state, target_state)
+    times = [(i + 1) / steps for i in range(steps)]
+
+    def legacy():
+        starts = [Vector(co) for co in (cache["sources"] if "sources" in cache else source_state.coords).tolist()]
+        ends = [Vector(co) for co in target_state.coords.tolist()]
+        for t in times:
+            verts = [s.lerp(e, t) for s, e in zip(starts, ends)]
+            mesh.vertices.foreach_set("co", array("f", (c for v in verts for c in v)))
+            mesh.update()
+
+    def kernel():
+        k = InterpolationKernel(source_state, target_state, cache)
+        for t in times:
+            mesh.vertices.foreach_set("co", k.evaluate(t).reshape(-1))
+            mesh.update()
+
+    legacy_best, legacy_mean, _ = _time_call(legacy, 1)
+    kernel_best, kernel_mean, _ = _time_call(kernel, 3)
+    _report(
+        f"Interpolation, {target_state.n_verts} vertices x {steps} frames",
+        [
+            ("Vector.lerp", legacy_best, legacy_mean),
+            ("numpy kernel", kernel_best, kernel_mean),
+        ],
+    )
+    return {
+        "legacy_fps": steps / max(legacy_best, 1e-9),
+        "kernel_fps": steps / max(kernel_best, 1e-9),
+        "speedup": legacy_best / max(kernel_best, 1e-9),
+    }
+
+
+def _legacy_build_mesh(mesh, s):
+    """Per-element bmesh build used before the bulk builder, kept for comparison"""
+    bm = bmesh.new()
+    for co in s.coords.tolist():
+        bm.verts.new(co)
+    bm.verts.ensure_lookup_table()
+    for e in s.edges.tolist():
+        try:
+            bm.edges.new((bm.verts[e[0]], bm.verts[e[1]]))
+        except ValueError:
+            pass
+    for f in s.iter_faces():
+        try:
+            bm.faces.new([bm.verts[i] for i in f])
+        except ValueError:
+            pass
+    bm.to_mesh(mesh)
+    bm.free()
+
+
+def bench_mesh_build(s, repeat=3):
+    """Compare building a recorded state through bmesh with the foreach_set builder"""
+    mesh = bpy.data.meshes.new("__ShapingRecorderBench")
+    try:
+        legacy_best, legacy_mean, _ = _time_call(lambda: (mesh.clear_geometry(), _legacy_build_mesh(mesh, s)), repeat)
+        bulk_best, bulk_mean, _ = _time_call(lambda: fill_mesh(mesh, s), repeat)
+    finally:
+        bpy.data.meshes.remove(mesh)
+    _report(
+        f"Mesh build, {s.n_verts} vertices / {s.n_faces} faces",
+        [
+            ("bmesh", legacy_best, legacy_mean),
+            ("foreach_set", bulk_best, bulk_mean),
+        ],
+    )
+    return {
+        "legacy_ms": legacy_best * 1000.0,
+        "bulk_ms": bulk_best * 1000.0,
+        "speedup": legacy_best / max(bulk_best, 1e-9),
+    }
+
+
+def bench_scrub(context, samples=20):
+    """Time scrub_to at evenly spaced points of the current recording (target: < 30 ms each)"""
+    from ..operators import playback
+
+    duration = playback.scrub_duration(context)
+    times = [duration * (i + 0.5) / samples for i in range(samples)]
+    timings = []
+    for t in times:
+        start = time.perf_counter()
+        playback.scrub_to(context, t)
+        timings.append(time.perf_counter() - start)
+    if not timings:
+        return {}
+    _report(
+        f"Scrub, {len(state.get_current_history())} steps, {samples} samples",
+        [("scrub_to", min(timings), sum(timings) / len(timings))],
+    )
+    print(f"  worst {max(timings) * 1000.0:.2f} ms")
+    return {
+        "best_ms": min(timings) * 1000.0,
+        "mean_ms": sum(timings) / len(timings) * 1000.0,
+        "worst_ms": max(timings) * 1000.0,
+    }
+
+
+def bench_parallel_export(context, worker_counts=(1, 4, 8, 16), frames=None, out_dir=None):
+    """
+    Time batch export of the current recording with different worker counts.
+    frames limits each run to the first N frames; out_dir defaults to a temp directory.
+    """
+    import shutil
+    import tempfile
+
+    from ..operators import batch
+
+    frame_range = (0, frames - 1) if frames else None
+    results = {}
+    rows = []
+    for workers in worker_counts:
+        target = out_dir or tempfile.mkdtemp(prefix="shapingrecorder_bench_")
+        try:
+            stats = batch.export_frames_parallel(context, workers, out_dir=target, frame_range=frame_range)
+        finally:
+            if not out_dir:
+                shutil.rmtree(target, ignore_errors=True)
+        if not stats:
+            return results
+        results[workers] = stats["seconds"]
+        rows.append((f"{workers} workers", stats["seconds"], stats["seconds"]))
+    _report("Parallel export", rows)
+    base = results.get(worker_counts[0])
+    if base:
+        for workers, seconds in results.items():
+            print(f"  {workers:>3} workers: speedup {base / max(seconds, 1e-9):.2f}x")
+    return results
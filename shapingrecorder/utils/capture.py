@@ -0,0 +1,101 @@
+# Viewport frame capture into a NumPy pixel buffer
+#
+# bpy.ops.render.opengl renders into the Render Result, whose pixels cannot
+# be read from Python. Drawing the 3D view into an offscreen buffer instead
+# yields the frame as RGBA bytes that can be piped or encoded directly.
+
+import bpy
+import gpu
+import numpy as np
+
+
+def output_size(scene):
+    """Pixel size of the scene's render output"""
+    r = scene.render
+    scale = r.resolution_percentage / 100.0
+    return max(1, int(r.resolution_x * scale)), max(1, int(r.resolution_y * scale))
+
+
+def _view3d(context):
+    screen = context.screen or bpy.context.screen
+    if not screen:
+        return None
+    for area in screen.areas:
+        if area.type == "VIEW_3D" and area.spaces.active.region_3d:
+            for region in area.regions:
+                if region.type == "WINDOW":
+                    return area.spaces.active, region
+    return None
+
+
+class ViewportCapture:
+    """
+    Offscreen draw of a 3D view at the render output size, read back as
+    pixels. Like bpy.ops.render.opengl(view_context=True), a camera view is
+    drawn through the scene camera and any other view keeps its lens, with
+    the longer side of the output filling the view.
+    """
+
+    def __init__(self, context, space, region):
+        self.scene = context.scene
+        self.view_layer = context.view_layer
+        self.space = space
+        self.region = region
+        self.width, self.height = output_size(self.scene)
+        self._offscreen = gpu.types.GPUOffScreen(self.width, self.height)
+        self._buffer = gpu.types.Buffer("UBYTE", self.width * self.height * 4)
+
+    def _matrices(self):
+        rv3d = self.space.region_3d
+        camera = self.scene.camera
+        if rv3d.view_perspective == "CAMERA" and camera:
+            r = self.scene.render
+            projection = camera.calc_matrix_camera(
+                bpy.context.evaluated_depsgraph_get(),
+                x=self.width, y=self.height, scale_x=r.pixel_aspect_x, scale_y=r.pixel_aspect_y,
+            )
+            return camera.matrix_world.inverted(), projection
+        # 视口镜头按较长边铺满，只按输出宽高比重算两轴缩放
+        projection = rv3d.window_matrix.copy()
+        scale = projection[0][0] if self.region.width >= self.region.height else projection[1][1]
+        aspect = self.width / self.height
+        projection[0][0] = scale if aspect >= 1.0 else scale / aspect
+        projection[1][1] = scale * aspect if aspect >= 1.0 else scale
+        return rv3d.view_matrix.copy(), projection
+
+    def grab(self):
+        """Draw the view and return its pixels as a (height, width, 4) uint8 RGBA array, top row first"""
+        view_matrix, projection = self._matrices()
+        self._offscreen.draw_view3d(
+            self.scene, self.view_layer, self.space, self.region, view_matrix, projection,
+            do_color_management=True,
+        )
+        with self._offscreen.bind():
+            fb = gpu.state.active_framebuffer_get()
+            fb.read_color(0, 0, self.width, self.height, 4, 0, "UBYTE", data=self._buffer)
+        try:
+            pixels = np.frombuffer(self._buffer, dtype=np.uint8)
+        except TypeError:
+            pixels = np.array(self._buffer.to_list(), dtype=np.uint8)
+        # OpenGL 的行序自下而上
+        return np.flipud(pixels.reshape(self.height, self.width, 4)).copy()
+
+    def free(self):
+        self._offscreen.free()
+
+
+def viewport_capture(context):
+    """
+    ViewportCapture of the first 3D view on screen, or None when frames
+    cannot be read back (background mode, no 3D view, no GPU context).
+    """
+    if bpy.app.background:
+        return None
+    found = _view3d(context)
+    if not found:
+        return None
+    try:
+        return ViewportCapture(context, *found)
+    except Exception as e:
+        print(f"Viewport capture unavailable: {e}")
+        return None
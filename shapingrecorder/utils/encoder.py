@@ -0,0 +1,155 @@
+# Streaming video export through an ffmpeg subprocess
+#
+# Frames are encoded while playback runs instead of being collected in a
+# temporary directory and re-rendered through the VSE afterwards.
+
+import os
+import shutil
+import subprocess
+import tempfile
+
+import numpy as np
+
+CONTAINER_EXTENSIONS = {
+    "MPEG1": ".mpg", "MPEG2": ".dvd", "MPEG4": ".mp4", "AVI": ".avi",
+    "QUICKTIME": ".mov", "DV": ".dv", "OGG": ".ogv", "MKV": ".mkv",
+    "FLASH": ".flv", "WEBM": ".webm",
+}
+
+CODECS = {
+    "H264": "libx264", "H265": "libx265", "AV1": "libaom-av1", "WEBM": "libvpx-vp9",
+    "MPEG1": "mpeg1video", "MPEG2": "mpeg2video", "MPEG4": "mpeg4", "THEORA": "libtheora",
+    "DNXHD": "dnxhd", "DV": "dvvideo", "FLASH": "flv", "FFV1": "ffv1",
+    "HUFFYUV": "huffyuv", "PNG": "png", "QTRLE": "qtrle",
+}
+
+# 这些编码器保留 RGB(A)，其余统一输出 yuv420p 以便播放器兼容
+RGB_CODECS = {"ffv1", "huffyuv", "png", "qtrle", "rawvideo"}
+
+CRF = {"LOSSLESS": 0, "PERC_LOSSLESS": 17, "HIGH": 20, "MEDIUM": 23, "LOW": 26, "VERYLOW": 29, "LOWEST": 32}
+
+
+def ffmpeg_path():
+    """Path of the ffmpeg executable on PATH, or None"""
+    return shutil.which("ffmpeg")
+
+
+def output_settings(scene):
+    """Return (extension, codec, extra ffmpeg args) matching the scene's movie output settings"""
+    fmt = scene.render.image_settings.file_format
+    if fmt == "AVI_JPEG":
+        return ".avi", "mjpeg", ["-q:v", "2"]
+    if fmt == "AVI_RAW":
+        return ".avi", "rawvideo", []
+
+    ff = scene.render.ffmpeg
+    ext = CONTAINER_EXTENSIONS.get(ff.format, ".mp4")
+    codec = CODECS.get(ff.codec, "libx264")
+    args = []
+    crf = CRF.get(getattr(ff, "constant_rate_factor", "NONE"))
+    if crf is not None and codec in {"libx264", "libx265", "libvpx-vp9", "libaom-av1"}:
+        args += ["-crf", str(crf)]
+        if codec in {"libvpx-vp9", "libaom-av1"}:
+            args += ["-b:v", "0"]
+    elif ff.video_bitrate > 0 and codec not in RGB_CODECS:
+        args += ["-b:v", f"{ff.video_bitrate}k"]
+    return ext, codec, args
+
+
+class VideoStream:
+    """
+    An ffmpeg process encoding frames piped to its stdin.
+
+    With size (width, height), frames are raw RGBA pixel buffers passed to
+    push_pixels(), e.g. from a ViewportCapture. Without it the stream reads
+    PNG frames: the Render Result image has no readable pixel buffer from
+    Python, so a frame is saved once to a single scratch file (overwritten
+    every frame) and its bytes are piped on with push_scratch(). Either way
+    nothing accumulates on disk and no second encode pass is needed.
+    repeat() sends the previous frame again without rendering it.
+    """
+
+    def __init__(self, ffmpeg, filepath, fps, codec, args=(), size=None):
+        self.filepath = filepath
+        self.frames = 0
+        self.scratch_path = None
+        self._last = None
+        if size is None:
+            fd, self.scratch_path = tempfile.mkstemp(prefix="shapingrecorder_frame_", suffix=".png")
+            os.close(fd)
+            source = ["-f", "image2pipe", "-c:v", "png"]
+        else:
+            source = ["-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{size[0]}x{size[1]}"]
+        self._log = tempfile.TemporaryFile()
+        cmd = [
+            ffmpeg, "-y", "-loglevel", "error",
+            *source, "-framerate", f"{fps:.6f}", "-i", "-",
+            "-c:v", codec, *args,
+        ]
+        if codec not in RGB_CODECS:
+            # yuv420p 要求偶数尺寸
+            cmd += ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-pix_fmt", "yuv420p"]
+        cmd.append(filepath)
+        try:
+            self.process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=self._log)
+        except OSError:
+            self._cleanup()
+            raise
+
+    def push_scratch(self):
+        """Send the frame currently saved in scratch_path; returns success"""
+        with open(self.scratch_path, "rb") as f:
+            data = f.read()
+        if not data:
+            return False
+        self._last = data
+        return self._write(data)
+
+    def push_pixels(self, pixels):
+        """Send a (height, width, 4) uint8 RGBA frame, top row first; returns success"""
+        data = np.ascontiguousarray(pixels, dtype=np.uint8).tobytes()
+        self._last = data
+        return self._write(data)
+
+    def repeat(self):
+        """Send the previous frame again; returns False when there is none"""
+        return self._last is not None and self._write(self._last)
+
+    def _write(self, data):
+        try:
+            self.process.stdin.write(data)
+        except (BrokenPipeError, ValueError) as e:
+            print(f"Video stream failed: {e} {self._errors()}")
+            return False
+        self.frames += 1
+        return True
+
+    def close(self):
+        """Finish the encode; returns True when ffmpeg exited cleanly"""
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+        code = self.process.wait()
+        if code != 0:
+            print(f"Video encode failed ({code}): {self._errors()}")
+        self._cleanup()
+        return code == 0
+
+    def abort(self):
+        self.process.kill()
+        self.process.wait()
+        self._cleanup()
+
+    def _errors(self):
+        self._log.seek(0)
+        return self._log.read().decode(errors="replace").strip()
+
+    def _cleanup(self):
+        self._log.close()
+        if self.scratch_path is None:
+            return
+        try:
+            os.remove(self.scratch_path)
+        except OSError:
+            pass
@@ -1,74 +1,409 @@
 import bpy
+import hashlib
+import json
 import os
+import shutil
+import time
 from ..data import state
+from . import capture
+from . import encoder
+from . import frame_writer
 
-def maybe_render_viewport_frame(context):
-    if not state.is_exporting_frames:
-        return
+MOVIE_FORMATS = {"FFMPEG", "AVI_JPEG", "AVI_RAW"}
+FRAME_TRAILERS = {".png": b"IEND\xaeB`\x82", ".jpg": b"\xff\xd9"}
 
-    settings = state.get_settings(context)
-    scene = context.scene
+MANIFEST_VERSION = 2
+CHECKPOINT_INTERVAL = 25
 
-    
-    if state._is_video_export and state._temp_frame_dir:
-        out_dir = state._temp_frame_dir
-    else:
-        base_path = bpy.path.abspath(scene.render.filepath)
-        out_dir = os.path.dirname(base_path) if base_path else bpy.path.abspath("//")
-    os.makedirs(out_dir, exist_ok=True)
-
-    def _ext_from_format(fmt):
-        mapping = {
-            "PNG": ".png", "JPEG": ".jpg", "JPEG2000": ".jp2",
-            "OPEN_EXR": ".exr", "OPEN_EXR_MULTILAYER": ".exr",
-            "TIFF": ".tif", "TARGA": ".tga", "TARGA_RAW": ".tga",
-            "BMP": ".bmp", "WEBP": ".webp", "HDR": ".hdr",
-            "DPX": ".dpx", "CINEON": ".cin", "IRIS": ".rgb",
-        }
-        return mapping.get(fmt, ".png")
 
-    prev_path = scene.render.filepath
-    prev_format = scene.render.image_settings.file_format
-    prev_color_mode = scene.render.image_settings.color_mode
+def frame_extension(fmt):
+    mapping = {
+        "PNG": ".png", "JPEG": ".jpg", "JPEG2000": ".jp2",
+        "OPEN_EXR": ".exr", "OPEN_EXR_MULTILAYER": ".exr",
+        "TIFF": ".tif", "TARGA": ".tga", "TARGA_RAW": ".tga",
+        "BMP": ".bmp", "WEBP": ".webp", "HDR": ".hdr",
+        "DPX": ".dpx", "CINEON": ".cin", "IRIS": ".rgb",
+    }
+    return mapping.get(fmt, ".png")
+
+
+def output_dir(scene):
+    """Directory of the scene's render output path"""
+    base_path = bpy.path.abspath(scene.render.filepath)
+    return os.path.dirname(base_path) if base_path else bpy.path.abspath("//")
+
+
+def _rounded(value):
+    if isinstance(value, str) or value is None:
+        return value
+    if hasattr(value, "__len__"):
+        return tuple(round(float(v), 6) for v in value)
+    return round(float(value), 6)
+
+
+def frame_fingerprint(mesh_key, camera, view=None):
+    """
+    Hashable description of what a frame shows: a key of the mesh state
+    plus the camera (and, for viewport renders, the view) rounded to 1e-6.
+    Two frames with equal fingerprints render to the same image. Returns
+    None when the mesh key holds a missing state hash.
+    """
+    if None in mesh_key:
+        return None
+    parts = [mesh_key]
+    for data in (camera, view):
+        parts.append(tuple((k, _rounded(v)) for k, v in sorted(data.items())) if data else None)
+    return tuple(parts)
+
+
+def reuse_frame(src, dst):
+    """Hard-link (or copy, where links are not supported) an already written frame; returns success"""
+    try:
+        if os.path.exists(dst):
+            os.remove(dst)
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+        return True
+    except OSError as e:
+        print(f"Frame reuse failed: {e}")
+        return False
+
+
+def movie_filepath(scene, prefix, ext):
+    """Movie file for the scene output path: <dir>/<prefix><ext> when the path names a directory"""
+    base = bpy.path.abspath(scene.render.filepath)
+    if not base or base.endswith(("/", "\\")) or os.path.isdir(base):
+        base = os.path.join(base or bpy.path.abspath("//"), prefix)
+    if scene.render.use_file_extension and not base.lower().endswith(ext):
+        base += ext
+    return base
+
+
+def start_video_stream(context, source=None):
+    """
+    Start encoding the scene's movie output through ffmpeg, as raw pixels
+    from source (a ViewportCapture) when given. Returns the VideoStream, or
+    None when ffmpeg is not available.
+    """
+    ffmpeg = encoder.ffmpeg_path()
+    if not ffmpeg:
+        return None
+    scene = context.scene
+    settings = state.get_settings(context)
+    ext, codec, args = encoder.output_settings(scene)
+    filepath = movie_filepath(scene, settings.render_prefix, ext)
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    try:
+        return encoder.VideoStream(
+            ffmpeg, filepath, scene.render.fps / scene.render.fps_base, codec, args,
+            size=(source.width, source.height) if source else None,
+        )
+    except OSError as e:
+        print(f"Video stream failed: {e}")
+        return None
 
-    target_format = "PNG" if state._is_video_export else prev_format
-    movie_formats = {"FFMPEG", "AVI_JPEG", "AVI_RAW"}
-    if target_format in movie_formats:
-        target_format = "PNG"
 
-    ext = _ext_from_format(target_format)
-    filepath = os.path.join(
-        out_dir, f"{settings.render_prefix}_{state._render_frame_idx:04d}{ext}"
+def settings_hash(scene, settings, file_format):
+    """Hex digest of the settings that change how exported frames look"""
+    r = scene.render
+    data = (
+        settings.export_render_mode,
+        settings.render_prefix,
+        file_format,
+        r.image_settings.color_mode,
+        r.image_settings.color_depth,
+        r.resolution_x,
+        r.resolution_y,
+        r.resolution_percentage,
+        r.engine,
+        r.film_transparent,
+        scene.camera.name if scene.camera else None,
     )
+    return hashlib.blake2b(repr(data).encode(), digest_size=16).hexdigest()
+
 
+def frame_complete(path):
+    """True when path holds a fully written frame; PNG and JPEG trailers are checked"""
     try:
-        if state._is_video_export:
-            
-            if settings.export_render_mode == "FINAL":
-                bpy.ops.render.render(write_still=False)
-            else:
-                bpy.ops.render.opengl(write_still=False, view_context=True)
-            img = bpy.data.images.get("Render Result")
-            if img:
-                img.save_render(filepath, scene=scene)
+        size = os.path.getsize(path)
+    except OSError:
+        return False
+    trailer = FRAME_TRAILERS.get(os.path.splitext(path)[1].lower(), b"")
+    if size < max(1, len(trailer)):
+        return False
+    if not trailer:
+        return True
+    with open(path, "rb") as f:
+        f.seek(size - len(trailer))
+        return f.read() == trailer
+
+
+class ExportSession:
+    """
+    One timer-driven frame export, set up by play_forward(export_frames=True).
+
+    Output directory, file format, extension, video stream and frame
+    writer are resolved once, and the render settings are applied once
+    and restored by close(), so each frame only renders and writes.
+    Movie formats are streamed to ffmpeg, or rendered as PNG frames into
+    _temp_frames for finalize_video_export when ffmpeg is missing.
+
+    Viewport exports read frames back through a ViewportCapture: pixels
+    are piped to ffmpeg raw, and 8-bit RGB(A) PNG frames are encoded and
+    written by a FrameWriter pool. Final renders, and viewport frames that
+    cannot be read back, are saved by the render operator on the main
+    thread; the stream then goes through a scratch PNG.
+
+    Image sequences keep a manifest next to the frames (timeline key,
+    settings hash, frames done). With resume, an export whose manifest
+    matches starts at the first frame that is missing or incomplete on
+    disk; start_frame tells the caller where playback has to begin. The
+    manifest is only marked complete when every one of the frame_count
+    frames was written.
+    """
+
+    def __init__(self, context, timeline_key=None, frame_count=0, resume=False):
+        scene = context.scene
+        settings = state.get_settings(context)
+        image_settings = scene.render.image_settings
+        self.scene = scene
+        self.final = settings.export_render_mode == "FINAL"
+        self.prefix = settings.render_prefix
+        self.frames = 0
+        self.written = 0
+        self.reused = 0
+        self.render_time = 0.0
+        self.total_time = 0.0
+        self.errors = []
+        self._last = None
+        self._saved = (
+            scene.render.filepath,
+            image_settings.file_format,
+            image_settings.color_mode,
+            image_settings.compression,
+        )
+
+        self.stream = None
+        self.writer = None
+        self.capture = None if self.final else capture.viewport_capture(context)
+        fmt = image_settings.file_format
+        if fmt in MOVIE_FORMATS:
+            self.stream = start_video_stream(context, self.capture)
+            if self.stream is None:
+                # 没有 ffmpeg 时退回临时帧目录 + VSE 合成
+                print("ffmpeg not found, exporting video through temporary frames")
+                state._is_video_export = True
+                state._temp_frame_dir = os.path.join(output_dir(scene), "_temp_frames")
+            fmt = "PNG"
+        self.out_dir = state._temp_frame_dir or output_dir(scene)
+        self.ext = frame_extension(fmt)
+        os.makedirs(self.out_dir, exist_ok=True)
+        if (
+            self.capture is not None
+            and fmt == "PNG"
+            and image_settings.color_depth == "8"
+            and image_settings.color_mode in {"RGB", "RGBA"}
+            and not state._is_video_export
+            and self.stream is None
+        ):
+            self.writer = frame_writer.FrameWriter()
+        self._level = frame_writer.png_level(image_settings.compression)
+        self._channels = 4 if image_settings.color_mode == "RGBA" else 3
+        if self.capture is not None and self.writer is None and self.stream is None:
+            # 其他格式照旧由视口渲染写出
+            self.capture.free()
+            self.capture = None
+
+        self.frame_count = frame_count
+        self.start_frame = 0
+        self.manifest = None
+        if self.stream is None and not state._is_video_export and timeline_key:
+            self.manifest = {
+                "version": MANIFEST_VERSION,
+                "timeline": timeline_key,
+                "settings": settings_hash(scene, settings, fmt),
+                "frame_count": frame_count,
+                "frames_done": 0,
+                "complete": False,
+            }
+            if resume:
+                self.start_frame = self._resume_point()
+            self.frames = self.start_frame
+            self._checkpoint(self.start_frame)
+
+        image_settings.file_format = fmt
+        if self.stream is not None and self.stream.scratch_path is not None:
+            # 中转帧不压缩，压缩交给编码器
+            image_settings.color_mode = "RGB"
+            image_settings.compression = 0
+
+    def render_frame(self, fingerprint=None):
+        """
+        Render the next frame. A frame whose fingerprint (see
+        frame_fingerprint) equals the previous one is not rendered; the
+        previous image is reused under the new name instead.
+        """
+        start = time.perf_counter()
+        filepath = self.frame_path(self.frames)
+        if fingerprint is not None and self._last and self._last[0] == fingerprint and self._reuse(filepath):
+            self.reused += 1
+            self.written += 1
         else:
-            
+            written = False
+            try:
+                written = self._render(filepath)
+            except Exception as exc:
+                self.errors.append(f"{os.path.basename(filepath)}: {exc}")
+            self._last = (fingerprint, filepath) if fingerprint is not None and written else None
+            if written:
+                self.written += 1
+
+        self.frames += 1
+        state._render_frame_idx = self.frames
+        state._total_export_frames = self.frames
+        if self.manifest is not None and self.frames % CHECKPOINT_INTERVAL == 0:
+            # 仍在写入队列中或写入失败的帧不算完成
+            pending = self.writer.in_flight() + self.writer.failed if self.writer else 0
+            self._checkpoint(self.start_frame + self.written - pending)
+        self.total_time += time.perf_counter() - start
+
+    def frame_path(self, index):
+        return os.path.join(self.out_dir, f"{self.prefix}_{index:04d}{self.ext}")
+
+    def manifest_path(self):
+        return os.path.join(self.out_dir, f"{self.prefix}_manifest.json")
+
+    def _resume_point(self):
+        try:
+            with open(self.manifest_path(), "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            print("No export manifest found, exporting from the first frame")
+            return 0
+        keys = ("version", "timeline", "settings", "frame_count")
+        if any(saved.get(k) != self.manifest[k] for k in keys):
+            print("Export manifest does not match the recording or render settings, exporting from the first frame")
+            return 0
+        done = 0
+        while done < self.frame_count and frame_complete(self.frame_path(done)):
+            done += 1
+        print(f"Resuming export at frame {done} of {self.frame_count}")
+        return done
+
+    def _checkpoint(self, frames_done):
+        self.manifest["frames_done"] = max(0, frames_done)
+        path = self.manifest_path()
+        try:
+            with open(path + ".part", "w", encoding="utf-8") as f:
+                json.dump(self.manifest, f, indent=1)
+            os.replace(path + ".part", path)
+        except OSError as e:
+            print(f"Export manifest write failed: {e}")
+
+    def _reuse(self, filepath):
+        if self.stream is not None:
+            return self.stream.repeat()
+        if self.writer is not None:
+            # 上一帧可能仍在写入队列中，排在它之后再链接
+            self.writer.after(self._last[1], filepath, reuse_frame)
+            return True
+        return reuse_frame(self._last[1], filepath)
+
+    def _render(self, filepath):
+        scene = self.scene
+        start = time.perf_counter()
+        if self.writer is not None or (self.stream is not None and self.stream.scratch_path is None):
+            pixels = self.capture.grab()
+            self.render_time += time.perf_counter() - start
+            if self.writer is None:
+                return self.stream.push_pixels(pixels)
+            self.writer.submit(pixels[:, :, :self._channels], filepath, self._level)
+            return True
+
+        to_file = self.stream is None and not state._is_video_export
+        if to_file:
             scene.render.filepath = filepath
-            if target_format not in {"FFMPEG", "AVI_JPEG", "AVI_RAW"}:
-                scene.render.image_settings.file_format = target_format
-            if settings.export_render_mode == "FINAL":
-                bpy.ops.render.render(write_still=True, use_viewport=False)
+        if self.final:
+            bpy.ops.render.render(write_still=to_file, use_viewport=False)
+        else:
+            bpy.ops.render.opengl(write_still=to_file, view_context=True)
+        self.render_time += time.perf_counter() - start
+
+        if to_file:
+            return os.path.exists(filepath)
+
+        img = bpy.data.images.get("Render Result")
+        if not img:
+            return False
+        if self.stream is not None:
+            img.save_render(self.stream.scratch_path, scene=scene)
+            return self.stream.push_scratch()
+        img.save_render(filepath, scene=scene)
+        return os.path.exists(filepath)
+
+    def close(self):
+        """
+        Finish the stream or writer, restore the render settings and return
+        a report: frames written out of the total, and the errors of the
+        frames that failed.
+        """
+        if self.stream is not None:
+            if self.stream.close():
+                print(f"Video export: {self.stream.frames} frames -> {self.stream.filepath}")
             else:
-                bpy.ops.render.opengl(write_still=True, view_context=True)
-    except Exception as exc:
-        print(f"Frame export failed: {exc}")
-    finally:
-        scene.render.filepath = prev_path
-        scene.render.image_settings.file_format = prev_format
-        scene.render.image_settings.color_mode = prev_color_mode
+                self.errors.append(f"{os.path.basename(self.stream.filepath)}: ffmpeg encode failed")
+        if self.capture is not None:
+            self.capture.free()
+        failed = 0
+        if self.writer is not None:
+            stats = self.writer.close()
+            failed = stats["failed"]
+            self.errors += stats["errors"]
+            if stats["frames"]:
+                print(
+                    f"Frame writer: {stats['frames']} frames, encode {stats['encode'] * 1000:.1f} ms, "
+                    f"write {stats['write'] * 1000:.1f} ms per frame, render thread waited {stats['wait']:.2f}s"
+                    + (f", {stats['failed']} failed" if stats["failed"] else "")
+                )
+        written = self.start_frame + self.written - failed
+        if self.manifest is not None:
+            # 只有全部帧都写成功才算完成，失败或中途停止的导出留给续传
+            self.manifest["complete"] = written == self.frame_count
+            self._checkpoint(written)
+        image_settings = self.scene.render.image_settings
+        (
+            self.scene.render.filepath,
+            image_settings.file_format,
+            image_settings.color_mode,
+            image_settings.compression,
+        ) = self._saved
+
+        if self.frames:
+            produced = self.frames - self.start_frame
+            rendered = produced - self.reused
+            overhead = max(0.0, self.total_time - self.render_time)
+            print(
+                f"Export: {produced} frames ({rendered} rendered, {self.reused} reused"
+                + (f", resumed at {self.start_frame}" if self.start_frame else "")
+                + f"), render {self.render_time / max(1, rendered) * 1000:.1f} ms, "
+                f"other {overhead / max(1, produced) * 1000:.2f} ms per frame; "
+                f"render settings applied once instead of {produced} times"
+            )
+        return {
+            "written": written,
+            "total": max(self.frame_count, self.frames),
+            "errors": self.errors,
+        }
+
+
+def maybe_render_viewport_frame(context, fingerprint=None):
+    """Render the current frame when exporting (see ExportSession.render_frame)"""
+    if not state.is_exporting_frames or state._export_session is None:
+        return
+    state._export_session.render_frame(fingerprint)
 
-    state._render_frame_idx += 1
-    state._total_export_frames = state._render_frame_idx
 
 def backup_vse(scene):
     if not scene.sequence_editor:
@@ -89,7 +424,6 @@ def restore_vse(scene, backup):
             scene.sequence_editor.strips.remove(strip)
 
 def finalize_video_export(context):
-    import shutil
     if not state._temp_frame_dir or not os.path.isdir(state._temp_frame_dir):
         return
 
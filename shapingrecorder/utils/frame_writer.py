@@ -0,0 +1,150 @@
+# Asynchronous PNG frame writer for frame export
+#
+# The main thread hands each frame over as a pixel buffer; worker threads
+# encode it as PNG at the requested level and write the file, so capturing
+# the next frame waits neither for compression nor for the disk.
+
+import os
+import struct
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+MAX_PENDING = 2 * WORKERS
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _chunk(ctype, body):
+    return struct.pack(">I", len(body)) + ctype + body + struct.pack(">I", zlib.crc32(ctype + body))
+
+
+def encode_png(pixels, level):
+    """
+    PNG file data of a (height, width, channels) uint8 array, top row
+    first, with 3 (RGB) or 4 (RGBA) channels. Rows use the Up filter and
+    are deflated at zlib level.
+    """
+    height, width, channels = pixels.shape
+    if channels not in (3, 4):
+        raise ValueError(f"cannot encode {channels} channels as PNG")
+    rows = np.ascontiguousarray(pixels, dtype=np.uint8).reshape(height, width * channels)
+    filtered = np.empty((height, width * channels + 1), dtype=np.uint8)
+    filtered[:, 0] = 2
+    filtered[0, 1:] = rows[0]
+    np.subtract(rows[1:], rows[:-1], out=filtered[1:, 1:])
+    header = struct.pack(">IIBBBBB", width, height, 8, 6 if channels == 4 else 2, 0, 0, 0)
+    return (
+        PNG_SIGNATURE
+        + _chunk(b"IHDR", header)
+        + _chunk(b"IDAT", zlib.compress(filtered.tobytes(), level))
+        + _chunk(b"IEND", b"")
+    )
+
+
+def png_level(compression):
+    """zlib level Blender uses for a PNG compression percentage"""
+    return min(9, max(0, int(compression / 11.1111)))
+
+
+class FrameWriter:
+    """
+    Bounded pool that encodes and writes PNG frames in the background.
+
+    submit() blocks while max_pending frames are still in flight, so a
+    slow disk throttles capturing instead of piling up pixel buffers.
+    Per-frame encode and write times are kept in `timings`; frames that
+    could not be written are counted in `failed` and described in
+    `errors`.
+    """
+
+    def __init__(self, workers=WORKERS, max_pending=MAX_PENDING):
+        self.timings = []
+        self.failed = 0
+        self.errors = []
+        self.wait = 0.0
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ShapingRecorderWriter")
+
+    def submit(self, pixels, filepath, level):
+        """Queue pixels (see encode_png) to be encoded at level and written to filepath; pixels must not change afterwards"""
+        self._queue(filepath, self._finish, pixels, filepath, level)
+
+    def after(self, source, filepath, func):
+        """
+        Queue func(source, filepath), which writes filepath from the frame
+        at source, to run once the pending write of source (if any) is
+        done. A falsy result or an exception counts as a failed frame.
+        """
+        self._queue(filepath, self._reuse, self._futures.get(source), func, source, filepath)
+
+    def _queue(self, filepath, task, *args):
+        start = time.perf_counter()
+        self._slots.acquire()
+        self.wait += time.perf_counter() - start
+        future = self._executor.submit(task, *args)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures[filepath] = future
+
+    def in_flight(self):
+        """Number of frames still queued or being written"""
+        for path in [p for p, f in self._futures.items() if f.done()]:
+            del self._futures[path]
+        return len(self._futures)
+
+    def _fail(self, filepath, message):
+        with self._lock:
+            self.failed += 1
+            self.errors.append(f"{os.path.basename(filepath)}: {message}")
+
+    def _finish(self, pixels, filepath, level):
+        try:
+            start = time.perf_counter()
+            data = encode_png(pixels, level)
+            encoded = time.perf_counter()
+            # 先写临时文件再改名，中断时不会留下半张图
+            partial = filepath + ".part"
+            with open(partial, "wb") as f:
+                f.write(data)
+            os.replace(partial, filepath)
+            written = time.perf_counter()
+            with self._lock:
+                self.timings.append((encoded - start, written - encoded))
+        except Exception as e:
+            self._fail(filepath, e)
+
+    def _reuse(self, pending, func, source, filepath):
+        # 线程池按提交顺序取任务，所等的写入任务必然已在执行或已完成
+        if pending is not None:
+            pending.result()
+        try:
+            if not func(source, filepath):
+                self._fail(filepath, f"could not reuse {os.path.basename(source)}")
+        except Exception as e:
+            self._fail(filepath, e)
+
+    def close(self):
+        """Wait for every queued frame and return stats"""
+        self._executor.shutdown(wait=True)
+        self._futures.clear()
+        return self.stats()
+
+    def stats(self):
+        with self._lock:
+            frames = len(self.timings)
+            encode = sum(t[0] for t in self.timings)
+            write = sum(t[1] for t in self.timings)
+        return {
+            "frames": frames,
+            "failed": self.failed,
+            "errors": list(self.errors),
+            "encode": encode / frames if frames else 0.0,
+            "write": write / frames if frames else 0.0,
+            "wait": self.wait,
+        }
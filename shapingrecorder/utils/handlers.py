@@ -2,17 +2,61 @@ import bpy
 
 from ..data import persistence
 from ..data import state
+from . import precompute
 
 
 @bpy.app.handlers.persistent
 def load_post_handler(dummy):
+    precompute.shutdown()
     if bpy.context.scene:
         persistence.load_from_scene(bpy.context)
+        for obj_name in state.object_records:
+            precompute.submit_missing(obj_name)
+
+
+@bpy.app.handlers.persistent
+def save_pre_handler(dummy):
+    precompute.flush()
+
+
+def _check_playback_mesh(depsgraph):
+    """Drop the cached playback topology once its mesh changed outside playback"""
+    owned = state._playback_mesh
+    if not owned:
+        return
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Mesh) and update.id.original.name == owned["name"]:
+            if owned.get("own_update"):
+                owned["own_update"] = False
+            else:
+                state._playback_mesh = None
+            return
+
+
+@bpy.app.handlers.persistent
+def undo_post_handler(*args):
+    # 撤销会从存档恢复网格数据块，回放网格的拓扑缓存随之失效
+    state._playback_mesh = None
+    # 撤销/重做会回退场景中的存档，录制数据却不回退：整份重写
+    scene = bpy.context.scene
+    if scene and not state.is_recording and not persistence.in_sync(scene):
+        if state.object_records or persistence.BLOB_KEY in scene:
+            persistence.save_to_scene(bpy.context, compact=True)
 
 
 @bpy.app.handlers.persistent
 def depsgraph_update_handler(scene, depsgraph):
-    if state.is_recording or state.is_playing:
+    if state.is_recording:
+        # 录制定时器只在目标网格被改动后才读取坐标
+        obj = bpy.data.objects.get(state.target_obj_name) if state.target_obj_name else None
+        if obj and not state._recording_dirty:
+            for update in depsgraph.updates:
+                if update.id.original in (obj, obj.data):
+                    state._recording_dirty = True
+                    break
+        return
+    _check_playback_mesh(depsgraph)
+    if state.is_playing:
         return
 
     deleted = [name for name in state.object_records if name not in bpy.data.objects]
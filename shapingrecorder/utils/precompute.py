@@ -0,0 +1,145 @@
+# Background precompute of step interpolation caches
+#
+# Workers only ever see plain NumPy copies of the states; finished caches
+# are handed back to the recording on the main thread by a timer.
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import bpy
+
+from ..core.mesh_ops import compute_step_cache, is_direct_step
+from ..core.mesh_state import MeshState
+from ..core.step_cache import StepCacheStore
+from ..data import persistence
+from ..data import state
+
+MAX_WORKERS = 2
+POLL_INTERVAL = 0.25
+
+
+def _detached_copy(s):
+    return MeshState(
+        s.coords.copy(), s.edges.copy(), s.face_offsets.copy(), s.face_indices.copy(), hash=s.hash
+    )
+
+
+def _executor():
+    if state._precompute_executor is None:
+        state._precompute_executor = ThreadPoolExecutor(
+            max_workers=MAX_WORKERS, thread_name_prefix="ShapingRecorderPrecompute"
+        )
+    return state._precompute_executor
+
+
+def submit(obj_name, source_state, target_state):
+    """Queue the cache of one step pair unless it is stored or already queued"""
+    rec = state.object_records.get(obj_name)
+    key = StepCacheStore.key(source_state, target_state)
+    if not rec or key is None:
+        return
+    store = rec["correspondence"]
+    if store.lookup(source_state, target_state) is not None:
+        return
+    if is_direct_step(source_state, target_state):
+        # 拓扑未变时缓存只有计数和位移统计，直接在主线程生成
+        store.get(source_state, target_state)
+        return
+    if (obj_name, key) in state._precompute_jobs.values():
+        return
+    _queue(obj_name, key, compute_step_cache, _detached_copy(source_state), _detached_copy(target_state))
+
+
+def submit_missing(obj_name):
+    """
+    Queue every step of a recording that has no cache yet. Only the step
+    hashes are read here; the states are rebuilt on the workers, so this
+    does not decode any geometry when a file is opened.
+    """
+    rec = state.object_records.get(obj_name)
+    if not rec:
+        return
+    history = rec["history"]
+    initial_mesh = rec["initial_mesh"]
+    store = rec["correspondence"]
+    keys = store.pair_keys(initial_mesh, history)
+    queued = set(state._precompute_jobs.values())
+    for i in store.missing_steps(initial_mesh, history):
+        if keys[i] is None or (obj_name, keys[i]) in queued:
+            continue
+        source = partial(_detached_copy, initial_mesh) if i == 0 else history.state_loader(i - 1)
+        _queue(obj_name, keys[i], _compute_loaded, source, history.state_loader(i))
+
+
+def _compute_loaded(load_source, load_target):
+    return compute_step_cache(load_source(), load_target())
+
+
+def _queue(obj_name, key, func, *args):
+    future = _executor().submit(func, *args)
+    state._precompute_jobs[future] = (obj_name, key)
+    state._precompute_total += 1
+    if not bpy.app.timers.is_registered(_collect):
+        bpy.app.timers.register(_collect, first_interval=POLL_INTERVAL)
+
+
+def progress():
+    """Return (finished, total) of the current batch, or None when idle"""
+    if not state._precompute_jobs:
+        return None
+    return state._precompute_done, state._precompute_total
+
+
+def _collect():
+    for future in [f for f in state._precompute_jobs if f.done()]:
+        obj_name, key = state._precompute_jobs.pop(future)
+        state._precompute_done += 1
+        try:
+            cache = future.result()
+        except Exception as e:
+            print(f"Step cache precompute failed: {e}")
+            continue
+        rec = state.object_records.get(obj_name)
+        if rec:
+            rec["correspondence"].store(key, cache)
+
+    _redraw_panels()
+    if state._precompute_jobs:
+        return POLL_INTERVAL
+    state._precompute_done = 0
+    state._precompute_total = 0
+    if not state.is_recording and bpy.context.scene:
+        # 录制中的结果随 stop_recording 一并保存；未修改的文件（如刚打开）
+        # 不因缓存变为已修改，留到保存文件时由 flush 写入
+        if bpy.data.is_dirty:
+            persistence.save_to_scene(bpy.context)
+        else:
+            state._precompute_unsaved = True
+    return None
+
+
+def flush():
+    """Persist caches finished while the file was unmodified; for the save_pre handler"""
+    if state._precompute_unsaved and bpy.context.scene:
+        persistence.save_to_scene(bpy.context)
+
+
+def _redraw_panels():
+    screen = bpy.context.screen
+    if not screen:
+        return
+    for area in screen.areas:
+        if area.type == "VIEW_3D":
+            area.tag_redraw()
+
+
+def shutdown():
+    if bpy.app.timers.is_registered(_collect):
+        bpy.app.timers.unregister(_collect)
+    if state._precompute_executor is not None:
+        state._precompute_executor.shutdown(wait=False, cancel_futures=True)
+        state._precompute_executor = None
+    state._precompute_jobs.clear()
+    state._precompute_done = 0
+    state._precompute_total = 0
+    state._precompute_unsaved = False
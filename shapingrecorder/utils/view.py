@@ -1,3 +1,5 @@
+import math
+
 import bpy
 from ..data import state
 
@@ -87,6 +89,29 @@ def camera_state_changed(state1, state2, loc_eps=1e-5, ang_eps=1e-4):
         return True
     return False
 
+def view_change_amount(state1, state2):
+    """Rough on-screen size of a viewport move: rotation angle plus pan and zoom relative to the view distance"""
+    if not state1 or not state2:
+        return 0.0 if state1 is state2 else 1.0
+    try:
+        d1 = max(float(state1.get("view_distance", 1.0)), 1e-3)
+        d2 = max(float(state2.get("view_distance", 1.0)), 1e-3)
+        pan = (state1["view_location"] - state2["view_location"]).length / max(d1, d2)
+        angle = state1["view_rotation"].rotation_difference(state2["view_rotation"]).angle
+        return angle + pan + abs(math.log(d2 / d1))
+    except Exception:
+        return 1.0
+
+def camera_change_amount(state1, state2, scale):
+    """Rotation angle plus camera travel relative to scale (the model size)"""
+    if not state1 or not state2:
+        return 0.0 if state1 is state2 else 1.0
+    try:
+        travel = (state1["location"] - state2["location"]).length / max(scale, 1e-6)
+        return state1["rotation"].rotation_difference(state2["rotation"]).angle + travel
+    except Exception:
+        return 1.0
+
 def apply_view_state(context, state_data):
     if not state_data:
         return
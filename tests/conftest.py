@@ -0,0 +1,49 @@
+# pytest setup for the Blender-independent core modules
+#
+# The add-on package __init__ needs bpy, so the package is registered by
+# path only and its core modules are imported directly. Outside Blender,
+# mathutils.kdtree is replaced by a brute-force KDTree with the same API.
+
+import os
+import sys
+import types
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class _BruteForceKDTree:
+    def __init__(self, size):
+        self._points = []
+
+    def insert(self, co, index):
+        self._points.append((np.asarray(co, dtype=np.float64), index))
+
+    def balance(self):
+        pass
+
+    def find(self, co):
+        co = np.asarray(co, dtype=np.float64)
+        point, index = min(self._points, key=lambda p: float(np.linalg.norm(p[0] - co)))
+        return point, index, float(np.linalg.norm(point - co))
+
+
+def _install_stubs():
+    try:
+        import mathutils  # noqa: F401
+    except ImportError:
+        kdtree = types.ModuleType("mathutils.kdtree")
+        kdtree.KDTree = _BruteForceKDTree
+        mathutils = types.ModuleType("mathutils")
+        mathutils.kdtree = kdtree
+        sys.modules["mathutils"] = mathutils
+        sys.modules["mathutils.kdtree"] = kdtree
+
+    if "shapingrecorder" not in sys.modules:
+        package = types.ModuleType("shapingrecorder")
+        package.__path__ = [os.path.join(ROOT, "shapingrecorder")]
+        sys.modules["shapingrecorder"] = package
+
+
+_install_stubs()
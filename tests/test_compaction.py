@@ -0,0 +1,67 @@
+import numpy as np
+
+from shapingrecorder.core.compaction import plan_compaction, plan_compaction_limited, remap_step_timing
+from shapingrecorder.core.mesh_state import MeshState
+from shapingrecorder.core.snapshots import StepHistory
+
+QUAD = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0]]
+EDGES = [[0, 1], [1, 2], [2, 3], [3, 0]]
+FACES = [[0, 1, 2, 3]]
+
+
+def _history(offsets, split_at=()):
+    """Quad whose first vertex rises by each offset in turn; steps in split_at add a diagonal edge"""
+    initial = MeshState.from_lists(QUAD, EDGES, FACES)
+    history = StepHistory()
+    verts = [list(v) for v in QUAD]
+    edges = list(EDGES)
+    for i, dz in enumerate(offsets):
+        verts[0][2] += dz
+        if i in split_at:
+            edges = edges + [[0, 2]]
+        history.append(MeshState.from_lists(verts, edges, FACES))
+    return initial, history
+
+
+def test_small_moves_merge_into_last_step():
+    initial, history = _history([0.01] * 5)
+    assert plan_compaction(initial, history, 0.1) == [4]
+
+
+def test_group_closes_when_threshold_is_exceeded():
+    initial, history = _history([0.04] * 6)
+    # 第 3 步会让组内位移超过 0.1：前一组在第 2 步收尾，该步另起一组
+    assert plan_compaction(initial, history, 0.1) == [1, 3, 5]
+
+
+def test_keep_steps_close_their_group():
+    initial, history = _history([0.01] * 6)
+    assert plan_compaction(initial, history, 0.1, keep={1, 3}) == [1, 3, 5]
+
+
+def test_topology_change_is_always_kept():
+    initial, history = _history([0.01] * 6, split_at={3})
+    assert plan_compaction(initial, history, 0.1) == [2, 3, 5]
+
+
+def test_compacted_history_ends_on_the_recorded_state():
+    initial, history = _history([0.03, 0.05, 0.02, 0.07, 0.01])
+    kept = plan_compaction(initial, history, 0.06)
+    compacted = history.select(kept)
+    assert len(compacted) == len(kept)
+    np.testing.assert_array_equal(compacted[-1].coords, history[-1].coords)
+
+
+def test_step_ceiling_raises_the_threshold():
+    initial, history = _history([0.05] * 20)
+    kept, threshold = plan_compaction_limited(initial, history, 0.0, max_steps=4)
+    assert len(kept) <= 4
+    assert kept[-1] == 19
+    assert threshold > 0.0
+
+
+def test_remap_step_timing_follows_kept_steps():
+    timing = [{"cam": 0.0}] + [{"cam": float(i)} for i in range(5)]
+    assert remap_step_timing(timing, [1, 4]) == [{"cam": 0.0}, {"cam": 1.0}, {"cam": 4.0}]
+    # 设置列表比历史短时，缺失的步骤取默认值
+    assert remap_step_timing(timing[:3], [0, 4]) == [{"cam": 0.0}, {"cam": 0.0}, {}]
@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+
+from shapingrecorder.core import correspondence
+from shapingrecorder.core.mesh_state import MeshState
+
+SNAP_THRESHOLD = 0.02
+SURFACE_EPSILON = 1e-4
+
+
+def _grid(n):
+    """n x n vertex quad grid on the unit square at z = 0"""
+    xs, ys = np.meshgrid(np.linspace(0.0, 1.0, n), np.linspace(0.0, 1.0, n))
+    verts = np.stack([xs.ravel(), ys.ravel(), np.zeros(n * n)], axis=1)
+    faces, edges = [], []
+    for i in range(n - 1):
+        for j in range(n - 1):
+            v = i * n + j
+            faces.append([v, v + 1, v + n + 1, v + n])
+            edges += [[v, v + 1], [v, v + n]]
+    return MeshState.from_lists(verts.tolist(), edges, faces)
+
+
+def _queries(rng, source, count):
+    """Target vertices next to source vertices, on the surface, above it and far away"""
+    coords = source.coords.astype(np.float64)
+    near = coords[rng.integers(0, len(coords), count // 4)] + rng.normal(scale=0.002, size=(count // 4, 3))
+    on_surface = rng.random((count // 4, 3))
+    on_surface[:, 2] = 0.0
+    above = rng.random((count // 4, 3))
+    above[:, 2] = rng.uniform(0.01, 0.5, count // 4)
+    far = rng.random((count - 3 * (count // 4), 3)) + np.array([0.0, 0.0, 3.0])
+    return np.concatenate([near, on_surface, above, far]).astype(np.float32)
+
+
+def _brute_force_sources(source, queries):
+    """Reference for hybrid_sources: every query against every vertex and triangle"""
+    points = source.coords.astype(np.float64)
+    q = queries.astype(np.float64)
+    dist = np.linalg.norm(q[:, None, :] - points[None, :, :], axis=2)
+    nearest = dist.argmin(axis=1)
+    sources = points[nearest].copy()
+
+    tris = correspondence.triangulate(source.face_offsets, source.face_indices)
+    a, b, c = points[tris[:, 0]], points[tris[:, 1]], points[tris[:, 2]]
+    for k in np.flatnonzero(dist[np.arange(len(q)), nearest] >= SNAP_THRESHOLD):
+        p = np.repeat(q[k][None], len(tris), axis=0)
+        closest = correspondence.closest_points_on_triangles(p, a, b, c)
+        d = np.linalg.norm(closest - p, axis=1)
+        best = d.argmin()
+        if d[best] < SURFACE_EPSILON:
+            sources[k] = closest[best]
+    return sources
+
+
+def test_closest_points_on_triangles_beats_sampling():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        a, b, c, p = rng.normal(size=(4, 3))
+        closest = correspondence.closest_points_on_triangles(p[None], a[None], b[None], c[None])[0]
+        uv = rng.random((5000, 2))
+        flip = uv.sum(axis=1) > 1.0
+        uv[flip] = 1.0 - uv[flip]
+        samples = a + uv[:, :1] * (b - a) + uv[:, 1:] * (c - a)
+        assert np.linalg.norm(closest - p) <= np.linalg.norm(samples - p, axis=1).min() + 1e-9
+
+
+@pytest.mark.parametrize("seed", [2, 3])
+def test_hybrid_sources_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    source = _grid(15)
+    queries = _queries(rng, source, 600)
+    target = MeshState.from_lists(queries.tolist(), [[0, 1]], [[0, 1, 2]])
+    sources = correspondence.hybrid_sources(source, target, SNAP_THRESHOLD, SURFACE_EPSILON)
+    assert sources.shape == queries.shape
+    np.testing.assert_allclose(sources, _brute_force_sources(source, queries), atol=1e-6)
+
+
+def test_hybrid_sources_without_faces_snaps_to_vertices():
+    rng = np.random.default_rng(4)
+    points = rng.random((50, 3))
+    source = MeshState.from_lists(points.tolist(), [], [])
+    # 一半查询点远离源网格，走远距离回退
+    queries = np.concatenate([rng.random((20, 3)), rng.random((20, 3)) * 4.0 + 2.0]).astype(np.float32)
+    target = MeshState.from_lists(queries.tolist(), [], [])
+    sources = correspondence.hybrid_sources(source, target, SNAP_THRESHOLD, SURFACE_EPSILON)
+    nearest = np.linalg.norm(queries[:, None, :] - points[None, :, :], axis=2).argmin(axis=1)
+    np.testing.assert_allclose(sources, points[nearest], atol=1e-6)
+
+
+def _legacy_sources(source, queries):
+    """The per-vertex KDTree/BVHTree loop hybrid_sources replaced"""
+    from mathutils import kdtree
+    from mathutils.bvhtree import BVHTree
+
+    verts = source.coords.tolist()
+    tris = correspondence.triangulate(source.face_offsets, source.face_indices).tolist()
+    bvh = BVHTree.FromPolygons(verts, tris) if tris else None
+    kd = kdtree.KDTree(len(verts))
+    for i, v in enumerate(verts):
+        kd.insert(v, i)
+    kd.balance()
+
+    sources = []
+    for v in queries.tolist():
+        loc_surf, dist_surf = None, 99999.0
+        if bvh:
+            loc_surf, _, _, dist_surf = bvh.find_nearest(v)
+        loc_vert, _, dist_vert = kd.find(v)
+        if dist_vert < SNAP_THRESHOLD:
+            sources.append(loc_vert)
+        elif loc_surf is not None and dist_surf < SURFACE_EPSILON:
+            sources.append(loc_surf)
+        else:
+            sources.append(loc_vert)
+    return np.array(sources, dtype=np.float32).reshape(-1, 3)
+
+
+def test_hybrid_sources_matches_legacy_trees():
+    pytest.importorskip("mathutils.bvhtree")
+    rng = np.random.default_rng(5)
+    source = _grid(12)
+    queries = _queries(rng, source, 400)
+    target = MeshState.from_lists(queries.tolist(), [[0, 1]], [[0, 1, 2]])
+    sources = correspondence.hybrid_sources(source, target, SNAP_THRESHOLD, SURFACE_EPSILON)
+    np.testing.assert_allclose(sources, _legacy_sources(source, queries), atol=1e-5)